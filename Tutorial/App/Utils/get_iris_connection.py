@@ -1,7 +1,20 @@
 import iris
+import queue
+import threading
+import time
+from contextlib import contextmanager
 
-def get_cursor():
-    ## Credentials: 
+## Pool settings: at most POOL_SIZE connections are open at once, and a connection
+## that has sat idle longer than POOL_RECYCLE seconds is re-opened before reuse
+POOL_SIZE = 8
+POOL_RECYCLE = 1800
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_connection():
+    ## Credentials:
     server_location = "localhost"
     port_number = 32782
     namespace = "DEMO"
@@ -9,9 +22,66 @@ def get_cursor():
     password = "ISCDEMO"
 
     ## Create a connection
-    conn = iris.connect(server_location, port_number, namespace, user_name, password)
+    return iris.connect(server_location, port_number, namespace, user_name, password)
 
+
+def get_cursor():
     ## Create a cursor object
-    cursor = conn.cursor()
+    cursor = get_connection().cursor()
     return cursor
-    
\ No newline at end of file
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = queue.Queue(maxsize=POOL_SIZE)
+            for _ in range(POOL_SIZE):
+                _pool.put((get_connection(), time.monotonic()))
+    return _pool
+
+
+def _is_driver_error(exc):
+    """True if exc came from the IRIS driver or its socket rather than from the caller's own code."""
+    return isinstance(exc, OSError) or type(exc).__module__.partition(".")[0] in ("iris", "intersystems_iris")
+
+
+def _close_quietly(conn):
+    if conn is None:
+        return
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
+@contextmanager
+def acquire_cursor(timeout=None):
+    """
+    Borrow a pooled connection for the duration of the block and yield a cursor on it.
+    DBAPI cursors aren't thread-safe, so each request takes its own instead of sharing one.
+    Blocks (up to timeout seconds) while all POOL_SIZE connections are in use.
+    """
+    pool = _get_pool()
+    conn, last_used = pool.get(timeout=timeout)
+    try:
+        ## An empty slot (left by a failed connection) or one idle past POOL_RECYCLE
+        ## is (re)opened by whoever borrows it next
+        if conn is None or time.monotonic() - last_used > POOL_RECYCLE:
+            _close_quietly(conn)
+            conn = None
+            conn = get_connection()
+        cursor = conn.cursor()
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+    except Exception as e:
+        ## A driver error may have broken the connection: drop it and leave an empty slot,
+        ## rather than reconnecting here and masking the original error
+        if _is_driver_error(e):
+            _close_quietly(conn)
+            conn = None
+        raise
+    finally:
+        pool.put((conn, time.monotonic()) if conn is not None else (None, 0))
@@ -1,25 +1,30 @@
 # app.py
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for
+import json
+from flask import Flask, render_template, request, jsonify, session, redirect, url_for, Response, stream_with_context
 from patient_history_chatbot import RAGChatbot
+from session_store import SessionStore
 
 # Minimal Flask setup for demo
 app = Flask(__name__)
 app.secret_key = "dev-demo-key"  # Needed for session; fine for a demo
 
-# Create one bot instance per session (kept simple with a global + session guard)
-# For a real multi-user app, you'd persist per-user state differently.
-bot_instances = {}
+# One chat service (embedding model, LLM client, IRIS connection pool) shared by every session.
+# Loading and warming it at import means the first request doesn't pay for the cold start.
+SERVICE = RAGChatbot()
+SERVICE.warmup()
+
+# Only the conversation memory is per session. Sessions idle for 30 minutes expire
+# and the store is capped, so memory use stays bounded however many users show up.
+sessions = SessionStore(SERVICE.create_memory, maxsize=1000, ttl=1800)
 
 
 def get_bot():
-    """Get or create the user's bot instance tied to their session."""
+    """Return the shared chat service and the conversation memory tied to the user's session."""
     sid = session.get("sid")
     if not sid:
         sid = request.headers.get("X-Session-Id") or request.remote_addr or "anon"
         session["sid"] = sid
-    if sid not in bot_instances:
-        bot_instances[sid] = RAGChatbot()
-    return bot_instances[sid]
+    return SERVICE, sessions.get(sid)
 
 
 @app.route("/", methods=["GET"])
@@ -34,46 +39,58 @@ def index():
 @app.route("/set_patient", methods=["POST"])
 def set_patient():
     """
-    Set the patient ID on the bot. Expected form fields:
+    Set the patient ID for the session. Expected form fields:
     - patient_id: integer-like string
     """
     patient_id = request.form.get("patient_id", "").strip()
     if not patient_id.isdigit():
         return jsonify({"ok": False, "error": "Please enter a valid numeric patient ID."}), 400
 
-    bot = get_bot()
-    bot.set_patient_id(int(patient_id))
-    session["patient_id"] = int(patient_id)
+    patient_id = int(patient_id)
+    if session.get("patient_id") != patient_id:
+        # The saved history holds the previous patient's notes, so it can't carry over
+        _, memory = get_bot()
+        memory.clear()
+        session["patient_id"] = patient_id
     return jsonify({"ok": True, "message": f"Patient set to {patient_id}"})
 
 
-@app.route("/chat", methods=["POST"])
-def chat():
+def prepare_chat():
     """
-    Handle a single chat turn. Expected form fields:
-    - message: user prompt
-    - do_search: optional ("true"/"false") to enable RAG search
-    Uses the patient_id saved in session for RAG.
+    Validate a chat request. Returns (bot, memory, message, patient_id, do_search, error)
+    where error is a ready-to-return response when the request is invalid.
     """
     user_message = request.form.get("message", "").strip()
     do_search_raw = request.form.get("do_search", "true").strip().lower()
     do_search = do_search_raw in ("true", "1", "yes")
 
     if not user_message:
-        return jsonify({"ok": False, "error": "Message cannot be empty."}), 400
+        return None, None, None, None, None, (jsonify({"ok": False, "error": "Message cannot be empty."}), 400)
 
-    bot = get_bot()
+    bot, memory = get_bot()
 
     # If do_search is requested, ensure patient_id is present
-    if do_search:
-        patient_id = session.get("patient_id", 0)
-        if not patient_id:
-            return jsonify({"ok": False, "error": "Set patient ID before chatting with RAG search."}), 400
-        # Make sure bot has the same patient_id as session
-        bot.set_patient_id(int(patient_id))
+    patient_id = session.get("patient_id", 0)
+    if do_search and not patient_id:
+        return None, None, None, None, None, (jsonify({"ok": False, "error": "Set patient ID before chatting with RAG search."}), 400)
+
+    return bot, memory, user_message, patient_id, do_search, None
+
+
+@app.route("/chat", methods=["POST"])
+def chat():
+    """
+    Handle a single chat turn. Expected form fields:
+    - message: user prompt
+    - do_search: optional ("true"/"false") to enable RAG search
+    Uses the patient_id saved in session for RAG.
+    """
+    bot, memory, user_message, patient_id, do_search, error = prepare_chat()
+    if error:
+        return error
 
     try:
-        reply = bot.run(user_message, do_search=do_search)
+        reply = bot.run(user_message, memory, patient_id, do_search=do_search)
     except ValueError as e:
         # Handles the "Patient ID is not set" case from the bot
         return jsonify({"ok": False, "error": str(e)}), 400
@@ -84,16 +101,40 @@ def chat():
     return jsonify({"ok": True, "reply": reply})
 
 
+@app.route("/chat/stream", methods=["POST"])
+def chat_stream():
+    """
+    Same as /chat, but streams the reply as server-sent events so the browser
+    can show tokens as soon as Ollama produces them. Each event carries a JSON
+    object with either a "token", an "error", or "done": true.
+    """
+    bot, memory, user_message, patient_id, do_search, error = prepare_chat()
+    if error:
+        return error
+
+    def events():
+        try:
+            for token in bot.stream(user_message, memory, patient_id, do_search=do_search):
+                yield f"data: {json.dumps({'token': token})}\n\n"
+        except Exception as e:
+            # Minimal demo handling
+            yield f"data: {json.dumps({'error': f'Chat error: {e}'})}\n\n"
+            return
+        yield f"data: {json.dumps({'done': True})}\n\n"
+
+    return Response(stream_with_context(events()), mimetype="text/event-stream")
+
+
 @app.route("/reset", methods=["POST"])
 def reset():
     """
-    Reset the conversation memory for the current session's bot.
+    Reset the conversation memory for the current session.
     Keeps the patient_id unless the client asks to clear it via query/form.
     Optional form field:
     - clear_patient: "true" to also clear patient_id
     """
-    bot = get_bot()
-    bot.reset()
+    _, memory = get_bot()
+    memory.clear()
 
     clear_patient_raw = request.form.get("clear_patient", "false").strip().lower()
     if clear_patient_raw in ("true", "1", "yes"):
@@ -103,5 +144,6 @@ def reset():
 
 
 if __name__ == "__main__":
-    # Run the Flask app for demo
-    app.run(host="0.0.0.0", port=5000, debug=True)
\ No newline at end of file
+    # Run the Flask app for demo. Each request gets its own thread; start Ollama with
+    # OLLAMA_NUM_PARALLEL set (e.g. 8) so concurrent chats aren't queued behind each other.
+    app.run(host="0.0.0.0", port=5000, debug=True, threaded=True)
\ No newline at end of file
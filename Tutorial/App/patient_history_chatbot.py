@@ -1,90 +1,272 @@
 import iris
-from langchain_ollama import OllamaLLM 
-from langchain.chains import ConversationChain
+import os
+import functools
+import queue
+import threading
+import time
+from concurrent.futures import Future
+import numpy as np
+import torch
+from cachetools import TTLCache
+from langchain_ollama import ChatOllama
 from langchain.memory import ConversationBufferMemory
+from langchain_core.messages import HumanMessage, SystemMessage
 from sentence_transformers import SentenceTransformer
-from Utils.get_iris_connection import get_cursor
+from Utils.get_iris_connection import acquire_cursor
 import logging
 import warnings
 
 warnings.filterwarnings("ignore")
 logging.disable(logging.CRITICAL)
 
+## Prompt embedding caches: exact repeats hit the LRU, near-duplicates reuse an earlier vector
+PROMPT_CACHE_SIZE = 1024
+SEMANTIC_CACHE_SIZE = 512
+SEMANTIC_HIT_THRESHOLD = 0.97
+
+## Concurrent prompts are encoded together: wait up to ENCODE_BATCH_WAIT seconds for up to ENCODE_BATCH_SIZE
+ENCODE_BATCH_SIZE = 32
+ENCODE_BATCH_WAIT = 0.05
+
+## Retrieved context per (patient, prompt); a hit skips both the embedding and the IRIS search
+RETRIEVAL_CACHE_SIZE = 2048
+RETRIEVAL_CACHE_TTL = 600
+
+SYSTEM_PROMPT = "You are a helpful and knowledgeable assistant designed to help a doctor interpret a patient's medical history using retrieved information from a database.\
+        Please provide a detailed and medically relevant explanation, \
+        include the dates of the information you are given."
+
+## How long Ollama keeps the model (and its KV cache) loaded after a request; -1 keeps it forever
+_keep_alive = os.getenv("OLLAMA_KEEP_ALIVE", "-1")
+OLLAMA_KEEP_ALIVE = int(_keep_alive) if _keep_alive.lstrip("-").isdigit() else _keep_alive
+
+## Fully parameterized so IRIS can reuse one cached plan for every patient and prompt
+SEARCH_SQL = """
+    SELECT TOP 3 ClinicalNotes
+    FROM VectorSearch.DocRefVectors
+    WHERE PatientID = ?
+    ORDER BY VECTOR_COSINE(NotesVector, TO_VECTOR(?,double)) DESC
+"""
+
+## The embedding model is stateless, so every chatbot shares one copy per process
+_EMBED = None
+
+
+## On CPU, EMBED_BACKEND=onnx or openvino runs the encoder through that runtime instead of eager
+## PyTorch (needs sentence-transformers>=3.2 plus optimum[onnxruntime] or optimum[openvino])
+EMBED_BACKEND = os.getenv("EMBED_BACKEND", "torch")
+## Pre-quantized int8 ONNX export shipped in the all-MiniLM-L6-v2 repo
+ONNX_MODEL_FILE = os.getenv("ONNX_MODEL_FILE", "onnx/model_qint8_avx512.onnx")
+
+
+def _get_embed():
+    global _EMBED
+    if _EMBED is None:
+        if torch.cuda.is_available():
+            model = SentenceTransformer('all-MiniLM-L6-v2').to('cuda').half()
+        elif EMBED_BACKEND == "onnx":
+            model = SentenceTransformer('all-MiniLM-L6-v2', backend="onnx", model_kwargs={"file_name": ONNX_MODEL_FILE})
+        elif EMBED_BACKEND == "openvino":
+            model = SentenceTransformer('all-MiniLM-L6-v2', backend="openvino")
+        else:
+            model = SentenceTransformer('all-MiniLM-L6-v2')
+        ## clinical questions are short; truncating keeps attention cost down
+        model.max_seq_length = 128
+        _EMBED = model
+    return _EMBED
+
+
+@functools.lru_cache(maxsize=4)
+def _vector_format(dimension):
+    """Printf template for a whole vector, '[%.6f,%.6f,...]', built once per dimension."""
+    return "[" + ",".join(["%.6f"] * dimension) + "]"
+
+
+def _vector_param(vec):
+    """Format a numpy vector as the '[x,y,...]' string TO_VECTOR expects, in a single %-format call."""
+    return _vector_format(vec.shape[0]) % tuple(vec.tolist())
+
+
+class EncodeBatcher:
+    """
+    Funnels encode() calls from request threads through one worker thread, which encodes
+    whatever has arrived within ENCODE_BATCH_WAIT seconds as a single batch.
+    A lone request waits at most that long; concurrent ones share one forward pass.
+    """
+    def __init__(self, model):
+        self.model = model
+        self._queue = queue.Queue()
+        threading.Thread(target=self._worker, daemon=True).start()
+
+    def encode(self, text):
+        future = Future()
+        self._queue.put((text, future))
+        return future.result()
+
+    def _worker(self):
+        while True:
+            batch = [self._queue.get()]
+            ## one deadline per batch, so a steady trickle of arrivals can't keep extending the wait
+            deadline = time.monotonic() + ENCODE_BATCH_WAIT
+            try:
+                while len(batch) < ENCODE_BATCH_SIZE:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                pass
+            try:
+                vecs = self.model.encode([text for text, _ in batch], batch_size=ENCODE_BATCH_SIZE, normalize_embeddings=True, convert_to_numpy=True, show_progress_bar=False)
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            for (_, future), vec in zip(batch, vecs):
+                future.set_result(vec.astype(np.float32))
+
 
 class RAGChatbot:
+    """
+    Chat service shared by every user: one embedding model and LLM client, plus a pool of IRIS
+    connections that each search borrows a cursor from.
+    Per-user state (conversation memory and patient ID) is passed in on each call.
+    """
     def __init__(self):
-        self.message_count = 0
-        self.cursor = get_cursor()
-        self.conversation = self.create_conversation()
+        self.llm = self.create_llm()
         self.embedding_model = self.get_embedding_model()
-        self.patient_id = 0
+        self._encoder = EncodeBatcher(self.embedding_model)
+        self._prompt_cache_lock = threading.Lock()
+        self._embed_prompt = functools.lru_cache(maxsize=PROMPT_CACHE_SIZE)(self._encode_prompt)
+        self._prompt_cache_vecs = None
+        self._prompt_cache_entries = []
+        self._retrieval_cache = TTLCache(maxsize=RETRIEVAL_CACHE_SIZE, ttl=RETRIEVAL_CACHE_TTL)
+        self._retrieval_cache_lock = threading.Lock()
 
     def get_embedding_model(self):
-        return  SentenceTransformer('all-MiniLM-L6-v2') 
-        
-    def create_conversation(self):
-        system_prompt = "You are a helpful and knowledgeable assistant designed to help a doctor interpret a patient's medical history using retrieved information from a database.\
-        Please provide a detailed and medically relevant explanation, \
-        include the dates of the information you are given."
-        ## instanciate the conversation: 
-        llm=OllamaLLM(model="gemma3:1b", system=system_prompt) 
-        memory = ConversationBufferMemory()
-        conversation = ConversationChain(llm=llm, memory=memory)
-        return conversation
+        return _get_embed()
         
+    def create_llm(self):
+        return ChatOllama(model="gemma3:1b", keep_alive=OLLAMA_KEEP_ALIVE)
+
+    def create_memory(self):
+        return ConversationBufferMemory(return_messages=True)
+
+    def warmup(self):
+        """
+        Pay the cold-start costs up front: the embedding model's first forward pass, and
+        Ollama loading gemma3:1b into memory (kept there by OLLAMA_KEEP_ALIVE).
+        """
+        self.embedding_model.encode("warmup", show_progress_bar=False)
+        try:
+            self.llm.invoke([SystemMessage(SYSTEM_PROMPT), HumanMessage("hi")])
+        except Exception as e:
+            print(f"Ollama warmup failed, first chat will load the model: {e}")
+
+    def _encode_prompt(self, user_prompt):
+        """
+        Embed a prompt, reusing the vector of an earlier near-identical prompt when one exists.
+        Returns a (vector, sql_param) tuple so it can sit behind functools.lru_cache.
+        """
+        vec = self._encoder.encode(user_prompt)
+        with self._prompt_cache_lock:
+            if self._prompt_cache_vecs is not None:
+                ## embeddings are normalized, so the dot product is the cosine similarity
+                sims = self._prompt_cache_vecs @ vec
+                best = int(sims.argmax())
+                if sims[best] > SEMANTIC_HIT_THRESHOLD:
+                    return self._prompt_cache_entries[best]
+            vec.setflags(write=False)
+            entry = (vec, _vector_param(vec))
+            if self._prompt_cache_vecs is None:
+                self._prompt_cache_vecs = vec[np.newaxis, :]
+            else:
+                ## FIFO eviction once the semantic cache is full
+                self._prompt_cache_vecs = np.vstack([self._prompt_cache_vecs, vec])[-SEMANTIC_CACHE_SIZE:]
+            self._prompt_cache_entries = (self._prompt_cache_entries + [entry])[-SEMANTIC_CACHE_SIZE:]
+        return entry
+
     def vector_search(self, user_prompt,patient):
-        search_vector =  self.embedding_model.encode(user_prompt, normalize_embeddings=True, show_progress_bar=False).tolist() 
-        
-        search_sql = f"""
-            SELECT TOP 3 ClinicalNotes 
-            FROM VectorSearch.DocRefVectors
-            WHERE PatientID = {patient}
-            ORDER BY VECTOR_COSINE(NotesVector, TO_VECTOR(?,double)) DESC
         """
-        self.cursor.execute(search_sql,[str(search_vector)])
-        
-        results = self.cursor.fetchall()
-        return results
+        Return the top notes for the patient as one ready-to-inject context string, or None.
+        IRIS can't aggregate LONGVARCHAR stream columns with LIST()/XMLAGG, so the rows
+        are joined here, as soon as they come off the cursor.
+        """
+        _, search_vector = self._embed_prompt(user_prompt)
+
+        with acquire_cursor() as cursor:
+            cursor.execute(SEARCH_SQL, [patient, search_vector])
+            results = cursor.fetchall()
 
-    def set_patient_id(self, patient_id):
-        self.patient_id=patient_id
+        if not results:
+            return None
+        ## SEARCH_SQL selects exactly one column, so rows are [(ClinicalNotes,), ...]
+        assert len(results[0]) == 1, "SEARCH_SQL should select a single column"
+        return "\n---\n".join(str(row[0]) for row in results)
 
-    def run(self, user_prompt: str, do_search: bool = True) -> str:
+    def cached_search(self, user_prompt, patient):
         """
-        Execute one turn of the chat. Returns the assistant's reply as a string.
-        Requires self.patient_id to be set before calling if do_search is True.
+        vector_search() behind a short-lived cache keyed on (patient, normalized prompt),
+        so a question re-asked within RETRIEVAL_CACHE_TTL seconds skips the search entirely.
+        """
+        key = (patient, user_prompt.strip().lower())
+        with self._retrieval_cache_lock:
+            if key in self._retrieval_cache:
+                return self._retrieval_cache[key]
+        context = self.vector_search(user_prompt, patient)
+        with self._retrieval_cache_lock:
+            self._retrieval_cache[key] = context
+        return context
+
+    def build_prompt(self, user_prompt: str, patient_id: int = 0, do_search: bool = True) -> str:
+        """
+        Build the user message for one turn, running the RAG search first if requested.
+        Requires patient_id if do_search is True.
         """
         if do_search:
-            if not self.patient_id:
-                raise ValueError("Patient ID is not set. Call set_patient_id(...) first.")
-            results = self.vector_search(user_prompt, self.patient_id)
-            if results == []:
+            if not patient_id:
+                raise ValueError("Patient ID is not set.")
+            context = self.cached_search(user_prompt, patient_id)
+            if context is None:
                 # Optional: keep going but with an explicit note
                 context = "No results found for this patient ID."
-            else:
-                # Assumes rows like [(ClinicalNotes,), ...]
-                context_parts = []
-                for r in results:
-                    text = r[0] if isinstance(r, (list, tuple)) and len(r) == 1 else str(r)
-                    context_parts.append(str(text))
-                context = "\n---\n".join(context_parts)
-            prompt = f"CONTEXT:\n{context}\n\nUSER QUESTION:\n{user_prompt}"
-        else:
-            prompt = f"USER QUESTION:\n{user_prompt}"
+            return f"CONTEXT:\n{context}\n\nUSER QUESTION:\n{user_prompt}"
+        return f"USER QUESTION:\n{user_prompt}"
+
+    def build_messages(self, prompt: str, memory) -> list:
+        """
+        Lay out the chat so everything but the new turn is identical to the previous request:
+        system prompt, then the saved history, then this turn's retrieved notes and question.
+        Ollama can then reuse the KV cache for the whole prefix instead of re-reading it.
+        """
+        return [SystemMessage(SYSTEM_PROMPT), *memory.chat_memory.messages, HumanMessage(prompt)]
 
-        response = self.conversation.predict(input=prompt)
-        self.message_count += 1
+    def run(self, user_prompt: str, memory, patient_id: int = 0, do_search: bool = True) -> str:
+        """
+        Execute one turn of the chat against the caller's memory. Returns the assistant's reply as a string.
+        Requires patient_id if do_search is True.
+        """
+        prompt = self.build_prompt(user_prompt, patient_id, do_search)
+        response = self.llm.invoke(self.build_messages(prompt, memory)).content
+        memory.save_context({"input": prompt}, {"output": response})
         return response
 
-    def reset(self):
-        self.message_count = 0
-        self.conversation = self.create_conversation()
-        # keep the same patient, or also reset it if you prefer:
-        # self.patient_id = 0
+    def stream(self, user_prompt: str, memory, patient_id: int = 0, do_search: bool = True):
+        """
+        Same as run(), but yields the reply token by token as Ollama produces it.
+        The full reply is saved to the conversation memory once the stream ends.
+        """
+        prompt = self.build_prompt(user_prompt, patient_id, do_search)
+        chunks = []
+        for chunk in self.llm.stream(self.build_messages(prompt, memory)):
+            chunks.append(chunk.content)
+            yield chunk.content
+        memory.save_context({"input": prompt}, {"output": "".join(chunks)})
 
 
 
 if __name__=="__main__":
     bot = RAGChatbot()
+    memory = bot.create_memory()
     while True:
-        bot.run()
\ No newline at end of file
+        print(bot.run(input(" - User: "), memory, do_search=False))
\ No newline at end of file
@@ -0,0 +1,27 @@
+# session_store.py
+import threading
+import time
+from cachetools import TTLCache
+
+
+class SessionStore:
+    """
+    Per-session values (conversation memories) created on first use.
+    An entry expires once it has gone `ttl` seconds without being accessed, and at most
+    `maxsize` sessions are kept, so memory use stays bounded however many users show up.
+    """
+
+    def __init__(self, factory, maxsize=1000, ttl=1800, timer=time.monotonic):
+        self._factory = factory
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl, timer=timer)
+        self._lock = threading.Lock()
+
+    def get(self, sid):
+        """Return the value for sid, creating it if missing, and restart its expiry timer."""
+        with self._lock:
+            value = self._cache.get(sid)
+            if value is None:
+                value = self._factory()
+            # TTLCache counts from insertion, so re-assign to make the TTL an idle timeout
+            self._cache[sid] = value
+            return value
@@ -52,7 +52,7 @@ except ImportError:
     print("Warning: boto3 not available, AWS Bedrock will not be used", file=sys.stderr)
 
 # Import database connection module
-from src.db.connection import get_connection
+from src.db.connection import get_pooled_connection
 
 # Import search modules for scoring and caching
 from src.search.scoring import get_score_color, get_confidence_level
@@ -526,12 +526,12 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
         "visualize_graphrag_results"
     }
 
+    # Only get IRIS connection for tools that need it
+    conn = None
+    cursor = None
     try:
-        # Only get IRIS connection for tools that need it
-        conn = None
-        cursor = None
         if name not in FHIR_REST_ONLY_TOOLS:
-            conn = get_connection()
+            conn = get_pooled_connection()
             cursor = conn.cursor()
 
         if name == "search_fhir_documents":
@@ -699,12 +699,9 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             for entity_type, count in cursor.fetchall():
                 entity_stats.append({'type': entity_type, 'count': count})
 
-            # Total counts
-            cursor.execute("SELECT COUNT(*) FROM RAG.Entities")
-            total_entities = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM RAG.EntityRelationships")
-            total_relationships = cursor.fetchone()[0]
+            # Total counts, in one round trip
+            cursor.execute("SELECT (SELECT COUNT(*) FROM RAG.Entities), (SELECT COUNT(*) FROM RAG.EntityRelationships)")
+            total_entities, total_relationships = cursor.fetchone()
 
             # High confidence entities
             cursor.execute("""
@@ -1092,7 +1089,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
                     sql = """
                         SELECT TOP ?
                             i.ImageID, i.StudyID, i.SubjectID, i.ViewPosition, i.ImagePath,
-                            VECTOR_COSINE(i.Vector, TO_VECTOR(?, double)) AS Similarity,
+                            VECTOR_COSINE(i.Vector, TO_VECTOR(?, float)) AS Similarity,
                             m.FHIRPatientID, m.FHIRPatientName
                         FROM VectorSearch.MIMICCXRImages i
                         LEFT JOIN VectorSearch.PatientImageMapping m
@@ -1466,8 +1463,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             # Get linked MIMIC-CXR images from database
             if mimic_study_id:
                 try:
-                    from src.db.connection import get_connection
-                    conn = get_connection()
+                    conn = get_pooled_connection()
                     cursor = conn.cursor()
                     sql = """
                         SELECT ImageID, SubjectID, ViewPosition, ImagePath
@@ -1791,6 +1787,12 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             })
         )]
 
+    finally:
+        # Several tools return without closing; hand the connection back to the pool
+        # (close() on a pooled connection is idempotent)
+        if conn is not None:
+            conn.close()
+
 
 
 async def main():
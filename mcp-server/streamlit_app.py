@@ -7,6 +7,7 @@ Claude calls MCP tools autonomously based on user questions
 import streamlit as st
 import asyncio
 import json
+import re
 import subprocess
 import os
 import sys
@@ -30,6 +31,12 @@ try:
 except ImportError:
     pass  # python-dotenv not installed
 
+# Faster decoding of large tool results (image lists, fused documents)
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 # OpenAI support
 try:
     from openai import OpenAI
@@ -70,6 +77,17 @@ CRITICAL INSTRUCTIONS:
 """
 
 
+def _keyword_pattern(*keywords: str) -> "re.Pattern":
+    """Compile keywords into one case-insensitive substring alternation."""
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+# Keyword routing shared by demo mode and the tool-choice hints
+IMAGING_KEYWORDS_RE = _keyword_pattern("radiology", "image", "x-ray", "scan", "cxr", "dicom")
+ALLERGY_KEYWORDS_RE = _keyword_pattern("allergy", "allerrgies", "allergies")
+VIZ_KEYWORDS_RE = _keyword_pattern("plot", "chart", "graph", "visualize", "show me", "display")
+
+
 # ============================================================================
 # Data Models for GraphRAG Details Panel (Feature 005)
 # ============================================================================
@@ -1038,7 +1056,7 @@ def execute_mcp_tool(tool_name: str, tool_input: dict):
     """Execute an MCP tool and return results"""
     try:
         result = asyncio.run(call_tool(tool_name, tool_input))
-        return json.loads(result[0].text)
+        return json_loads(result[0].text)
     except Exception as e:
         print(f"Error in vector search: {e}", file=sys.stderr)
         return {"error": str(e)}
@@ -1510,10 +1528,10 @@ def demo_mode_search(user_message: str):
         elif "knowledge graph" in query_lower or "entities" in query_lower:
             tool_name = "search_knowledge_graph"
             result = asyncio.run(call_tool(tool_name, {"query": clean_query, "limit": 5}))
-        elif any(kw in query_lower for kw in ["image", "x-ray", "scan", "radiology", "cxr", "dicom"]):
+        elif IMAGING_KEYWORDS_RE.search(query_lower):
             tool_name = "search_medical_images"
             result = asyncio.run(call_tool(tool_name, {"query": clean_query, "limit": 3}))
-        elif any(kw in query_lower for kw in ["allergy", "allerrgies", "allergies"]):
+        elif ALLERGY_KEYWORDS_RE.search(query_lower):
             # For allergies, use hybrid search to find in both FHIR and KG
             tool_name = "hybrid_search"
             result = asyncio.run(call_tool(tool_name, {"query": clean_query, "top_k": 5}))
@@ -1522,7 +1540,7 @@ def demo_mode_search(user_message: str):
             tool_name = "hybrid_search"
             result = asyncio.run(call_tool(tool_name, {"query": clean_query, "top_k": 5}))
 
-        data = json.loads(result[0].text)
+        data = json_loads(result[0].text)
 
         # Log tool execution for transparency
         execution_log = [{
@@ -1667,8 +1685,23 @@ def call_openai_compatible(messages, tools=None):
     return result
 
 
+BEDROCK_MODEL_ID = "global.anthropic.claude-sonnet-4-5-20250929-v1:0"
+
+
+@st.cache_resource
+def get_bedrock_client():
+    """One bedrock-runtime client per Streamlit process, reused across turns and sessions."""
+    import boto3
+    from botocore.config import Config
+    return boto3.client("bedrock-runtime", config=Config(read_timeout=30))
+
+
 def call_claude_via_cli(messages, tools=None):
-    """Call Claude via AWS CLI instead of boto3"""
+    """Call Claude through the Bedrock Converse API.
+
+    Uses a cached boto3 client; falls back to the AWS CLI when boto3 is missing
+    or can't find credentials the CLI can (e.g. an SSO profile it resolves differently).
+    """
 
     # Convert to Converse API format
     converse_messages = []
@@ -1729,9 +1762,28 @@ def call_claude_via_cli(messages, tools=None):
             if content_blocks:
                 converse_messages.append({"role": "assistant", "content": content_blocks})
 
+    request = {
+        "modelId": BEDROCK_MODEL_ID,
+        "messages": converse_messages,
+        "system": [{"text": SYSTEM_PROMPT}],
+        "inferenceConfig": {"maxTokens": 4000},
+    }
+    if tools:
+        request["toolConfig"] = {"tools": tools}
+
+    try:
+        from botocore.exceptions import NoCredentialsError
+    except ImportError:
+        NoCredentialsError = None
+    if NoCredentialsError is not None:
+        try:
+            return get_bedrock_client().converse(**request)
+        except NoCredentialsError:
+            pass
+
     cmd = [
         "aws", "bedrock-runtime", "converse",
-        "--model-id", "global.anthropic.claude-sonnet-4-5-20250929-v1:0",
+        "--model-id", BEDROCK_MODEL_ID,
         "--messages", json.dumps(converse_messages),
         "--system", json.dumps([{"text": SYSTEM_PROMPT}])
     ]
@@ -1795,8 +1847,7 @@ def chat_with_tools(user_message: str):
         print(f"DEBUG: Injecting memory context:\n{memory_context}", file=sys.stderr)
 
     # Enhance user message if it's asking for visualization
-    viz_keywords = ['plot', 'chart', 'graph', 'visualize', 'show me', 'display']
-    if any(keyword in user_message.lower() for keyword in viz_keywords):
+    if VIZ_KEYWORDS_RE.search(user_message):
         # Add explicit instruction to use visualization tools
         user_message = user_message + "\n\n[IMPORTANT: Use the appropriate plot_* tool to create a visualization. Available: plot_entity_network, plot_symptom_frequency, plot_entity_distribution, plot_patient_timeline]"
 
@@ -1807,11 +1858,10 @@ def chat_with_tools(user_message: str):
     # ========================================================================
     # INTERNAL REASONING REINFORCEMENT (Few-shot guidance for tool choice)
     # ========================================================================
-    user_message_lower = user_message.lower()
-    if any(kw in user_message_lower for kw in ["radiology", "image", "x-ray", "scan", "cxr", "dicom"]):
+    if IMAGING_KEYWORDS_RE.search(user_message):
         user_message = user_message + "\n\n[REASONING HINT: User is asking for radiology/medical images. You MUST call search_medical_images to find them. Do not rely solely on document search.]"
     
-    if any(kw in user_message_lower for kw in ["allergy", "allerrgies", "allergies"]):
+    if ALLERGY_KEYWORDS_RE.search(user_message):
         user_message = user_message + "\n\n[REASONING HINT: User is asking for allergies. Search BOTH FHIR documents and the knowledge graph to be thorough. Use search_fhir_documents and search_knowledge_graph.]"
 
     # Build conversation history from session state
@@ -9,83 +9,114 @@ import asyncio
 import json
 from fhir_graphrag_mcp_server import call_tool
 
+def run_tool(name, arguments):
+    """
+    Run one tool to completion on the calling thread's own event loop.
+
+    call_tool blocks on IRIS and HTTP inside its coroutine, so checks only
+    overlap when each runs on a worker thread.
+    """
+    return asyncio.run(call_tool(name, arguments))
+
+
+async def check_entity_statistics():
+    """Knowledge graph statistics."""
+    result = await asyncio.to_thread(run_tool, "get_entity_statistics", {})
+    data = json.loads(result[0].text)
+    lines = [
+        f"✓ Total entities: {data['total_entities']}",
+        f"✓ Total relationships: {data['total_relationships']}",
+        f"✓ Entity types: {len(data['entity_distribution'])}",
+        "\nTop entity types:",
+    ]
+    for entity_type in data['entity_distribution'][:5]:
+        lines.append(f"  • {entity_type['type']}: {entity_type['count']}")
+    return lines
+
+
+async def check_search_knowledge_graph():
+    """Search knowledge graph."""
+    result = await asyncio.to_thread(run_tool, "search_knowledge_graph", {
+        "query": "fever",
+        "limit": 3
+    })
+    data = json.loads(result[0].text)
+    lines = [
+        f"✓ Found {data['entities_found']} entities",
+        f"✓ Related to {data['documents_found']} documents",
+        "\nTop entities:",
+    ]
+    for entity in data['entities'][:3]:
+        lines.append(f"  • {entity['text']} ({entity['type']}) - confidence: {entity['confidence']:.2f}")
+    return lines
+
+
+async def check_search_fhir_documents():
+    """Search FHIR documents."""
+    result = await asyncio.to_thread(run_tool, "search_fhir_documents", {
+        "query": "chest pain",
+        "limit": 2
+    })
+    data = json.loads(result[0].text)
+    lines = [f"✓ Found {data['results_count']} documents"]
+    if data['documents']:
+        doc = data['documents'][0]
+        lines += [
+            "\nFirst document preview:",
+            f"  FHIR ID: {doc['fhir_id']}",
+            f"  Relevance: {doc['relevance']}",
+            f"  Preview: {doc['preview'][:100]}...",
+        ]
+    return lines
+
+
+async def check_hybrid_search():
+    """Hybrid search."""
+    result = await asyncio.to_thread(run_tool, "hybrid_search", {
+        "query": "respiratory infection",
+        "top_k": 3
+    })
+    data = json.loads(result[0].text)
+    lines = [
+        f"✓ FHIR results: {data['fhir_results']}",
+        f"✓ GraphRAG results: {data['graphrag_results']}",
+        f"✓ Fused results: {data['fused_results']}",
+        "\nTop fused documents:",
+    ]
+    for doc in data['top_documents'][:3]:
+        lines.append(f"  • {doc['fhir_id']} (RRF score: {doc['rrf_score']:.4f})")
+        lines.append(f"    Sources: {', '.join(doc['sources'])}")
+    return lines
+
+
+CHECKS = [
+    ("get_entity_statistics", check_entity_statistics),
+    ("search_knowledge_graph", check_search_knowledge_graph),
+    ("search_fhir_documents", check_search_fhir_documents),
+    ("hybrid_search", check_hybrid_search),
+]
+
+
 async def test_tool_execution():
     """Test executing MCP tools."""
     print("Testing MCP Tool Execution...")
     print("=" * 60)
 
-    # Test 1: Knowledge graph statistics
-    print("\n1. Testing get_entity_statistics...")
-    print("-" * 60)
-    try:
-        result = await call_tool("get_entity_statistics", {})
-        data = json.loads(result[0].text)
-        print(f"✓ Total entities: {data['total_entities']}")
-        print(f"✓ Total relationships: {data['total_relationships']}")
-        print(f"✓ Entity types: {len(data['entity_distribution'])}")
-        print("\nTop entity types:")
-        for entity_type in data['entity_distribution'][:5]:
-            print(f"  • {entity_type['type']}: {entity_type['count']}")
-    except Exception as e:
-        print(f"✗ Failed: {e}")
-        return False
-
-    # Test 2: Search knowledge graph
-    print("\n2. Testing search_knowledge_graph...")
-    print("-" * 60)
-    try:
-        result = await call_tool("search_knowledge_graph", {
-            "query": "fever",
-            "limit": 3
-        })
-        data = json.loads(result[0].text)
-        print(f"✓ Found {data['entities_found']} entities")
-        print(f"✓ Related to {data['documents_found']} documents")
-        print("\nTop entities:")
-        for entity in data['entities'][:3]:
-            print(f"  • {entity['text']} ({entity['type']}) - confidence: {entity['confidence']:.2f}")
-    except Exception as e:
-        print(f"✗ Failed: {e}")
-        return False
+    # The tools are independent, so run them concurrently; each check returns its
+    # output lines so reports print whole and in order rather than interleaved
+    results = await asyncio.gather(*(check() for _, check in CHECKS), return_exceptions=True)
 
-    # Test 3: Search FHIR documents
-    print("\n3. Testing search_fhir_documents...")
-    print("-" * 60)
-    try:
-        result = await call_tool("search_fhir_documents", {
-            "query": "chest pain",
-            "limit": 2
-        })
-        data = json.loads(result[0].text)
-        print(f"✓ Found {data['results_count']} documents")
-        if data['documents']:
-            print("\nFirst document preview:")
-            doc = data['documents'][0]
-            print(f"  FHIR ID: {doc['fhir_id']}")
-            print(f"  Relevance: {doc['relevance']}")
-            print(f"  Preview: {doc['preview'][:100]}...")
-    except Exception as e:
-        print(f"✗ Failed: {e}")
-        return False
+    passed = True
+    for i, ((tool, _), result) in enumerate(zip(CHECKS, results), 1):
+        print(f"\n{i}. Testing {tool}...")
+        print("-" * 60)
+        if isinstance(result, Exception):
+            print(f"✗ Failed: {result}")
+            passed = False
+        else:
+            print("\n".join(result))
 
-    # Test 4: Hybrid search
-    print("\n4. Testing hybrid_search...")
-    print("-" * 60)
-    try:
-        result = await call_tool("hybrid_search", {
-            "query": "respiratory infection",
-            "top_k": 3
-        })
-        data = json.loads(result[0].text)
-        print(f"✓ FHIR results: {data['fhir_results']}")
-        print(f"✓ GraphRAG results: {data['graphrag_results']}")
-        print(f"✓ Fused results: {data['fused_results']}")
-        print("\nTop fused documents:")
-        for doc in data['top_documents'][:3]:
-            print(f"  • {doc['fhir_id']} (RRF score: {doc['rrf_score']:.4f})")
-            print(f"    Sources: {', '.join(doc['sources'])}")
-    except Exception as e:
-        print(f"✗ Failed: {e}")
+    if not passed:
         return False
 
     print("\n" + "=" * 60)
@@ -2,16 +2,27 @@
 """Test NVIDIA Hosted NIM API for embeddings"""
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 API_KEY = "NVIDIA_API_KEY_PLACEHOLDER"
 MODEL = "nvidia/nv-embedqa-e5-v5"
 
-response = requests.post(
+# Reusable pooled session with retries on rate limits and transient server errors
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=5, backoff_factor=2, status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods=["POST"])
+))
+SESSION.headers.update({
+    "Authorization": f"Bearer {API_KEY}",
+    "Content-Type": "application/json"
+})
+
+response = SESSION.post(
     "https://integrate.api.nvidia.com/v1/embeddings",
-    headers={
-        "Authorization": f"Bearer {API_KEY}",
-        "Content-Type": "application/json"
-    },
     json={
         "input": ["test clinical note about patient health"],
         "model": MODEL,
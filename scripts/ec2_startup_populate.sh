@@ -72,7 +72,8 @@ fi
 export FHIR_BASE_URL="${FHIR_URL}"
 export USE_REMOTE_IRIS="false"  # Running locally on the EC2
 
-python scripts/populate_full_graphrag_data.py
+# The patient count check above is authoritative, so bypass the script's own marker
+python scripts/populate_full_graphrag_data.py --force
 
 RESULT=$?
 if [ $RESULT -eq 0 ]; then
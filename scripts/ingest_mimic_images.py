@@ -9,10 +9,19 @@ Supports both local testing (mock embeddings) and production (real NV-CLIP).
 import sys
 import os
 import json
+import hashlib
+import logging
 import time
+import queue
+import threading
+from functools import lru_cache
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Dict
 
+import numpy as np
+
 # Add project root to path
 parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '.'))
 if parent_dir not in sys.path:
@@ -20,13 +29,42 @@ if parent_dir not in sys.path:
 
 from src.db.connection import get_connection
 
+logger = logging.getLogger(__name__)
+
 # Try to import NV-CLIP embeddings
 try:
-    from src.embeddings.nvclip_embeddings import NVCLIPEmbeddings
+    from src.embeddings.nvclip_embeddings import NVCLIPEmbeddings, quantize_embedding
     NVCLIP_AVAILABLE = True
 except ImportError:
     NVCLIP_AVAILABLE = False
-    print("Warning: NV-CLIP not available, will use mock embeddings", file=sys.stderr)
+    quantize_embedding = None
+    logger.warning("NV-CLIP not available, will use mock embeddings")
+
+# Threads for directory walks and DICOM header reads (I/O bound, so well above CPU count)
+DEFAULT_IO_WORKERS = 32
+
+# Batches buffered between pipeline stages (prepare -> embed -> insert)
+STAGE_QUEUE_SIZE = 2
+# Checkpoint log entries are flushed every batch but only fsynced this often
+CHECKPOINT_FSYNC_EVERY = 10
+# Batches between INFO-level progress lines (every batch is logged at DEBUG)
+PROGRESS_EVERY = 10
+_DONE = object()
+
+# DICOM header elements read by load_dicom_metadata
+DICOM_METADATA_TAGS = ['ViewPosition', 'Modality', 'PatientID', 'StudyDate', 'SeriesDescription']
+
+# Embeddings of already-seen texts; the texts are "Chest X-ray {view} view",
+# so this holds a handful of entries for a whole run
+_text_embedding_cache: Dict[str, List[float]] = {}
+
+# Statements are bound on one long-lived cursor per connection with constant
+# SQL text; reopening cursors per batch would throw away the prepared statement
+INSERT_SQL = """
+    INSERT INTO VectorSearch.MIMICCXRImages
+    (ImageID, StudyID, SubjectID, ViewPosition, ImagePath, Vector, Metadata)
+    VALUES (?, ?, ?, ?, ?, TO_VECTOR(?, FLOAT), ?)
+"""
 
 
 def get_embedder():
@@ -37,20 +75,41 @@ def get_embedder():
     try:
         return NVCLIPEmbeddings()
     except Exception as e:
-        print(f"Warning: Could not initialize NV-CLIP: {e}", file=sys.stderr)
+        logger.warning("Could not initialize NV-CLIP: %s", e)
         return None
 
 
-def find_dicom_files(base_path: str, limit: Optional[int] = None) -> List[Path]:
+def _walk_dicoms(root: str):
+    """
+    Yield os.DirEntry objects for every .dcm file under root, in name order.
+
+    os.scandir hands back file types straight from the directory read, so
+    unlike Path.rglob no extra stat() is needed per entry.
+    """
+    with os.scandir(root) as entries:
+        entries = sorted(entries, key=lambda e: e.name)
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk_dicoms(entry.path)
+        elif entry.name.endswith('.dcm'):
+            yield entry
+
+
+def find_dicom_files(base_path: str, limit: Optional[int] = None,
+                     io_workers: int = DEFAULT_IO_WORKERS) -> List[Path]:
     """
     Find DICOM files in MIMIC-CXR directory structure.
 
     MIMIC-CXR structure:
       files/pXX/pXXXXXXXX/sXXXXXXXX/*.dcm
 
+    Each top-level subdirectory is walked on its own thread so directory
+    reads overlap instead of running one after another.
+
     Args:
         base_path: Root path to MIMIC-CXR files
         limit: Optional limit on number of files to return
+        io_workers: Number of directory-walking threads
 
     Returns:
         List of Path objects to DICOM files
@@ -61,11 +120,27 @@ def find_dicom_files(base_path: str, limit: Optional[int] = None) -> List[Path]:
 
     print(f"📂 Scanning for DICOM files in {base_path}...")
 
-    dicom_files = []
-    for dcm_file in base.rglob("*.dcm"):
-        dicom_files.append(dcm_file)
-        if limit and len(dicom_files) >= limit:
-            break
+    with os.scandir(base) as entries:
+        top = sorted(entries, key=lambda e: e.name)
+    dicom_files = [Path(e.path) for e in top if e.is_file() and e.name.endswith('.dcm')]
+    subdirs = [e.path for e in top if e.is_dir(follow_symlinks=False)]
+
+    def walk_subdir(subdir):
+        found = _walk_dicoms(subdir)
+        if limit:
+            # No single subdirectory can contribute more than limit files
+            found = islice(found, limit)
+        return [Path(e.path) for e in found]
+
+    with ThreadPoolExecutor(max_workers=io_workers) as executor:
+        for found in executor.map(walk_subdir, subdirs):
+            dicom_files.extend(found)
+            if limit and len(dicom_files) >= limit:
+                executor.shutdown(wait=True, cancel_futures=True)
+                break
+
+    if limit:
+        dicom_files = dicom_files[:limit]
 
     print(f"Found {len(dicom_files)} DICOM files")
     return dicom_files
@@ -118,7 +193,10 @@ def load_dicom_metadata(dcm_path: Path) -> Optional[Dict]:
     """
     try:
         import pydicom
-        dcm = pydicom.dcmread(str(dcm_path), stop_before_pixels=True)
+        # Only parse the few header elements used below; skips every other tag
+        # as well as the pixel data
+        dcm = pydicom.dcmread(str(dcm_path), stop_before_pixels=True,
+                              specific_tags=DICOM_METADATA_TAGS)
 
         return {
             'view_position': getattr(dcm, 'ViewPosition', 'UNKNOWN'),
@@ -128,98 +206,333 @@ def load_dicom_metadata(dcm_path: Path) -> Optional[Dict]:
             'series_description': getattr(dcm, 'SeriesDescription', '')
         }
     except Exception as e:
-        print(f"Warning: Could not read DICOM metadata from {dcm_path}: {e}", file=sys.stderr)
+        logger.warning("Could not read DICOM metadata from %s: %s", dcm_path, e)
         return None
 
 
-def ingest_image(cursor, conn, dcm_path: Path, embedder, dry_run: bool = False) -> bool:
+def batch_embed_texts(embedder, texts: List[str], batch_size: int = 32) -> List[List[float]]:
+    """
+    Embed texts with as few NV-CLIP requests as possible.
+
+    Texts are deduplicated and looked up in _text_embedding_cache first; the
+    embedding texts only vary by view position, so after the first few
+    batches nothing is sent at all. Each chunk of batch_size uncached texts
+    goes out as one request. If a chunk fails, its texts are retried one at
+    a time so a single bad text only costs its own embedding.
+
+    Args:
+        embedder: NV-CLIP embedder (or None for mock)
+        texts: Texts to embed
+        batch_size: Texts per NV-CLIP request
+
+    Returns:
+        One 1024-dimensional embedding per text (zero vector on failure)
+    """
+    if not embedder:
+        return [[0.0] * 1024 for _ in texts]
+
+    missing = [text for text in dict.fromkeys(texts) if text not in _text_embedding_cache]
+    failed = set()
+    for start in range(0, len(missing), batch_size):
+        chunk = missing[start:start + batch_size]
+        try:
+            _text_embedding_cache.update(zip(chunk, embedder.embed_texts(chunk, batch_size=batch_size)))
+        except Exception as e:
+            logger.warning("Batch embedding failed (%s), retrying texts individually", e)
+            for text in chunk:
+                try:
+                    _text_embedding_cache[text] = embedder.embed_text(text)
+                except Exception as e:
+                    logger.warning("Embedding failed for '%s': %s", text, e)
+                    failed.add(text)
+
+    # Failures aren't cached, so the next batch tries those texts again
+    return [[0.0] * 1024 if text in failed else _text_embedding_cache[text] for text in texts]
+
+
+@lru_cache(maxsize=8)
+def _vec_format(fmt: str, dimension: int) -> str:
+    """Printf template for a whole vector, e.g. '%.7g,%.7g,...' (built once per dimension)."""
+    return ','.join([fmt] * dimension)
+
+
+def _vec_str(embedding) -> str:
+    """
+    Format an embedding (list or numpy array) as the comma-separated string TO_VECTOR expects.
+
+    The whole vector goes through a single %-format call instead of one str() per
+    element. fp16 vectors only carry ~4 significant digits, so they get a shorter format.
+    """
+    arr = np.asarray(embedding)
+    fmt = '%.4g' if arr.dtype == np.float16 else '%.7g'
+    return _vec_format(fmt, arr.shape[0]) % tuple(arr.tolist())
+
+
+def _id_hash(image_id: str) -> int:
+    """64-bit hash of an ImageID, as stored in the in-memory checkpoint index."""
+    return int.from_bytes(hashlib.blake2b(image_id.encode(), digest_size=8).digest(), 'little')
+
+
+def load_checkpoint(checkpoint_path: Optional[str]) -> np.ndarray:
+    """
+    Read the image IDs already ingested from an append-only checkpoint log.
+
+    The IDs are kept as a sorted array of 64-bit hashes rather than a set of
+    strings: 8 bytes per image instead of a ~100-byte str plus set slot.
+
+    Args:
+        checkpoint_path: Path to the checkpoint log (or None)
+
+    Returns:
+        Sorted uint64 array of ImageID hashes from committed batches
+        (empty if no checkpoint)
+    """
+    if not checkpoint_path or not os.path.exists(checkpoint_path):
+        return np.empty(0, dtype=np.uint64)
+    with open(checkpoint_path) as f:
+        hashes = np.fromiter((_id_hash(line.rstrip('\n')) for line in f if line.strip()),
+                             dtype=np.uint64)
+    return np.unique(hashes)
+
+
+def checkpoint_contains(done_hashes: np.ndarray, image_ids: List[str]) -> np.ndarray:
+    """
+    Test which image IDs are in a checkpoint from load_checkpoint.
+
+    Args:
+        done_hashes: Sorted uint64 hashes from load_checkpoint
+        image_ids: ImageIDs to look up
+
+    Returns:
+        Boolean array, True where the image was already ingested
+    """
+    hashes = np.fromiter((_id_hash(image_id) for image_id in image_ids),
+                         dtype=np.uint64, count=len(image_ids))
+    if not len(done_hashes):
+        return np.zeros(len(hashes), dtype=bool)
+    positions = np.searchsorted(done_hashes, hashes).clip(max=len(done_hashes) - 1)
+    return done_hashes[positions] == hashes
+
+
+def append_checkpoint(log_file, image_ids: List[str], sync: bool = False):
+    """
+    Record a committed batch by appending its image IDs to the checkpoint log.
+
+    Only the new IDs are written, so each checkpoint costs O(batch) however
+    many images came before. A torn final line after a crash just means that
+    batch's images are re-checked (and skipped as existing) on resume.
+
+    Args:
+        log_file: Checkpoint log opened in append mode
+        image_ids: ImageIDs of the committed batch
+        sync: Also fsync, so the entry survives a power loss
+    """
+    log_file.write(''.join(f"{image_id}\n" for image_id in image_ids))
+    log_file.flush()
+    if sync:
+        os.fsync(log_file.fileno())
+
+
+@lru_cache(maxsize=16)
+def _existing_ids_sql(count: int) -> str:
+    """
+    IN-list lookup for count ImageIDs.
+
+    Every full batch binds through the identical statement text, so the
+    driver's statement cache reuses one prepared plan for the whole run.
+    """
+    placeholders = ','.join('?' * count)
+    return f"SELECT ImageID FROM VectorSearch.MIMICCXRImages WHERE ImageID IN ({placeholders})"
+
+
+def existing_image_ids(cursor, image_ids: List[str], chunk_size: int = 1000) -> set:
+    """
+    Return which of the given ImageIDs are already in the table.
+
+    Looks the IDs up by primary key with one IN query per chunk, rather than a
+    query per image or a scan of every ImageID in the table.
+
+    Args:
+        cursor: IRIS database cursor
+        image_ids: Candidate ImageIDs
+        chunk_size: IDs per query
+
+    Returns:
+        Set of the candidate IDs that already exist
+    """
+    existing = set()
+    for start in range(0, len(image_ids), chunk_size):
+        chunk = image_ids[start:start + chunk_size]
+        cursor.execute(_existing_ids_sql(len(chunk)), chunk)
+        existing.update(row[0] for row in cursor.fetchall())
+    return existing
+
+
+def prepare_batch(cursor, dcm_paths: List[Path],
+                  executor: Optional[ThreadPoolExecutor] = None):
+    """
+    Find the images in a batch that still need ingesting and read their DICOM headers.
+
+    Args:
+        cursor: IRIS database cursor
+        dcm_paths: Paths to DICOM files
+        executor: Optional thread pool used to read DICOM headers concurrently
+
+    Returns:
+        Tuple of (pending, counts): pending holds (path_meta, dicom_meta, view_position)
+        per new image, counts starts with the number of images skipped
+    """
+    counts = {'added': 0, 'skipped': 0, 'errors': 0}
+
+    # Collect images not yet in the table
+    all_meta = [(dcm_path, extract_metadata_from_path(dcm_path)) for dcm_path in dcm_paths]
+    existing = existing_image_ids(cursor, [path_meta['image_id'] for _, path_meta in all_meta])
+
+    new_images = []
+    for dcm_path, path_meta in all_meta:
+        if path_meta['image_id'] in existing:
+            counts['skipped'] += 1
+            continue
+
+        new_images.append((dcm_path, path_meta))
+
+    # DICOM header reads are disk bound, so overlap them when a pool is given
+    paths = [dcm_path for dcm_path, _ in new_images]
+    all_dicom_meta = executor.map(load_dicom_metadata, paths) if executor else map(load_dicom_metadata, paths)
+
+    pending = []
+    for (_, path_meta), dicom_meta in zip(new_images, all_dicom_meta):
+        view_position = dicom_meta['view_position'] if dicom_meta else 'UNKNOWN'
+        pending.append((path_meta, dicom_meta, view_position))
+
+    return pending, counts
+
+
+def embedding_texts(pending) -> List[str]:
+    """Texts to embed for prepared images (view position is the only text available)."""
+    return [f"Chest X-ray {view} view" for _, _, view in pending]
+
+
+def ingest_batch(cursor, conn, dcm_paths: List[Path], embedder, dry_run: bool = False,
+                 executor: Optional[ThreadPoolExecutor] = None) -> Dict[str, int]:
     """
-    Ingest a single DICOM image into IRIS.
+    Ingest a batch of DICOM images into IRIS.
+
+    Images already in the table are skipped; the rest are embedded with a
+    single batched NV-CLIP call and inserted, then committed together.
 
     Args:
         cursor: IRIS database cursor
         conn: IRIS database connection
-        dcm_path: Path to DICOM file
+        dcm_paths: Paths to DICOM files
         embedder: NV-CLIP embedder (or None for mock)
         dry_run: If True, don't actually insert
+        executor: Optional thread pool used to read DICOM headers concurrently
 
     Returns:
-        True if successful, False otherwise
+        Dictionary with added, skipped and errors counts
     """
-    # Extract path-based metadata
-    path_meta = extract_metadata_from_path(dcm_path)
-    image_id = path_meta['image_id']
+    pending, counts = prepare_batch(cursor, dcm_paths, executor)
+    if not pending:
+        return counts
 
-    # Check if already exists
-    cursor.execute("""
-        SELECT ImageID FROM VectorSearch.MIMICCXRImages
-        WHERE ImageID = ?
-    """, (image_id,))
+    embeddings = batch_embed_texts(embedder, embedding_texts(pending))
+    insert_batch(cursor, conn, pending, embeddings, embedder, counts, dry_run)
+    return counts
 
-    if cursor.fetchone():
-        return True  # Already exists, skip
 
-    # Load DICOM metadata
-    dicom_meta = load_dicom_metadata(dcm_path)
-    view_position = dicom_meta['view_position'] if dicom_meta else 'UNKNOWN'
+def insert_batch(cursor, conn, pending, embeddings: List[List[float]], embedder,
+                 counts: Dict[str, int], dry_run: bool = False) -> List[str]:
+    """
+    Insert prepared, embedded images and commit them together.
 
-    # Generate embedding
-    if embedder:
-        try:
-            # Use view position as text for embedding
-            text = f"Chest X-ray {view_position} view"
-            embedding = embedder.embed_text(text)
-        except Exception as e:
-            print(f"Warning: Embedding failed for {image_id}: {e}", file=sys.stderr)
-            embedding = [0.0] * 1024
-    else:
-        # Mock embedding
-        embedding = [0.0] * 1024
-
-    # Prepare metadata JSON
-    metadata = {
-        'path_metadata': path_meta,
-        'dicom_metadata': dicom_meta if dicom_meta else {},
-        'embedding_source': 'nvclip' if embedder else 'mock'
-    }
-    metadata_str = json.dumps(metadata)
+    Args:
+        cursor: IRIS database cursor
+        conn: IRIS database connection
+        pending: Images from prepare_batch
+        embeddings: One embedding per pending image
+        embedder: NV-CLIP embedder (or None for mock)
+        counts: Counts from prepare_batch, updated in place
+        dry_run: If True, don't actually insert
+
+    Returns:
+        ImageIDs that were committed; rows that failed to insert are left out
+    """
+    rows = []
+    # Cached text embeddings come back as the same list object for every image
+    # with the same view position, so each distinct vector is formatted once
+    vector_strs = {}
+    for (path_meta, dicom_meta, view_position), embedding in zip(pending, embeddings):
+        image_id = path_meta['image_id']
+
+        # Prepare metadata JSON
+        metadata = {
+            'path_metadata': path_meta,
+            'dicom_metadata': dicom_meta if dicom_meta else {},
+            'embedding_source': 'nvclip' if embedder else 'mock'
+        }
+        metadata_str = json.dumps(metadata)
 
-    if dry_run:
-        print(f"[DRY RUN] Would insert: {image_id} ({view_position})")
-        return True
+        if dry_run:
+            logger.info("[DRY RUN] Would insert: %s (%s)", image_id, view_position)
+            counts['added'] += 1
+            continue
 
-    # Insert into database
-    try:
-        embedding_str = ','.join(map(str, embedding))
+        vector_str = vector_strs.get(id(embedding))
+        if vector_str is None:
+            vector_str = vector_strs[id(embedding)] = _vec_str(
+                quantize_embedding(embedding) if embedder else embedding)
 
-        cursor.execute("""
-            INSERT INTO VectorSearch.MIMICCXRImages
-            (ImageID, StudyID, SubjectID, ViewPosition, ImagePath, Vector, Metadata)
-            VALUES (?, ?, ?, ?, ?, TO_VECTOR(?, DOUBLE), ?)
-        """, (
+        rows.append((
             image_id,
             path_meta['study_id'],
             path_meta['subject_id'],
             view_position,
             path_meta['file_path'],
-            embedding_str,
+            vector_str,
             metadata_str
         ))
 
-        conn.commit()
-        return True
+    if dry_run or not rows:
+        return []
 
+    # One explicit transaction per batch whatever the driver's autocommit
+    # default is, so the batch costs a single commit
+    cursor.execute("START TRANSACTION")
+    # Insert the whole batch in one round trip
+    try:
+        cursor.executemany(INSERT_SQL, rows)
+        counts['added'] += len(rows)
+        inserted = [row[0] for row in rows]
     except Exception as e:
-        print(f"Error inserting {image_id}: {e}", file=sys.stderr)
+        # Fall back to row-by-row so one bad row doesn't cost the batch.
+        # A failed IRIS statement is undone on its own without aborting the
+        # transaction, so the good rows still commit together below.
+        logger.warning("Batch insert failed (%s), retrying rows individually", e)
         conn.rollback()
-        return False
+        cursor.execute("START TRANSACTION")
+        inserted = []
+        for row in rows:
+            try:
+                cursor.execute(INSERT_SQL, row)
+                counts['added'] += 1
+                inserted.append(row[0])
+            except Exception as e:
+                logger.error("Error inserting %s: %s", row[0], e)
+                counts['errors'] += 1
+
+    conn.commit()
+
+    return inserted
 
 
 def ingest_mimic_images(
     mimic_path: str,
     limit: Optional[int] = None,
     dry_run: bool = False,
-    batch_size: int = 100
+    batch_size: int = 100,
+    io_workers: int = DEFAULT_IO_WORKERS,
+    checkpoint_path: Optional[str] = None
 ):
     """
     Ingest MIMIC-CXR images into IRIS.
@@ -228,7 +541,10 @@ def ingest_mimic_images(
         mimic_path: Path to MIMIC-CXR files directory
         limit: Optional limit on number of images
         dry_run: If True, don't actually insert
-        batch_size: Commit after this many inserts
+        batch_size: Images embedded and committed together
+        io_workers: Threads for directory walks and DICOM header reads
+        checkpoint_path: Optional append-only log of the image IDs in each
+            committed batch; a rerun with the same file skips those images
     """
     print("="*60)
     print("MIMIC-CXR Image Ingestion")
@@ -247,7 +563,7 @@ def ingest_mimic_images(
     print()
 
     # Find DICOM files
-    dicom_files = find_dicom_files(mimic_path, limit)
+    dicom_files = find_dicom_files(mimic_path, limit, io_workers)
     if not dicom_files:
         print("❌ No DICOM files found")
         return
@@ -255,6 +571,25 @@ def ingest_mimic_images(
     # Connect to database
     conn = get_connection()
     cursor = conn.cursor()
+    executor = ThreadPoolExecutor(max_workers=io_workers)
+    stop = threading.Event()
+
+    def put(q, item):
+        # Give up once the run is stopping so a stage never blocks on a full queue
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                pass
+
+    # Skip images a previous run already committed
+    done_hashes = load_checkpoint(None if dry_run else checkpoint_path)
+    if len(done_hashes):
+        done = checkpoint_contains(done_hashes, [p.stem for p in dicom_files])
+        dicom_files = [p for p, is_done in zip(dicom_files, done) if not is_done]
+        print(f"Resuming from checkpoint: {len(done_hashes)} images already done")
+    checkpoint_log = open(checkpoint_path, 'a') if checkpoint_path and not dry_run else None
 
     try:
         # Process files
@@ -264,50 +599,90 @@ def ingest_mimic_images(
         success_count = 0
         skip_count = 0
         error_count = 0
+        batches_done = 0
         start_time = time.time()
 
-        for i, dcm_path in enumerate(dicom_files, 1):
+        # Three-stage pipeline: while batch N is inserted here, batch N+1 is being
+        # embedded and batch N+2's existence checks and header reads are running
+        prepared = queue.Queue(maxsize=STAGE_QUEUE_SIZE)
+        embedded = queue.Queue(maxsize=STAGE_QUEUE_SIZE)
+
+        def prepare_stage():
             try:
-                # Check if exists first
-                path_meta = extract_metadata_from_path(dcm_path)
-                cursor.execute("""
-                    SELECT ImageID FROM VectorSearch.MIMICCXRImages
-                    WHERE ImageID = ?
-                """, (path_meta['image_id'],))
-
-                if cursor.fetchone():
-                    skip_count += 1
-                    if i % 100 == 0:
-                        print(f"  {i}/{len(dicom_files)}: Skipped {skip_count}, Added {success_count}, Errors {error_count}")
-                    continue
-
-                success = ingest_image(cursor, conn, dcm_path, embedder, dry_run)
-
-                if success:
-                    success_count += 1
-                else:
-                    error_count += 1
-
-                # Progress update
-                if i % 100 == 0 or i == len(dicom_files):
-                    elapsed = time.time() - start_time
-                    rate = i / elapsed if elapsed > 0 else 0
-                    print(f"  {i}/{len(dicom_files)}: Skipped {skip_count}, Added {success_count}, Errors {error_count} ({rate:.1f} img/sec)")
-
-                # Batch commit
-                if not dry_run and i % batch_size == 0:
-                    conn.commit()
-
-            except KeyboardInterrupt:
-                print("\n\n⚠️  Interrupted by user")
-                break
+                # Cursors aren't thread-safe, so this stage reads on its own connection
+                read_conn = get_connection()
+                read_cursor = read_conn.cursor()
+                try:
+                    for batch_start in range(0, len(dicom_files), batch_size):
+                        if stop.is_set():
+                            return
+                        batch = dicom_files[batch_start:batch_start + batch_size]
+                        try:
+                            pending, counts = prepare_batch(read_cursor, batch, executor)
+                            put(prepared, (batch_start, batch, pending, counts, None))
+                        except Exception as e:
+                            put(prepared, (batch_start, batch, None, None, e))
+                finally:
+                    read_cursor.close()
+                    read_conn.close()
             except Exception as e:
-                print(f"Error processing {dcm_path}: {e}")
-                error_count += 1
+                logger.error("Error opening read connection: %s", e)
+            finally:
+                put(prepared, _DONE)
+
+        def embed_stage():
+            while (item := prepared.get()) is not _DONE:
+                batch_start, batch, pending, counts, error = item
+                embeddings = None
+                if error is None and pending:
+                    try:
+                        embeddings = batch_embed_texts(embedder, embedding_texts(pending))
+                    except Exception as e:
+                        error = e
+                put(embedded, (batch_start, batch, pending, embeddings, counts, error))
+            put(embedded, _DONE)
+
+        for stage in (prepare_stage, embed_stage):
+            threading.Thread(target=stage, daemon=True).start()
 
-        # Final commit
-        if not dry_run:
-            conn.commit()
+        try:
+            while (item := embedded.get()) is not _DONE:
+                batch_start, batch, pending, embeddings, counts, error = item
+                try:
+                    if error is not None:
+                        raise error
+                    done_ids = [p.stem for p in batch]
+                    if pending:
+                        inserted = insert_batch(cursor, conn, pending, embeddings, embedder, counts, dry_run)
+                        # Only checkpoint images now in the table (skipped as existing, or
+                        # committed here); ones that failed must be retried on resume
+                        pending_ids = {path_meta['image_id'] for path_meta, _, _ in pending}
+                        done_ids = [i for i in done_ids if i not in pending_ids] + inserted
+                    success_count += counts['added']
+                    skip_count += counts['skipped']
+                    error_count += counts['errors']
+                    batches_done += 1
+                    if checkpoint_log:
+                        append_checkpoint(checkpoint_log, done_ids,
+                                          sync=batches_done % CHECKPOINT_FSYNC_EVERY == 0)
+
+                    # Progress update, at INFO only every PROGRESS_EVERY batches
+                    i = batch_start + len(batch)
+                    level = logging.INFO if batches_done % PROGRESS_EVERY == 0 or i == len(dicom_files) else logging.DEBUG
+                    if logger.isEnabledFor(level):
+                        elapsed = time.time() - start_time
+                        logger.log(level, "  %d/%d: Skipped %d, Added %d, Errors %d (%.1f img/sec)",
+                                   i, len(dicom_files), skip_count, success_count, error_count,
+                                   i / elapsed if elapsed > 0 else 0)
+
+                except Exception as e:
+                    logger.error("Error processing batch starting at %s: %s", batch[0], e)
+                    error_count += len(batch)
+                    if not dry_run:
+                        conn.rollback()
+
+        except KeyboardInterrupt:
+            print("\n\n⚠️  Interrupted by user")
 
         # Summary
         elapsed = time.time() - start_time
@@ -328,6 +703,11 @@ def ingest_mimic_images(
         print(f"Total images in database: {total_count}")
 
     finally:
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+        if checkpoint_log:
+            os.fsync(checkpoint_log.fileno())
+            checkpoint_log.close()
         cursor.close()
         conn.close()
 
@@ -339,13 +719,23 @@ if __name__ == '__main__':
     parser.add_argument('mimic_path', help='Path to MIMIC-CXR files directory')
     parser.add_argument('--limit', type=int, help='Limit number of images to ingest')
     parser.add_argument('--dry-run', action='store_true', help='Dry run (don\'t actually insert)')
-    parser.add_argument('--batch-size', type=int, default=100, help='Commit batch size')
+    parser.add_argument('--batch-size', type=int, default=100, help='Images per embedding request and commit')
+    parser.add_argument('--io-workers', type=int, default=DEFAULT_IO_WORKERS,
+                        help='Threads for directory walks and DICOM header reads')
+    parser.add_argument('--checkpoint', help='Append-only log of ingested image IDs to record progress in and resume from')
+    parser.add_argument('--verbose', action='store_true', help='Log progress after every batch')
 
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
+
     ingest_mimic_images(
         mimic_path=args.mimic_path,
         limit=args.limit,
         dry_run=args.dry_run,
-        batch_size=args.batch_size
+        batch_size=args.batch_size,
+        io_workers=args.io_workers,
+        checkpoint_path=args.checkpoint
     )
@@ -148,7 +148,7 @@ def load_images(limit=10):
             cursor.execute("""
                 INSERT INTO VectorSearch.MIMICCXRImages
                 (ImageID, PatientID, StudyType, ImagePath, Embedding, CreatedAt, UpdatedAt)
-                VALUES (?, ?, ?, ?, TO_VECTOR(?, DOUBLE), CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+                VALUES (?, ?, ?, ?, TO_VECTOR(?, FLOAT), CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
             """, (
                 image_id,
                 "P10000000",  # Mock patient ID
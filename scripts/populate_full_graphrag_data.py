@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+import asyncio
 import json
 import urllib.request
 import urllib.error
@@ -7,6 +8,7 @@ import sys
 import os
 import random
 from datetime import datetime, timedelta
+import numpy as np
 from src.db.connection import get_connection
 
 FHIR_BASE_URL = os.getenv('FHIR_BASE_URL', "http://localhost:32783/csp/healthshare/demo/fhir/r4")
@@ -14,6 +16,12 @@ FHIR_USERNAME = os.getenv('FHIR_USERNAME', "_SYSTEM")
 FHIR_PASSWORD = os.getenv('FHIR_PASSWORD', "SYS")
 IRIS_NAMESPACE = os.getenv('IRIS_NAMESPACE', '%SYS')
 NUM_PATIENTS = 50
+# Rows per executemany call when loading the IRIS tables
+INSERT_BATCH_SIZE = 40
+# FHIR PUTs kept in flight at once
+FHIR_CONCURRENCY = 8
+# Written after a successful load; its presence makes later runs a no-op
+POPULATED_MARKER = os.getenv('GRAPHRAG_POPULATED_MARKER', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.graphrag_populated'))
 
 # Heuristic mapping for entity types
 MEDICATIONS = {
@@ -37,6 +45,16 @@ CONDITIONS_LIST = [
     ("penicillin allergy", "Condition", ["hives", "rash", "anaphylaxis risk", "avoid penicillin"]),
 ]
 
+# (entity text, entity type, relationship type) for each condition's related items,
+# derived once here instead of per note
+CONDITION_ITEMS = {
+    name: [
+        (item, "MEDICATION", "TREATS") if item.lower() in MEDICATIONS else (item, "SYMPTOM", "CAUSES")
+        for item in items
+    ]
+    for name, _, items in CONDITIONS_LIST
+}
+
 IMAGING_FINDINGS = [
     ("No acute cardiopulmonary findings", "normal"),
     ("Mild cardiomegaly", "abnormal"),
@@ -70,6 +88,37 @@ def generate_patients():
         })
     return patients
 
+def build_iris_rows(patients):
+    """Build the row tuples for every IRIS table; relationships refer to entities by (text, type, resource)."""
+    rows = {"documents": [], "vectors": [], "entities": [], "relationships": []}
+    # Draw every note's mock vector in one call rather than 1024 random.uniform() per note
+    num_notes = sum(len(p["notes"]) for p in patients)
+    mock_vectors = iter(np.random.default_rng().uniform(-0.1, 0.1, size=(num_notes, 1024)).round(4).tolist())
+    for p in patients:
+        for n in p["notes"]:
+            res_str = json.dumps({"resourceType": "Composition", "id": n["id"], "status": "final", "text": {"div": n["text"]}})
+            rows["documents"].append((n["id"], n["type"], n["text"], res_str))
+            vec = ",".join(map(str, next(mock_vectors)))
+            rows["vectors"].append((n["id"], n["type"], n["text"], vec, 'mock', 'nim'))
+
+            doc_id = int(n["id"].split('-p')[1].replace('-', ''))
+
+            cond_key = (n["name"], "CONDITION", doc_id)
+            rows["entities"].append((n["name"], "CONDITION", doc_id, 0.95))
+
+            for item, etype, rtype in CONDITION_ITEMS[n["name"]]:
+                item_key = (item, etype, doc_id)
+                rows["entities"].append((item, etype, doc_id, 0.90))
+
+                src, tgt = (item_key, cond_key) if etype == "MEDICATION" else (cond_key, item_key)
+                rows["relationships"].append((src, tgt, rtype, doc_id, 0.85))
+    return rows
+
+def insert_batched(cur, sql, rows, batch_size=INSERT_BATCH_SIZE):
+    """executemany in chunks of batch_size rows, one round trip per chunk."""
+    for start in range(0, len(rows), batch_size):
+        cur.executemany(sql, rows[start:start + batch_size])
+
 def put_resource(resource):
     import requests
     from requests.auth import HTTPBasicAuth
@@ -92,67 +141,97 @@ def put_resource(resource):
     except Exception as e:
         return False, str(e)
 
-def main():
-    print(f"Populating data for {NUM_PATIENTS} patients...")
-    patients = generate_patients()
-    
-    print("Uploading FHIR Resources...")
-    p_count = 0
-    for p in patients:
-        res, code = put_resource({"resourceType": "Patient", "id": p["id"], "name": [{"family": p["lname"], "given": [p["fname"]]}], "gender": p["gender"], "birthDate": p["bdate"]})
-        if res:
-            p_count += 1
-        else:
-            print(f"  ❌ Failed to upload Patient/{p['id']}: {code}")
-        
-        res_img, code_img = put_resource({"resourceType": "ImagingStudy", "id": p["img"]["id"], "status": "available", "subject": {"reference": f"Patient/{p['id']}"}, "started": p["img"]["date"], "modality": [{"code": "CR"}], "description": p["img"]["finding"]})
-        if not res_img:
-            print(f"  ❌ Failed to upload ImagingStudy/{p['img']['id']}: {code_img}")
-            
+def upload_patient(p):
+    """PUT one patient and its imaging study; returns whether each of the two was stored."""
+    res, code = put_resource({"resourceType": "Patient", "id": p["id"], "name": [{"family": p["lname"], "given": [p["fname"]]}], "gender": p["gender"], "birthDate": p["bdate"]})
+    if not res:
+        print(f"  ❌ Failed to upload Patient/{p['id']}: {code}")
+
+    res_img, code_img = put_resource({"resourceType": "ImagingStudy", "id": p["img"]["id"], "status": "available", "subject": {"reference": f"Patient/{p['id']}"}, "started": p["img"]["date"], "modality": [{"code": "CR"}], "description": p["img"]["finding"]})
+    if not res_img:
+        print(f"  ❌ Failed to upload ImagingStudy/{p['img']['id']}: {code_img}")
+    return res, res_img
+
+async def upload_fhir(patients):
+    """
+    Upload every patient, with up to FHIR_CONCURRENCY PUTs in flight at once.
+    Returns True only if every Patient and ImagingStudy was stored.
+    """
+    limit = asyncio.Semaphore(FHIR_CONCURRENCY)
+
+    async def upload(p):
+        async with limit:
+            return await asyncio.to_thread(upload_patient, p)
+
+    results = await asyncio.gather(*(upload(p) for p in patients))
+    p_count = sum(res for res, _ in results)
     print(f"✅ {p_count} Patients uploaded")
+    return all(res and res_img for res, res_img in results)
 
-    print("Populating IRIS Tables...")
+def populate_iris(patients):
+    """Reload the IRIS tables; returns a summary of what was loaded, or None on failure."""
+    conn = None
     try:
         conn = get_connection()
         cur = conn.cursor()
-        
+
+        # The reload is one explicit transaction with a single commit at the end;
+        # a failure part-way leaves the previous data in place
+        cur.execute("START TRANSACTION")
         for t in ["SQLUser.FHIRDocuments", "VectorSearch.FHIRTextVectors", "RAG.Entities", "RAG.EntityRelationships"]:
             try: cur.execute(f"DELETE FROM {t}")
             except: pass
         
-        e_count = 0
-        r_count = 0
-        for p in patients:
-            for n in p["notes"]:
-                res_str = json.dumps({"resourceType": "Composition", "id": n["id"], "status": "final", "text": {"div": n["text"]}})
-                cur.execute("INSERT INTO SQLUser.FHIRDocuments (FHIRResourceId, ResourceType, TextContent, ResourceString, CreatedAt) VALUES (?, ?, ?, ?, NOW())", (n["id"], n["type"], n["text"], res_str))
-                vec = ",".join(str(round(random.uniform(-0.1, 0.1), 4)) for _ in range(1024))
-                cur.execute("INSERT INTO VectorSearch.FHIRTextVectors (ResourceID, ResourceType, TextContent, Vector, EmbeddingModel, Provider, CreatedAt) VALUES (?, ?, ?, TO_VECTOR(?, DOUBLE, 1024), ?, ?, NOW())", (n["id"], n["type"], n["text"], vec, 'mock', 'nim'))
-                
-                doc_id = int(n["id"].split('-p')[1].replace('-', ''))
-                
-                cur.execute("INSERT INTO RAG.Entities (EntityText, EntityType, ResourceID, Confidence) VALUES (?, ?, ?, ?)", (n["name"], "CONDITION", doc_id, 0.95))
-                e_count += 1
-                cur.execute("SELECT LAST_IDENTITY()")
-                cond_db_id = cur.fetchone()[0]
-                
-                for item in n["items"]:
-                    etype = "MEDICATION" if item.lower() in MEDICATIONS else "SYMPTOM"
-                    cur.execute("INSERT INTO RAG.Entities (EntityText, EntityType, ResourceID, Confidence) VALUES (?, ?, ?, ?)", (item, etype, doc_id, 0.90))
-                    e_count += 1
-                    cur.execute("SELECT LAST_IDENTITY()")
-                    item_db_id = cur.fetchone()[0]
-                    
-                    rtype = "TREATS" if etype == "MEDICATION" else "CAUSES"
-                    src, tgt = (item_db_id, cond_db_id) if etype == "MEDICATION" else (cond_db_id, item_db_id)
-                    cur.execute("INSERT INTO RAG.EntityRelationships (SourceEntityID, TargetEntityID, RelationshipType, ResourceID, Confidence) VALUES (?, ?, ?, ?, ?)", (src, tgt, rtype, doc_id, 0.85))
-                    r_count += 1
-        
+        rows = build_iris_rows(patients)
+        insert_batched(cur, "INSERT INTO SQLUser.FHIRDocuments (FHIRResourceId, ResourceType, TextContent, ResourceString, CreatedAt) VALUES (?, ?, ?, ?, NOW())", rows["documents"])
+        insert_batched(cur, "INSERT INTO VectorSearch.FHIRTextVectors (ResourceID, ResourceType, TextContent, Vector, EmbeddingModel, Provider, CreatedAt) VALUES (?, ?, ?, TO_VECTOR(?, DOUBLE, 1024), ?, ?, NOW())", rows["vectors"])
+        insert_batched(cur, "INSERT INTO RAG.Entities (EntityText, EntityType, ResourceID, Confidence) VALUES (?, ?, ?, ?)", rows["entities"])
+        e_count = len(rows["entities"])
+
+        # Resolve the generated EntityIDs with one query instead of a LAST_IDENTITY() per row
+        cur.execute("SELECT EntityID, EntityText, EntityType, ResourceID FROM RAG.Entities")
+        entity_ids = {(text, etype, res_id): ent_id for ent_id, text, etype, res_id in cur.fetchall()}
+        insert_batched(cur, "INSERT INTO RAG.EntityRelationships (SourceEntityID, TargetEntityID, RelationshipType, ResourceID, Confidence) VALUES (?, ?, ?, ?, ?)",
+                       [(entity_ids[src], entity_ids[tgt], rtype, doc_id, conf) for src, tgt, rtype, doc_id, conf in rows["relationships"]])
+        r_count = len(rows["relationships"])
+
         conn.commit()
-        conn.close()
         print(f"✅ IRIS Data Populated: {e_count} entities, {r_count} relationships")
+        return f"{e_count} entities, {r_count} relationships"
     except Exception as e:
         print(f"IRIS Error: {e}")
+        if conn:
+            conn.rollback()
+        return None
+    finally:
+        if conn:
+            conn.close()
+
+async def populate(patients):
+    # The FHIR uploads and the IRIS load share nothing but the generated patients,
+    # so the IRIS transaction runs in a worker thread while the PUTs are in flight
+    print("Uploading FHIR Resources and populating IRIS Tables...")
+    fhir_ok, iris_summary = await asyncio.gather(upload_fhir(patients), asyncio.to_thread(populate_iris, patients))
+
+    # Only mark the run finished when both halves succeeded, so a partial load is retried next time
+    if fhir_ok and iris_summary:
+        with open(POPULATED_MARKER, "w") as f:
+            f.write(f"{iris_summary}\n")
+    else:
+        print("Population incomplete; not writing the marker so the next run retries")
+
+def main(force=False):
+    # Skip re-population (and the FHIR and IRIS connections) when a previous run finished
+    if os.path.exists(POPULATED_MARKER) and not force:
+        print(f"Already populated ({POPULATED_MARKER} exists); use --force to reload")
+        return
+
+    print(f"Populating data for {NUM_PATIENTS} patients...")
+    patients = generate_patients()
+    asyncio.run(populate(patients))
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    parser = argparse.ArgumentParser(description="Populate FHIR and IRIS GraphRAG demo data")
+    parser.add_argument("--force", action="store_true", help="Reload even if a previous run completed")
+    main(force=parser.parse_args().force)
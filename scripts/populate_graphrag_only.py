@@ -10,11 +10,14 @@ Usage:
 """
 import subprocess
 import random
+import re
 import sys
 
 EC2_HOST = "13.218.19.254"
 SSH_KEY = "~/.ssh/fhir-ai-key-recovery.pem"
 NUM_PATIENTS = 50
+# INSERT statements sent through one SSH session
+SQL_BATCH_SIZE = 100
 
 # Medical data pools
 CONDITIONS = [
@@ -35,29 +38,55 @@ CONDITIONS = [
     ("gastroesophageal reflux", "Condition", ["omeprazole", "pantoprazole", "heartburn", "dysphagia"]),
 ]
 
+
+def _split_related_items(related_items):
+    """Split a condition's related items into (medications, symptoms)."""
+    medications = [x for x in related_items if x[0].islower() and not any(s in x for s in ["pain", "cough", "fatigue"])]
+    med_set = set(medications)
+    symptoms = [x for x in related_items if x not in med_set]
+    return medications or ["supportive care"], symptoms or ["general discomfort"]
+
+
+# The split depends only on the condition, so it's done once here rather than per note
+CONDITION_SPLITS = {condition: _split_related_items(items) for condition, _, items in CONDITIONS}
+
 FIRST_NAMES = ["James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda",
                "William", "Elizabeth", "David", "Barbara", "Richard", "Susan", "Joseph", "Jessica"]
 LAST_NAMES = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
               "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson"]
 
 
-def execute_sql(sql):
-    """Execute SQL via SSH to EC2 docker container."""
-    # Escape quotes for nested shell
-    escaped_sql = sql.replace("'", "'\\''")
+def execute_sql_batch(statements):
+    """
+    Execute single-line SQL statements in one SSH session and one IRIS SQL shell.
 
-    cmd = f"""ssh -o StrictHostKeyChecking=no -o ConnectTimeout=30 -i {SSH_KEY} ubuntu@{EC2_HOST} "docker exec iris-fhir bash -c 'echo \\"{escaped_sql}\\" | iris sql IRIS -U DEMO 2>/dev/null'" 2>/dev/null"""
+    The statements are piped to the shell on stdin, so a batch costs one SSH
+    handshake instead of one per statement.
+
+    Returns:
+        (rows affected, list of error lines)
+    """
+    cmd = f"""ssh -o StrictHostKeyChecking=no -o ConnectTimeout=30 -i {SSH_KEY} ubuntu@{EC2_HOST} "docker exec -i iris-fhir iris sql IRIS -U DEMO" 2>/dev/null"""
 
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=60)
-        output = result.stdout
-        if "ERROR #" in output:
-            return False, output
-        if "Row" in output and "Affected" in output:
-            return True, output
-        return True, output
+        result = subprocess.run(cmd, shell=True, input="\n".join(statements) + "\n",
+                                capture_output=True, text=True, timeout=60 + len(statements))
     except Exception as e:
-        return False, str(e)
+        return 0, [str(e)]
+
+    output = result.stdout
+    affected = len(re.findall(r"^\s*1 Rows? Affected", output, re.MULTILINE))
+    errors = [line.strip() for line in output.splitlines() if "ERROR #" in line]
+    return affected, errors
+
+
+def insert_batched(statements, label, stats_key, stats):
+    """Run statements SQL_BATCH_SIZE at a time, tallying affected rows into stats."""
+    for start in range(0, len(statements), SQL_BATCH_SIZE):
+        affected, errors = execute_sql_batch(statements[start:start + SQL_BATCH_SIZE])
+        stats[stats_key] += affected
+        stats["errors"].extend(f"{label}: {err[:100]}" for err in errors)
+        print(f"  Inserted {stats[stats_key]} {stats_key}...")
 
 
 def generate_patient_data():
@@ -77,17 +106,10 @@ def generate_patient_data():
         relationships = []
         notes = []
 
-        for cond_idx, (condition, cond_type, related_items) in enumerate(patient_conditions):
+        for cond_idx, (condition, cond_type, _) in enumerate(patient_conditions):
             note_id = f"note-p{i:03d}-{cond_idx + 1}"
 
-            # Split related items into medications and symptoms
-            medications = [x for x in related_items if x[0].islower() and not any(s in x for s in ["pain", "cough", "fatigue"])]
-            symptoms = [x for x in related_items if x not in medications]
-
-            if not medications:
-                medications = ["supportive care"]
-            if not symptoms:
-                symptoms = ["general discomfort"]
+            medications, symptoms = CONDITION_SPLITS[condition]
 
             # Create note text
             note_text = f"Patient {first_name} {last_name} presents with {symptoms[0]}. History of {condition}. Currently on {medications[0]}. Assessment: {condition} stable. Plan: Continue current medications."
@@ -180,55 +202,34 @@ def main():
 
     # Insert Entities
     print("\nInserting Entities...")
+    statements = []
     for patient in patients:
         for entity in patient["entities"]:
             text = entity["entity_text"].replace("'", "''")
-            sql = f"INSERT INTO SQLUser.Entity (EntityID, EntityType, EntityText, SourceDocumentID, PatientID, Confidence) VALUES ('{entity['entity_id']}', '{entity['entity_type']}', '{text}', '{entity['source_document_id']}', '{entity['patient_id']}', {entity['confidence']})"
-
-            success, result = execute_sql(sql)
-            if success:
-                stats["entities"] += 1
-            else:
-                stats["errors"].append(f"Entity {entity['entity_id']}: {result[:100]}")
-
-        if stats["entities"] % 50 == 0:
-            print(f"  Inserted {stats['entities']} entities...")
+            statements.append(f"INSERT INTO SQLUser.Entity (EntityID, EntityType, EntityText, SourceDocumentID, PatientID, Confidence) VALUES ('{entity['entity_id']}', '{entity['entity_type']}', '{text}', '{entity['source_document_id']}', '{entity['patient_id']}', {entity['confidence']})")
+    insert_batched(statements, "Entity", "entities", stats)
 
     print(f"  Total entities: {stats['entities']}")
 
     # Insert Relationships
     print("\nInserting Relationships...")
+    statements = []
     for patient in patients:
         for rel in patient["relationships"]:
-            sql = f"INSERT INTO SQLUser.Relationship (RelationshipID, SourceEntityID, TargetEntityID, RelationType, SourceDocumentID, Confidence) VALUES ('{rel['rel_id']}', '{rel['source_id']}', '{rel['target_id']}', '{rel['rel_type']}', '{rel['source_doc']}', {rel['confidence']})"
-
-            success, result = execute_sql(sql)
-            if success:
-                stats["relationships"] += 1
-            else:
-                stats["errors"].append(f"Relationship {rel['rel_id']}: {result[:100]}")
-
-        if stats["relationships"] % 50 == 0:
-            print(f"  Inserted {stats['relationships']} relationships...")
+            statements.append(f"INSERT INTO SQLUser.Relationship (RelationshipID, SourceEntityID, TargetEntityID, RelationType, SourceDocumentID, Confidence) VALUES ('{rel['rel_id']}', '{rel['source_id']}', '{rel['target_id']}', '{rel['rel_type']}', '{rel['source_doc']}', {rel['confidence']})")
+    insert_batched(statements, "Relationship", "relationships", stats)
 
     print(f"  Total relationships: {stats['relationships']}")
 
     # Insert Clinical Notes (without vectors for now - simpler)
     print("\nInserting Clinical Notes...")
+    statements = []
     for patient in patients:
         for note in patient["notes"]:
             text = note["text_content"].replace("'", "''")
             # Skip embedding for speed - just insert text
-            sql = f"INSERT INTO SQLUser.ClinicalNoteVectors (ResourceID, PatientID, DocumentType, TextContent, EmbeddingModel, SourceBundle, CreatedAt) VALUES ('{note['note_id']}', '{note['patient_id']}', '{note['document_type']}', '{text}', 'text-only', 'graphrag-populate', NOW())"
-
-            success, result = execute_sql(sql)
-            if success:
-                stats["notes"] += 1
-            else:
-                stats["errors"].append(f"Note {note['note_id']}: {result[:100]}")
-
-        if stats["notes"] % 20 == 0:
-            print(f"  Inserted {stats['notes']} notes...")
+            statements.append(f"INSERT INTO SQLUser.ClinicalNoteVectors (ResourceID, PatientID, DocumentType, TextContent, EmbeddingModel, SourceBundle, CreatedAt) VALUES ('{note['note_id']}', '{note['patient_id']}', '{note['document_type']}', '{text}', 'text-only', 'graphrag-populate', NOW())")
+    insert_batched(statements, "Note", "notes", stats)
 
     print(f"  Total notes: {stats['notes']}")
 
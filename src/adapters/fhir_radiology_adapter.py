@@ -10,7 +10,10 @@ Part of Feature 007: FHIR Radiology Integration
 import json
 import os
 import base64
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass
@@ -61,6 +64,17 @@ class FHIRRadiologyAdapter:
     MIMIC_SUBJECT_SYSTEM = "urn:mimic-cxr:subject"
     MIMIC_REPORT_SYSTEM = "urn:mimic-cxr:report"
 
+    # HTTP connection pool: keep-alive connections reused across calls, with
+    # retries (idempotent methods only) on rate limits and gateway errors
+    HTTP_POOL_SIZE = 32
+    HTTP_RETRIES = 3
+
+    # Availability probe: fail fast on an unreachable server, and once a probe
+    # fails skip probing that URL for PROBE_RETRY_AFTER seconds across instances
+    PROBE_TIMEOUT = (1.0, 3.0)
+    PROBE_RETRY_AFTER = 30
+    _probe_open_until: Dict[str, float] = {}
+
     # DICOM modality codes
     DICOM_MODALITY_SYSTEM = "http://dicom.nema.org/resources/ontology/DCM"
 
@@ -153,10 +167,24 @@ class FHIRRadiologyAdapter:
         )
         self._demo_mode = use_demo_mode
         self._fhir_available = None  # Cached availability check
+        # (patient_id, date) -> Encounter ID or None; a patient's studies share lookups
+        self._encounter_cache: Dict[tuple, Optional[str]] = {}
         self.session = requests.Session()
+        http_adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=self.HTTP_POOL_SIZE,
+            max_retries=Retry(
+                total=self.HTTP_RETRIES,
+                backoff_factor=0.3,
+                status_forcelist=[429, 502, 503, 504]
+            )
+        )
+        self.session.mount('http://', http_adapter)
+        self.session.mount('https://', http_adapter)
         self.session.headers.update({
             'Content-Type': 'application/fhir+json',
-            'Accept': 'application/fhir+json'
+            'Accept': 'application/fhir+json',
+            'Connection': 'keep-alive'
         })
 
         # Add Basic Auth for IRIS FHIR server
@@ -250,12 +278,25 @@ class FHIRRadiologyAdapter:
         if self._fhir_available is not None:
             return self._fhir_available
 
+        if time.monotonic() < self._probe_open_until.get(self.fhir_base_url, 0):
+            self._fhir_available = False
+            return False
+
+        # HEAD skips the multi-KB CapabilityStatement body; servers that
+        # reject HEAD get a streamed GET that is closed unread
+        metadata_url = f"{self.fhir_base_url}/metadata"
         try:
-            response = self.session.get(f"{self.fhir_base_url}/metadata", timeout=5)
+            response = self.session.head(metadata_url, timeout=self.PROBE_TIMEOUT, allow_redirects=True)
+            if response.status_code == 405:
+                with self.session.get(metadata_url, timeout=self.PROBE_TIMEOUT, stream=True) as response:
+                    pass
             self._fhir_available = response.status_code == 200
         except Exception:
             self._fhir_available = False
 
+        if not self._fhir_available:
+            self._probe_open_until[self.fhir_base_url] = time.monotonic() + self.PROBE_RETRY_AFTER
+
         return self._fhir_available
 
     @property
@@ -425,6 +466,44 @@ class FHIRRadiologyAdapter:
 
         return response.json()
 
+    def put_resources_transaction(self, resources: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        PUT many FHIR resources in a single transaction Bundle.
+
+        Each entry is an idempotent PUT by resource id, exactly as put_resource
+        would send it, but the whole set costs one round trip and is applied
+        atomically by the server.
+
+        Args:
+            resources: FHIR resource dicts, each with resourceType and id
+
+        Returns:
+            Server transaction-response Bundle as dict
+
+        Raises:
+            requests.HTTPError: If the transaction fails
+        """
+        bundle = {
+            "resourceType": "Bundle",
+            "type": "transaction",
+            "entry": [
+                {
+                    "fullUrl": f"{self.fhir_base_url}/{r['resourceType']}/{r['id']}",
+                    "resource": r,
+                    "request": {
+                        "method": "PUT",
+                        "url": f"{r['resourceType']}/{r['id']}"
+                    }
+                }
+                for r in resources
+            ]
+        }
+
+        response = self.session.post(self.fhir_base_url, json=bundle)
+        response.raise_for_status()
+
+        return response.json()
+
     def get_imaging_study(self, study_id: str) -> Optional[Dict[str, Any]]:
         """
         Get an ImagingStudy by MIMIC study ID.
@@ -450,6 +529,50 @@ class FHIRRadiologyAdapter:
             return entries[0].get("resource")
         return None
 
+    def get_imaging_studies(
+        self,
+        study_ids: List[str],
+        chunk_size: int = 50,
+        elements: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get ImagingStudies for many MIMIC study IDs with one search per chunk.
+
+        FHIR token search treats comma-separated values as OR, so each chunk of
+        chunk_size IDs costs a single GET instead of one per study.
+
+        Args:
+            study_ids: MIMIC-CXR study identifiers
+            chunk_size: IDs per search request (keeps URLs short)
+            elements: Optional _elements projection, e.g. "identifier" when only
+                      existence matters (must keep identifier for the mapping)
+
+        Returns:
+            Dict mapping study ID to ImagingStudy resource, for the studies that exist
+        """
+        found = {}
+        url = f"{self.fhir_base_url}/ImagingStudy"
+
+        for start in range(0, len(study_ids), chunk_size):
+            chunk = study_ids[start:start + chunk_size]
+            params = {
+                "identifier": ",".join(f"{self.MIMIC_STUDY_SYSTEM}|{sid}" for sid in chunk),
+                "_count": len(chunk)
+            }
+            if elements:
+                params["_elements"] = elements
+
+            response = self.session.get(url, params=params)
+            response.raise_for_status()
+
+            for entry in response.json().get("entry", []):
+                resource = entry.get("resource", {})
+                for identifier in resource.get("identifier", []):
+                    if identifier.get("system") == self.MIMIC_STUDY_SYSTEM:
+                        found[identifier.get("value")] = resource
+
+        return found
+
     def get_patient_imaging_studies(
         self,
         patient_id: str,
@@ -673,11 +796,17 @@ class FHIRRadiologyAdapter:
         Returns:
             Encounter ID if found, None otherwise
         """
+        # FHIR date search with ge (>=) and le (<=)
+        date_str = study_date.strftime("%Y-%m-%d")
+
+        # Misses are cached too, so a patient with no encounter is searched once
+        cache_key = (patient_id, date_str)
+        if cache_key in self._encounter_cache:
+            return self._encounter_cache[cache_key]
+
         url = f"{self.fhir_base_url}/Encounter"
 
         # Search for encounters around the study date
-        # FHIR date search with ge (>=) and le (<=)
-        date_str = study_date.strftime("%Y-%m-%d")
         params = {
             "subject": f"Patient/{patient_id}",
             "date": [f"ge{date_str}", f"le{date_str}"],
@@ -690,9 +819,9 @@ class FHIRRadiologyAdapter:
         bundle = response.json()
         entries = bundle.get("entry", [])
 
-        if entries:
-            return entries[0].get("resource", {}).get("id")
-        return None
+        encounter_id = entries[0].get("resource", {}).get("id") if entries else None
+        self._encounter_cache[cache_key] = encounter_id
+        return encounter_id
 
     def _get_modality_display(self, code: str) -> str:
         """Get display name for DICOM modality code."""
@@ -4,26 +4,28 @@ Usage: python -m src.cli check-health
        python -m src.cli --env aws check-health
 """
 
+import asyncio
 import sys
 import os
 import argparse
 import json
 import time
+from functools import lru_cache
 from typing import List, Optional, Dict
-from src.validation.health_checks import run_all_checks, HealthCheckResult
-from src.search.hybrid_search import HybridSearchService
-from src.setup.create_text_vector_table import create_text_vector_table
-from src.setup.create_knowledge_graph_tables_aws import create_tables_aws
-from src.setup.create_mimic_images_table import create_mimic_images_table
-from src.cli.chat import run_chat_cli
-from src.setup.reset_fhir_security import reset_security
 
+# Each command imports what it needs when it runs: the search, setup and chat
+# modules pull in the IRIS driver, NV-CLIP and the MCP server, none of which
+# --help or argument errors should pay for.
 
-def get_env_profiles() -> dict:
-    ec2_host = os.getenv("EC2_HOST", "")
-    
-    return {
-        "local": {
+
+ENV_PROFILE_NAMES = ("local", "aws", "ec2")
+
+
+@lru_cache(maxsize=None)
+def get_env_profile(profile_name: str) -> dict:
+    """Build the named profile; only the aws profile reads the environment."""
+    if profile_name == "local":
+        return {
             "IRIS_HOST": "localhost",
             "IRIS_PORT": "32782",
             "IRIS_NAMESPACE": "%SYS",
@@ -34,8 +36,10 @@ def get_env_profiles() -> dict:
             "NIM_PORT": "8001",
             "skip_gpu": True,
             "skip_docker_gpu": True,
-        },
-        "aws": {
+        }
+    if profile_name == "aws":
+        ec2_host = os.getenv("EC2_HOST", "")
+        return {
             "IRIS_HOST": ec2_host or os.getenv("IRIS_HOST", ""),
             "IRIS_PORT": os.getenv("IRIS_PORT", "1972"),
             "IRIS_NAMESPACE": "DEMO",
@@ -46,8 +50,9 @@ def get_env_profiles() -> dict:
             "NIM_PORT": "443",
             "skip_gpu": True,
             "skip_docker_gpu": True,
-        },
-        "ec2": {
+        }
+    if profile_name == "ec2":
+        return {
             "IRIS_HOST": "localhost",
             "IRIS_PORT": "1972",
             "IRIS_NAMESPACE": "%SYS",
@@ -58,19 +63,17 @@ def get_env_profiles() -> dict:
             "NIM_PORT": "8001",
             "skip_gpu": False,
             "skip_docker_gpu": False,
-        },
-    }
+        }
+    raise KeyError(profile_name)
 
 
 def apply_env_profile(profile_name: str) -> dict:
-    env_profiles = get_env_profiles()
-    
-    if profile_name not in env_profiles:
+    if profile_name not in ENV_PROFILE_NAMES:
         print(f"Unknown environment profile: {profile_name}", file=sys.stderr)
-        print(f"Available profiles: {', '.join(env_profiles.keys())}", file=sys.stderr)
+        print(f"Available profiles: {', '.join(ENV_PROFILE_NAMES)}", file=sys.stderr)
         sys.exit(1)
     
-    profile = env_profiles[profile_name]
+    profile = get_env_profile(profile_name)
     
     if profile_name == "aws" and not profile.get("IRIS_HOST"):
         print("Error: EC2_HOST or IRIS_HOST environment variable required for 'aws' profile", file=sys.stderr)
@@ -83,7 +86,7 @@ def apply_env_profile(profile_name: str) -> dict:
     
     return profile
 
-def format_report(results: List[HealthCheckResult], duration: float, smoke_test: Optional[Dict] = None) -> str:
+def format_report(results: List["HealthCheckResult"], duration: float, smoke_test: Optional[Dict] = None) -> str:
     """Format health check results as JSON."""
     all_passed = all(r.status == "pass" for r in results)
     if smoke_test and smoke_test.get("status") == "fail":
@@ -98,39 +101,47 @@ def format_report(results: List[HealthCheckResult], duration: float, smoke_test:
         report["smoke_test"] = smoke_test
     return json.dumps(report, indent=2)
 
+def run_smoke_test() -> Dict:
+    """Run a minimal end-to-end search and summarize the outcome."""
+    try:
+        from src.search.hybrid_search import HybridSearchService
+        service = HybridSearchService()
+        search_results = service.search("hypertension", top_k=1)
+        smoke_test_result = {
+            "status": "pass",
+            "results_count": search_results.get("results_count", 0),
+            "top_result_id": search_results["top_documents"][0]["fhir_id"] if search_results["top_documents"] else None
+        }
+        service.close()
+    except Exception as e:
+        smoke_test_result = {
+            "status": "fail",
+            "error": str(e)
+        }
+    return smoke_test_result
+
+async def gather_health(args, profile: dict):
+    """Run the smoke test (if requested) alongside the health checks."""
+    from src.validation.health_checks import run_all_checks_async
+
+    checks = run_all_checks_async(
+        skip_gpu=profile.get("skip_gpu", False),
+        skip_docker=profile.get("skip_docker_gpu", False),
+        nim_host=profile.get("NIM_HOST", "localhost"),
+        nim_port=int(profile.get("NIM_PORT", 8001))
+    )
+    if not args.smoke_test:
+        return await checks, None
+
+    results, smoke_test_result = await asyncio.gather(checks, asyncio.to_thread(run_smoke_test))
+    return results, smoke_test_result
+
 def check_health_command(args, profile: dict):
     """Execute the check-health command."""
     start_time = time.time()
-    
-    smoke_test_result = None
-    if args.smoke_test:
-        try:
-            service = HybridSearchService()
-            search_results = service.search("hypertension", top_k=1)
-            smoke_test_result = {
-                "status": "pass",
-                "results_count": search_results.get("results_count", 0),
-                "top_result_id": search_results["top_documents"][0]["fhir_id"] if search_results["top_documents"] else None
-            }
-            service.close()
-        except Exception as e:
-            smoke_test_result = {
-                "status": "fail",
-                "error": str(e)
-            }
 
     try:
-        skip_gpu = profile.get("skip_gpu", False)
-        skip_docker = profile.get("skip_docker_gpu", False)
-        nim_host = profile.get("NIM_HOST", "localhost")
-        nim_port = int(profile.get("NIM_PORT", 8001))
-        
-        results = run_all_checks(
-            skip_gpu=skip_gpu,
-            skip_docker=skip_docker,
-            nim_host=nim_host,
-            nim_port=nim_port
-        )
+        results, smoke_test_result = asyncio.run(gather_health(args, profile))
         duration = time.time() - start_time
         
         print(format_report(results, duration, smoke_test_result))
@@ -154,6 +165,11 @@ def fix_environment_command(args):
     """Execute the fix-environment command."""
     print("Fixing environment...")
     try:
+        from src.setup.create_text_vector_table import create_text_vector_table
+        from src.setup.create_knowledge_graph_tables_aws import create_tables_aws
+        from src.setup.create_mimic_images_table import create_mimic_images_table
+        from src.setup.reset_fhir_security import reset_security
+
         # Load config path from environment or use default
         config_path = os.getenv("CONFIG_PATH", "config/fhir_graphrag_config.aws.yaml")
         
@@ -178,8 +194,8 @@ def fix_environment_command(args):
         sys.exit(1)
 
 def chat_command(args):
-    import asyncio
     try:
+        from src.cli.chat import run_chat_cli
         asyncio.run(run_chat_cli(args.query, provider=args.provider, verbose=not args.quiet))
     except Exception as e:
         print(f"❌ Chat error: {e}")
@@ -187,6 +203,7 @@ def chat_command(args):
 
 def reset_security_command(args):
     try:
+        from src.setup.reset_fhir_security import reset_security
         if reset_security(args.username, args.password, args.fhir_app):
             print("✅ Security reset successful")
         else:
@@ -196,37 +213,57 @@ def reset_security_command(args):
         print(f"❌ Error during security reset: {e}")
         sys.exit(1)
 
+def _add_check_health_parser(subparsers):
+    health_parser = subparsers.add_parser("check-health", help="Verify system health and schema")
+    health_parser.add_argument("--smoke-test", action="store_true", help="Perform a minimal end-to-end search test")
+
+def _add_fix_environment_parser(subparsers):
+    subparsers.add_parser("fix-environment", help="Attempt to fix environment issues (missing tables, etc.)")
+
+def _add_chat_parser(subparsers):
+    chat_parser = subparsers.add_parser("chat", help="Perform an agentic query via terminal")
+    chat_parser.add_argument("query", help="Query to perform")
+    chat_parser.add_argument("--provider", choices=["nim", "openai", "bedrock"], default="nim", help="LLM provider")
+    chat_parser.add_argument("--quiet", action="store_true", help="Hide tool traces")
+
+def _add_reset_security_parser(subparsers):
+    reset_parser = subparsers.add_parser("reset-security", help="Deep reset of IRIS FHIR security settings")
+    reset_parser.add_argument("--username", default="_SYSTEM", help="Target username")
+    reset_parser.add_argument("--password", default="SYS", help="New password")
+    reset_parser.add_argument("--fhir-app", default="/csp/healthshare/demo/fhir/r4", help="FHIR CSP Application path")
+
+SUBCOMMAND_PARSERS = {
+    "check-health": _add_check_health_parser,
+    "fix-environment": _add_fix_environment_parser,
+    "chat": _add_chat_parser,
+    "reset-security": _add_reset_security_parser,
+}
+
+def _sniff_subcommand(argv: List[str]) -> Optional[str]:
+    """Return the first known subcommand named in argv, if any."""
+    return next((a for a in argv if a in SUBCOMMAND_PARSERS), None)
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Medical GraphRAG CLI")
     
     parser.add_argument(
         "--env", 
-        choices=["local", "aws", "ec2"], 
+        choices=ENV_PROFILE_NAMES, 
         default="aws",
         help="Environment profile: local (Docker on Mac), aws (remote EC2), ec2 (on EC2 instance)"
     )
     
     subparsers = parser.add_subparsers(dest="command", help="Command to execute")
     
-    # check-health
-    health_parser = subparsers.add_parser("check-health", help="Verify system health and schema")
-    health_parser.add_argument("--smoke-test", action="store_true", help="Perform a minimal end-to-end search test")
-    
-    # fix-environment
-    subparsers.add_parser("fix-environment", help="Attempt to fix environment issues (missing tables, etc.)")
-    
-    # chat
-    chat_parser = subparsers.add_parser("chat", help="Perform an agentic query via terminal")
-    chat_parser.add_argument("query", help="Query to perform")
-    chat_parser.add_argument("--provider", choices=["nim", "openai", "bedrock"], default="nim", help="LLM provider")
-    chat_parser.add_argument("--quiet", action="store_true", help="Hide tool traces")
-    
-    # reset-security
-    reset_parser = subparsers.add_parser("reset-security", help="Deep reset of IRIS FHIR security settings")
-    reset_parser.add_argument("--username", default="_SYSTEM", help="Target username")
-    reset_parser.add_argument("--password", default="SYS", help="New password")
-    reset_parser.add_argument("--fhir-app", default="/csp/healthshare/demo/fhir/r4", help="FHIR CSP Application path")
+    # Only the requested subcommand's parser is built; top-level help, a missing
+    # command or a typo gets all of them so usage and errors list every choice
+    command = _sniff_subcommand(sys.argv[1:])
+    if command:
+        SUBCOMMAND_PARSERS[command](subparsers)
+    else:
+        for add_parser in SUBCOMMAND_PARSERS.values():
+            add_parser(subparsers)
     
     args = parser.parse_args()
     
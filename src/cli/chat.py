@@ -6,7 +6,8 @@ Provides a terminal-based interface to perform queries and see tool traces.
 import sys
 import os
 import json
-import asyncio
+import reprlib
+from functools import cached_property
 from typing import List, Dict, Any, Optional
 
 # Load .env file
@@ -26,9 +27,15 @@ MCP_SERVER_PATH = os.path.join(PROJECT_ROOT, 'mcp-server')
 if MCP_SERVER_PATH not in sys.path:
     sys.path.insert(0, MCP_SERVER_PATH)
 
+# Faster decoding of large tool results (image lists, fused documents)
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 from src.embeddings.embedder_singleton import get_embedder
 from src.memory import VectorMemory
-from fhir_graphrag_mcp_server import call_tool
+from fhir_graphrag_mcp_server import call_tool, list_tools
 
 SYSTEM_PROMPT = """You are a helpful and accurate medical assistant. 
 You have access to a variety of tools to search FHIR documents, query a knowledge graph, and generate visualizations.
@@ -43,48 +50,67 @@ CRITICAL INSTRUCTIONS:
 7. When summarizing results, be concise and refer to the specific data returned by the tools.
 """
 
+# Traces show at most 500 characters of a tool result; a size-limited repr keeps
+# large results (document lists, image batches) from being fully stringified first
+_TRACE_REPR = reprlib.Repr()
+_TRACE_REPR.maxlevel = 4
+_TRACE_REPR.maxdict = 6
+_TRACE_REPR.maxlist = 6
+_TRACE_REPR.maxstring = 100
+_TRACE_REPR.maxother = 100
+
 class ChatCLI:
     def __init__(self, provider: str = "nim", model: Optional[str] = None):
         self.provider = provider
         self.model = model or os.getenv("NIM_LLM_MODEL", "meta/llama-3.1-8b-instruct")
-        self.messages = []
+        # The system prompt is the first message so each turn can send the
+        # history as-is instead of copying it behind a fresh system message
+        self.messages = [{"role": "system", "content": SYSTEM_PROMPT}]
         self.memory = VectorMemory(embedding_model=get_embedder())
+        self._tools = None
         
     def _print_trace(self, iteration: int, tool_name: str, tool_input: Dict[str, Any], result: Any):
         print(f"\n[TRACE] Iteration {iteration}: Executing {tool_name}")
         print(f"  Input: {json.dumps(tool_input, indent=2)}")
-        result_str = str(result)
+        result_str = _TRACE_REPR.repr(result)
         if len(result_str) > 500:
             result_str = result_str[:500] + "... (truncated)"
         print(f"  Result: {result_str}")
 
-    async def _call_llm(self, messages: List[Dict[str, Any]], tools: Optional[List[Dict[str, Any]]] = None) -> Any:
-        from openai import OpenAI
-        base_url = os.getenv("NIM_LLM_URL", "http://localhost:8001/v1")
-        api_key = os.getenv("NVIDIA_API_KEY", "not-needed")
-        client = OpenAI(base_url=base_url, api_key=api_key)
-        
-        full_messages = [{"role": "system", "content": SYSTEM_PROMPT}] + messages
-        
-        openai_tools = []
-        if tools:
-            for tool in tools:
-                openai_tools.append({
+    async def _get_tools(self) -> List[Dict[str, Any]]:
+        """OpenAI function-tool specs; the MCP tool list is fixed, so they're built once."""
+        if self._tools is None:
+            self._tools = [
+                {
                     "type": "function",
                     "function": {
-                        "name": tool["toolSpec"]["name"],
-                        "description": tool["toolSpec"]["description"],
-                        "parameters": tool["toolSpec"]["inputSchema"]["json"]
+                        "name": t.name,
+                        "description": t.description,
+                        "parameters": t.inputSchema
                     }
-                })
+                }
+                for t in await list_tools()
+            ]
+        return self._tools
+
+    @cached_property
+    def _client(self):
+        """OpenAI-compatible client, created on the first LLM call and reused for every turn."""
+        from openai import OpenAI
+        base_url = os.getenv("NIM_LLM_URL", "http://localhost:8001/v1")
+        api_key = os.getenv("NVIDIA_API_KEY", "not-needed")
+        return OpenAI(base_url=base_url, api_key=api_key)
+
+    async def _call_llm(self, messages: List[Dict[str, Any]], tools: Optional[List[Dict[str, Any]]] = None) -> Any:
+        client = self._client
         
         params = {
             "model": self.model,
-            "messages": full_messages,
+            "messages": messages,
             "temperature": 0.0,
         }
-        if openai_tools:
-            params["tools"] = openai_tools
+        if tools:
+            params["tools"] = tools
             
         response = client.chat.completions.create(**params)
         return response.choices[0].message
@@ -92,13 +118,11 @@ class ChatCLI:
     async def query(self, user_query: str, verbose: bool = True):
         print(f"\n>>> Query: {user_query}")
         
-        memories = self.memory.recall(user_query, top_k=3)
+        memories = self.memory.recall(user_query, top_k=3, min_similarity=0.3)
         memory_context = ""
         if memories:
             memory_context = "\n[RECALLED MEMORY]\n"
-            for m in memories:
-                if m['similarity'] > 0.3:
-                    memory_context += f"- {m['text']}\n"
+            memory_context += "".join(f"- {m['text']}\n" for m in memories)
             memory_context += "[END MEMORY]\n\n"
             if verbose:
                 print(memory_context)
@@ -106,21 +130,10 @@ class ChatCLI:
         current_query = memory_context + user_query
         self.messages.append({"role": "user", "content": current_query})
         
+        tools = await self._get_tools()
         max_iterations = 10
         for i in range(max_iterations):
-            from fhir_graphrag_mcp_server import list_tools
-            available_tools = await list_tools()
-            converse_tools = []
-            for t in available_tools:
-                converse_tools.append({
-                    "toolSpec": {
-                        "name": t.name,
-                        "description": t.description,
-                        "inputSchema": {"json": t.inputSchema}
-                    }
-                })
-            
-            message = await self._call_llm(self.messages, converse_tools)
+            message = await self._call_llm(self.messages, tools)
             self.messages.append(message)
             
             if not message.tool_calls:
@@ -135,7 +148,7 @@ class ChatCLI:
                 t_input = json.loads(tc.function.arguments)
                 
                 result = await call_tool(t_name, t_input)
-                result_data = json.loads(result[0].text)
+                result_data = json_loads(result[0].text)
                 
                 if verbose:
                     self._print_trace(i+1, t_name, t_input, result_data)
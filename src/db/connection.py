@@ -8,6 +8,9 @@ for local Docker IRIS instance (used on EC2 deployment).
 import os
 import sys
 import time
+import queue
+import random
+import threading
 import importlib
 from typing import Optional, Any
 
@@ -21,6 +24,12 @@ except ImportError:
     pass
 
 
+# Connection retry backoff: base * 2**attempt seconds, capped, then jittered
+# by +/-50% so clients that failed together don't retry in lockstep
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 30.0
+
+
 class DatabaseConnection:
     """
     IRIS database connection manager with environment-based configuration.
@@ -72,7 +81,6 @@ class DatabaseConnection:
                 config[k] = v
         
         max_retries = 3
-        retry_delay = 1
         
         last_error = None
         for attempt in range(max_retries):
@@ -120,9 +128,9 @@ class DatabaseConnection:
             except Exception as e:
                 last_error = e
                 if attempt < max_retries - 1:
-                    print(f"Warning: IRIS connection attempt {attempt+1} failed ({e}). Retrying in {retry_delay}s...", file=sys.stderr)
+                    retry_delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** attempt)) * random.uniform(0.5, 1.5)
+                    print(f"Warning: IRIS connection attempt {attempt+1} failed ({e}). Retrying in {retry_delay:.1f}s...", file=sys.stderr)
                     time.sleep(retry_delay)
-                    retry_delay *= 2 # Exponential backoff
                 else:
                     # Final attempt failed
                     break
@@ -159,6 +167,108 @@ def get_connection() -> Any:
     return DatabaseConnection.get_connection()
 
 
+# Pool settings: at most POOL_SIZE connections are open at once, and a connection
+# that has sat idle longer than POOL_RECYCLE seconds is re-opened before reuse
+POOL_SIZE = int(os.getenv('IRIS_POOL_SIZE', '8'))
+POOL_RECYCLE = 1800
+
+
+class PooledConnection:
+    """
+    Connection borrowed from a ConnectionPool.
+
+    Behaves like the underlying DBAPI connection, except that close() hands it
+    back to the pool (rolling back anything uncommitted) instead of closing it.
+    """
+
+    def __init__(self, pool: 'ConnectionPool', conn: Any):
+        self._pool = pool
+        self._conn = conn
+
+    def __getattr__(self, name):
+        if self._conn is None:
+            raise ConnectionError("Connection has already been returned to the pool")
+        return getattr(self._conn, name)
+
+    def close(self):
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            self._pool.release(conn)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of IRIS connections, opened lazily up to size.
+
+    Long-running processes such as the MCP server borrow a connection per
+    request instead of paying the connect handshake each time.
+    """
+
+    def __init__(self, size: int = POOL_SIZE, recycle: float = POOL_RECYCLE):
+        self.recycle = recycle
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def get(self, timeout: Optional[float] = None) -> PooledConnection:
+        """
+        Borrow a connection, blocking (up to timeout seconds) while all are in use.
+
+        Raises:
+            TimeoutError: If no connection became free within timeout
+        """
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError("Timed out waiting for a pooled IRIS connection")
+        try:
+            try:
+                conn, last_used = self._idle.get_nowait()
+                if time.monotonic() - last_used > self.recycle:
+                    self._close_quietly(conn)
+                    conn = get_connection()
+            except queue.Empty:
+                conn = get_connection()
+        except Exception:
+            self._slots.release()
+            raise
+        return PooledConnection(self, conn)
+
+    def release(self, conn: Any):
+        """Return a connection; one that can't roll back cleanly is discarded."""
+        try:
+            conn.rollback()
+            self._idle.put((conn, time.monotonic()))
+        except Exception:
+            self._close_quietly(conn)
+        finally:
+            self._slots.release()
+
+    @staticmethod
+    def _close_quietly(conn: Any):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pooled_connection(timeout: Optional[float] = None) -> PooledConnection:
+    """Borrow a connection from the module-level pool; close() returns it."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool()
+    return _pool.get(timeout=timeout)
+
+
 if __name__ == '__main__':
     # Test connection
     print("Testing IRIS database connection...")
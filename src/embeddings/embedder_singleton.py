@@ -4,6 +4,7 @@ Global singleton for NV-CLIP embedder to break circular dependencies.
 
 import sys
 import os
+import threading
 from typing import Optional
 
 # Add project root to path for imports
@@ -13,6 +14,36 @@ if PROJECT_ROOT not in sys.path:
 
 # Lazy import to avoid initialization issues
 _embedder = None
+_lock = threading.Lock()
+# Stored in _embedder when initialization failed, so later calls don't retry it
+_FAILED = object()
+
+
+def _init():
+    """Build the embedder from config; returns _FAILED if that isn't possible."""
+    try:
+        # Local imports to avoid circular issues
+        from src.embeddings.nvclip_embeddings import NVCLIPEmbeddings
+        from src.search.base import BaseSearchService
+        
+        # Load config via base service
+        base_service = BaseSearchService()
+        config = base_service.config
+        
+        nvclip_config = config.get('nvclip', {})
+        base_url = nvclip_config.get('base_url')
+        
+        if base_url:
+            print(f"Initializing NV-CLIP Singleton with base_url: {base_url}", file=sys.stderr)
+            return NVCLIPEmbeddings(base_url=base_url)
+        return NVCLIPEmbeddings()
+            
+    except ImportError as e:
+        print(f"Warning: Could not import NVCLIPEmbeddings: {e}", file=sys.stderr)
+    except Exception as e:
+        print(f"Warning: Failed to initialize NV-CLIP Singleton: {e}", file=sys.stderr)
+    return _FAILED
+
 
 def get_embedder():
     """
@@ -20,31 +51,15 @@ def get_embedder():
     
     This singleton breaks the circular dependency between search services,
     caching modules, and the MCP server.
+
+    Safe to call from several threads: initialization runs at most once, and
+    a failed initialization is remembered (None is returned from then on).
     """
     global _embedder
     
     if _embedder is None:
-        try:
-            # Local imports to avoid circular issues
-            from src.embeddings.nvclip_embeddings import NVCLIPEmbeddings
-            from src.search.base import BaseSearchService
-            
-            # Load config via base service
-            base_service = BaseSearchService()
-            config = base_service.config
-            
-            nvclip_config = config.get('nvclip', {})
-            base_url = nvclip_config.get('base_url')
-            
-            if base_url:
-                print(f"Initializing NV-CLIP Singleton with base_url: {base_url}", file=sys.stderr)
-                _embedder = NVCLIPEmbeddings(base_url=base_url)
-            else:
-                _embedder = NVCLIPEmbeddings()
-                
-        except ImportError as e:
-            print(f"Warning: Could not import NVCLIPEmbeddings: {e}", file=sys.stderr)
-        except Exception as e:
-            print(f"Warning: Failed to initialize NV-CLIP Singleton: {e}", file=sys.stderr)
+        with _lock:
+            if _embedder is None:
+                _embedder = _init()
             
-    return _embedder
+    return None if _embedder is _FAILED else _embedder
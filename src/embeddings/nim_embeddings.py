@@ -9,12 +9,41 @@ import os
 import logging
 from typing import List
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .base_embeddings import BaseEmbeddings
 
 logger = logging.getLogger(__name__)
 
 
+def create_session(pool_size: int = 32) -> requests.Session:
+    """
+    Create a requests session with a pooled, retrying HTTP adapter.
+
+    Reusing the session keeps TCP/TLS connections open between calls
+    instead of paying a fresh handshake for every embedding request.
+
+    Args:
+        pool_size: Connections kept open per host
+
+    Returns:
+        Configured requests.Session
+    """
+    retry = Retry(
+        total=5,
+        backoff_factor=2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "POST"]
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Content-Type": "application/json"})
+    return session
+
+
 class NIMEmbeddings(BaseEmbeddings):
     """Self-hosted NIM embeddings adapter."""
 
@@ -45,7 +74,10 @@ class NIMEmbeddings(BaseEmbeddings):
         # NV-EmbedQA-E5-v5 is 1024-dimensional
         self._dimension = 1024
 
-        # Test connection
+        # One pooled session for every request this adapter makes
+        self.session = create_session()
+
+        # Test connection (plain request: a down endpoint should fail fast, not retry)
         self._test_connection()
 
         logger.info(f"NIM embeddings initialized: endpoint={endpoint}, model={model}, dimension={self._dimension}")
@@ -97,14 +129,13 @@ class NIMEmbeddings(BaseEmbeddings):
             raise ValueError("Cannot embed empty text")
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.endpoint,
                 json={
                     "input": text,
                     "model": self._model_name,
                     "input_type": "query"
                 },
-                headers={"Content-Type": "application/json"},
                 timeout=30
             )
             response.raise_for_status()
@@ -138,14 +169,13 @@ class NIMEmbeddings(BaseEmbeddings):
             raise ValueError("All texts are empty")
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.endpoint,
                 json={
                     "input": valid_texts,
                     "model": self._model_name,
                     "input_type": "passage"
                 },
-                headers={"Content-Type": "application/json"},
                 timeout=60
             )
             response.raise_for_status()
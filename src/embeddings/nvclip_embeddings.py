@@ -225,6 +225,34 @@ class NVCLIPEmbeddings:
                 return response.data[0].embedding
             raise e
 
+    def embed_texts(self, texts: List[str], batch_size: int = 32) -> List[List[float]]:
+        """
+        Generate embeddings for multiple text queries.
+
+        Unlike embed_images, the NV-CLIP endpoint accepts a list of texts,
+        so each chunk of batch_size texts is a single API request.
+
+        Args:
+            texts: Text queries
+            batch_size: Number of texts sent per request
+
+        Returns:
+            List of 1024-dimensional embedding vectors, in input order
+        """
+        all_embeddings = []
+
+        for start in range(0, len(texts), batch_size):
+            response = self.client.embeddings.create(
+                input=texts[start:start + batch_size],
+                model=self.model,
+                encoding_format="float"
+            )
+            # Results carry their input index; don't rely on response order
+            for item in sorted(response.data, key=lambda d: d.index):
+                all_embeddings.append(item.embedding)
+
+        return all_embeddings
+
     def similarity(self, embedding1: List[float], embedding2: List[float]) -> float:
         """
         Calculate cosine similarity between two embeddings.
@@ -245,6 +273,27 @@ class NVCLIPEmbeddings:
         return float(similarity)
 
 
+def quantize_embedding(embedding: List[float], dtype=np.float16) -> np.ndarray:
+    """
+    L2-normalize an embedding and round it to a smaller float type.
+
+    Cosine similarity on unit vectors barely moves at fp16 precision, while
+    each value formats to far fewer digits when sent to TO_VECTOR.
+
+    Args:
+        embedding: Raw embedding vector
+        dtype: Target numpy float type
+
+    Returns:
+        Normalized embedding as a numpy array of dtype
+    """
+    vec = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vec)
+    if norm > 0:
+        vec = vec / norm
+    return vec.astype(dtype)
+
+
 # Factory integration
 def create_nvclip_embeddings(api_key: str = None) -> NVCLIPEmbeddings:
     """Factory function to create NV-CLIP embeddings."""
@@ -229,7 +229,9 @@ class VectorMemory:
         cursor = conn.cursor()
 
         try:
-            # Build SQL with optional type filter (same pattern as image search)
+            # Build SQL with optional type filter (same pattern as image search).
+            # The similarity threshold is applied in IRIS so memories below it
+            # are never fetched or have their metadata parsed.
             if memory_type:
                 sql = """
                     SELECT TOP ?
@@ -237,18 +239,20 @@ class VectorMemory:
                         VECTOR_COSINE(Embedding, TO_VECTOR(?, DOUBLE)) AS Similarity
                     FROM SQLUser.AgentMemoryVectors
                     WHERE MemoryType = ?
+                      AND VECTOR_COSINE(Embedding, TO_VECTOR(?, DOUBLE)) >= ?
                     ORDER BY Similarity DESC
                 """
-                cursor.execute(sql, (top_k * 2, embedding_str, memory_type))
+                cursor.execute(sql, (top_k, embedding_str, memory_type, embedding_str, min_similarity))
             else:
                 sql = """
                     SELECT TOP ?
                         MemoryID, MemoryType, MemoryText, Metadata, UseCount,
                         VECTOR_COSINE(Embedding, TO_VECTOR(?, DOUBLE)) AS Similarity
                     FROM SQLUser.AgentMemoryVectors
+                    WHERE VECTOR_COSINE(Embedding, TO_VECTOR(?, DOUBLE)) >= ?
                     ORDER BY Similarity DESC
                 """
-                cursor.execute(sql, (top_k * 2, embedding_str))
+                cursor.execute(sql, (top_k, embedding_str, embedding_str, min_similarity))
 
             results = []
             for row in cursor.fetchall():
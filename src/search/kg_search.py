@@ -124,11 +124,9 @@ class KGSearchService(BaseSearchService):
         """Get KG statistics."""
         _, cursor = self.connect()
         
-        cursor.execute("SELECT COUNT(*) FROM RAG.Entities")
-        total_entities = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM RAG.EntityRelationships")
-        total_rels = cursor.fetchone()[0]
+        # Both totals in one round trip
+        cursor.execute("SELECT (SELECT COUNT(*) FROM RAG.Entities), (SELECT COUNT(*) FROM RAG.EntityRelationships)")
+        total_entities, total_rels = cursor.fetchone()
         
         cursor.execute("SELECT EntityType, COUNT(*) as count FROM RAG.Entities GROUP BY EntityType")
         distribution = [{"type": row[0], "count": row[1]} for row in cursor.fetchall()]
@@ -36,16 +36,17 @@ CREATE TABLE RAG.Entities (
   Confidence FLOAT NOT NULL,
   EmbeddingVector VECTOR(DOUBLE, 384),
   ExtractedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-  ExtractedBy VARCHAR(100) DEFAULT 'hybrid'
+  ExtractedBy VARCHAR(100) DEFAULT 'hybrid',
+  CONSTRAINT uq_entity UNIQUE (ResourceID, EntityText, EntityType)
 )
 """
 
 # Indexes for RAG.Entities
 # Note: Vector index syntax TBD - skipping for now, can add later with correct IRIS syntax
+# ResourceID lookups use the uq_entity constraint's index (ResourceID leads it)
 CREATE_ENTITIES_INDEXES = [
     "CREATE INDEX idx_entities_type ON RAG.Entities(EntityType)",
-    "CREATE INDEX idx_entities_confidence ON RAG.Entities(Confidence)",
-    "CREATE INDEX idx_entities_resource ON RAG.Entities(ResourceID)"
+    "CREATE INDEX idx_entities_confidence ON RAG.Entities(Confidence)"
     # Vector index on EmbeddingVector to be added once correct IRIS syntax is determined
 ]
 
@@ -60,14 +61,15 @@ CREATE TABLE RAG.EntityRelationships (
   ResourceID BIGINT NOT NULL,
   Confidence FLOAT NOT NULL,
   ExtractedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-  Context VARCHAR(1000)
+  Context VARCHAR(1000),
+  CONSTRAINT uq_relationship UNIQUE (ResourceID, SourceEntityID, TargetEntityID, RelationshipType)
 )
 """
 
 # Indexes for RAG.EntityRelationships
+# SourceEntityID lookups use idx_relationships_source_type (SourceEntityID leads it)
 CREATE_RELATIONSHIPS_INDEXES = [
     "CREATE INDEX idx_relationships_type ON RAG.EntityRelationships(RelationshipType)",
-    "CREATE INDEX idx_relationships_source ON RAG.EntityRelationships(SourceEntityID)",
     "CREATE INDEX idx_relationships_target ON RAG.EntityRelationships(TargetEntityID)",
     "CREATE INDEX idx_relationships_source_type ON RAG.EntityRelationships(SourceEntityID, RelationshipType)"
 ]
@@ -117,10 +119,8 @@ def create_tables():
 
         # Verify table creation
         print("\n[INFO] Verifying table creation...")
-        cursor.execute("SELECT COUNT(*) FROM RAG.Entities")
-        entities_count = cursor.fetchone()[0]
-        cursor.execute("SELECT COUNT(*) FROM RAG.EntityRelationships")
-        relationships_count = cursor.fetchone()[0]
+        cursor.execute("SELECT (SELECT COUNT(*) FROM RAG.Entities), (SELECT COUNT(*) FROM RAG.EntityRelationships)")
+        entities_count, relationships_count = cursor.fetchone()
 
         print(f"[INFO] ✅ RAG.Entities table verified (current rows: {entities_count})")
         print(f"[INFO] ✅ RAG.EntityRelationships table verified (current rows: {relationships_count})")
@@ -4,6 +4,11 @@ Create MIMIC-CXR Images Table in IRIS (Repeatable)
 
 Creates the VectorSearch.MIMICCXRImages table with proper vector support
 for NV-CLIP embeddings. Idempotent - safe to run multiple times.
+
+Vectors are stored as VECTOR(FLOAT, 1024): NV-CLIP embeddings are fp32 at
+best (and fp16-rounded at ingestion), so DOUBLE would only double the bytes.
+Tables created with the older DOUBLE column can be converted in place with
+--migrate-float.
 """
 
 import sys
@@ -16,6 +21,40 @@ if parent_dir not in sys.path:
 
 from src.db.connection import get_connection
 
+# Secondary indexes on VectorSearch.MIMICCXRImages, by index name
+MIMIC_INDEXES = {
+    'idx_mimic_study': 'StudyID',
+    'idx_mimic_subject': 'SubjectID',
+    # Covers the per-subject GROUP BY StudyID lookups in import_radiology_fhir
+    'idx_mimic_subject_study': 'SubjectID, StudyID',
+    'idx_mimic_view': 'ViewPosition',
+}
+
+
+def create_missing_indexes(cursor) -> list:
+    """
+    Create whichever MIMIC_INDEXES are not already on the table.
+
+    Existing indexes are read with one INFORMATION_SCHEMA query, so a re-run
+    issues no DDL at all and a half-finished earlier run is completed. Real
+    CREATE INDEX failures propagate instead of being swallowed.
+
+    Returns:
+        Names of the indexes created
+    """
+    cursor.execute("""
+        SELECT INDEX_NAME FROM INFORMATION_SCHEMA.INDEXES
+        WHERE TABLE_SCHEMA = 'VectorSearch' AND TABLE_NAME = 'MIMICCXRImages'
+    """)
+    existing = {row[0].lower() for row in cursor.fetchall()}
+
+    created = []
+    for index_name, column in MIMIC_INDEXES.items():
+        if index_name.lower() not in existing:
+            cursor.execute(f"CREATE INDEX {index_name} ON VectorSearch.MIMICCXRImages({column})")
+            created.append(index_name)
+    return created
+
 
 def create_mimic_images_table(drop_existing=False):
     """
@@ -59,6 +98,10 @@ def create_mimic_images_table(drop_existing=False):
                 table_exists = False
             else:
                 print("✅ MIMICCXRImages table already exists")
+                created = create_missing_indexes(cursor)
+                if created:
+                    conn.commit()
+                    print(f"✅ Created missing indexes: {', '.join(created)}")
                 # Check row count
                 cursor.execute("SELECT COUNT(*) FROM VectorSearch.MIMICCXRImages")
                 count = cursor.fetchone()[0]
@@ -75,30 +118,18 @@ def create_mimic_images_table(drop_existing=False):
                     SubjectID VARCHAR(255) NOT NULL,
                     ViewPosition VARCHAR(50),
                     ImagePath VARCHAR(1000),
-                    Vector VECTOR(DOUBLE, 1024),
+                    Vector VECTOR(FLOAT, 1024),
                     Metadata VARCHAR(4000),
                     CreatedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     UpdatedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
 
-            conn.commit()
             print("✅ MIMICCXRImages table created successfully")
 
             # Create indexes for performance
             print("📑 Creating indexes...")
-
-            cursor.execute("""
-                CREATE INDEX idx_mimic_study ON VectorSearch.MIMICCXRImages(StudyID)
-            """)
-
-            cursor.execute("""
-                CREATE INDEX idx_mimic_subject ON VectorSearch.MIMICCXRImages(SubjectID)
-            """)
-
-            cursor.execute("""
-                CREATE INDEX idx_mimic_view ON VectorSearch.MIMICCXRImages(ViewPosition)
-            """)
+            create_missing_indexes(cursor)
 
             conn.commit()
             print("✅ Indexes created")
@@ -112,7 +143,7 @@ def create_mimic_images_table(drop_existing=False):
         print("  - SubjectID (VARCHAR(255)) - Patient identifier")
         print("  - ViewPosition (VARCHAR(50)) - PA, AP, LATERAL, etc.")
         print("  - ImagePath (VARCHAR(1000)) - Path to DICOM file")
-        print("  - Vector (VECTOR(DOUBLE, 1024)) - NV-CLIP embedding")
+        print("  - Vector (VECTOR(FLOAT, 1024)) - NV-CLIP embedding")
         print("  - Metadata (VARCHAR(4000)) - JSON metadata")
         print("  - CreatedAt/UpdatedAt - Timestamps")
         print("\nIndexes:")
@@ -133,6 +164,60 @@ def create_mimic_images_table(drop_existing=False):
         conn.close()
 
 
+def migrate_vector_column_to_float(batch_size: int = 500):
+    """
+    Convert an existing VECTOR(DOUBLE, 1024) Vector column to VECTOR(FLOAT, 1024).
+
+    Copies every row into a new FLOAT column in batches, then swaps the
+    columns, so the table stays readable until the final rename.
+
+    Args:
+        batch_size: Rows converted per UPDATE batch and commit
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        print("📐 Adding VECTOR(FLOAT, 1024) column...")
+        cursor.execute("ALTER TABLE VectorSearch.MIMICCXRImages ADD VectorFloat VECTOR(FLOAT, 1024)")
+        conn.commit()
+
+        converted = 0
+        while True:
+            cursor.execute(f"""
+                SELECT TOP {batch_size} ImageID, Vector
+                FROM VectorSearch.MIMICCXRImages
+                WHERE VectorFloat IS NULL AND Vector IS NOT NULL
+            """)
+            rows = cursor.fetchall()
+            if not rows:
+                break
+
+            cursor.executemany("""
+                UPDATE VectorSearch.MIMICCXRImages
+                SET VectorFloat = TO_VECTOR(?, FLOAT)
+                WHERE ImageID = ?
+            """, [(str(vector), image_id) for image_id, vector in rows])
+            conn.commit()
+
+            converted += len(rows)
+            print(f"   Converted {converted} rows")
+
+        print("🔁 Swapping columns...")
+        cursor.execute("ALTER TABLE VectorSearch.MIMICCXRImages DROP COLUMN Vector")
+        cursor.execute("ALTER TABLE VectorSearch.MIMICCXRImages ALTER COLUMN VectorFloat RENAME Vector")
+        conn.commit()
+        print(f"✅ Vector column migrated to FLOAT ({converted} rows)")
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+        conn.close()
+
+
 if __name__ == '__main__':
     import argparse
 
@@ -141,9 +226,15 @@ if __name__ == '__main__':
                        help='Drop existing table first (WARNING: destroys data)')
     parser.add_argument('--force', action='store_true',
                        help='Required with --drop to confirm data destruction')
+    parser.add_argument('--migrate-float', action='store_true',
+                       help='Convert an existing VECTOR(DOUBLE) Vector column to VECTOR(FLOAT)')
 
     args = parser.parse_args()
 
+    if args.migrate_float:
+        migrate_vector_column_to_float()
+        sys.exit(0)
+
     if args.drop and not args.force:
         print("❌ Error: --drop requires --force to confirm data destruction")
         print("   Usage: python create_mimic_images_table.py --drop --force")
@@ -16,7 +16,7 @@ parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
-from src.db.connection import get_connection
+from src.db.connection import get_connection, get_pooled_connection
 
 
 def create_patient_mapping_table(drop_existing=False):
@@ -150,7 +150,7 @@ def lookup_patient_mapping(mimic_subject_id: str) -> dict | None:
     Returns:
         Dict with patient info or None if not found
     """
-    conn = get_connection()
+    conn = get_pooled_connection()
     cursor = conn.cursor()
 
     try:
@@ -178,6 +178,28 @@ def lookup_patient_mapping(mimic_subject_id: str) -> dict | None:
         conn.close()
 
 
+def load_existing_mappings() -> dict:
+    """
+    Load every patient mapping in one query.
+
+    Returns:
+        Dict of MIMIC subject ID -> FHIR Patient ID
+    """
+    conn = get_pooled_connection()
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("""
+            SELECT MIMICSubjectID, FHIRPatientID
+            FROM VectorSearch.PatientImageMapping
+        """)
+        return {row[0]: row[1] for row in cursor.fetchall()}
+
+    finally:
+        cursor.close()
+        conn.close()
+
+
 def insert_patient_mapping(
     mimic_subject_id: str,
     fhir_patient_id: str,
@@ -198,23 +220,54 @@ def insert_patient_mapping(
     Returns:
         True if inserted successfully, False otherwise
     """
-    conn = get_connection()
+    return insert_patient_mappings(
+        [(mimic_subject_id, fhir_patient_id, patient_name, match_confidence, match_type)]
+    )[0]
+
+
+def insert_patient_mappings(rows: list) -> list:
+    """
+    Insert many patient mapping records over one connection with a single commit.
+
+    Args:
+        rows: Tuples of (mimic_subject_id, fhir_patient_id, patient_name,
+              match_confidence, match_type)
+
+    Returns:
+        List of booleans, True for each row inserted successfully
+    """
+    if not rows:
+        return []
+
+    sql = """
+        INSERT INTO VectorSearch.PatientImageMapping
+        (MIMICSubjectID, FHIRPatientID, FHIRPatientName, MatchConfidence, MatchType, UpdatedAt)
+        VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    """
+
+    conn = get_pooled_connection()
     cursor = conn.cursor()
 
     try:
-        cursor.execute("""
-            INSERT INTO VectorSearch.PatientImageMapping
-            (MIMICSubjectID, FHIRPatientID, FHIRPatientName, MatchConfidence, MatchType, UpdatedAt)
-            VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-        """, [mimic_subject_id, fhir_patient_id, patient_name, match_confidence, match_type])
-
+        try:
+            cursor.executemany(sql, rows)
+            conn.commit()
+            return [True] * len(rows)
+        except Exception as e:
+            # Fall back to row-by-row so one bad row doesn't cost the batch
+            print(f"[WARN] Batch mapping insert failed ({e}), retrying rows individually")
+            conn.rollback()
+
+        results = []
+        for row in rows:
+            try:
+                cursor.execute(sql, row)
+                results.append(True)
+            except Exception as e:
+                print(f"[ERROR] Failed to insert patient mapping for {row[0]}: {e}")
+                results.append(False)
         conn.commit()
-        return True
-
-    except Exception as e:
-        print(f"[ERROR] Failed to insert patient mapping: {e}")
-        conn.rollback()
-        return False
+        return results
 
     finally:
         cursor.close()
@@ -228,7 +281,7 @@ def get_mapping_stats() -> dict:
     Returns:
         Dict with mapping statistics
     """
-    conn = get_connection()
+    conn = get_pooled_connection()
     cursor = conn.cursor()
 
     try:
@@ -16,6 +16,7 @@ Usage:
     python3 src/setup/fhir_graphrag_setup.py --mode=stats
 """
 
+import io
 import sys
 import os
 import time
@@ -33,6 +34,23 @@ if PROJECT_ROOT not in sys.path:
 from src.adapters.fhir_document_adapter import FHIRDocumentAdapter
 from src.extractors.medical_entity_extractor import MedicalEntityExtractor
 
+# Documents whose build progress is buffered between writes to stdout
+PROGRESS_FLUSH_EVERY = 10
+
+# Knowledge graph writes; uq_entity / uq_relationship turn a re-extraction into an update.
+# Each is sent with executemany, so the server prepares it once per document.
+INSERT_ENTITY_SQL = """
+    INSERT OR UPDATE INTO RAG.Entities
+    (EntityText, EntityType, ResourceID, Confidence, ExtractedBy, ExtractedAt)
+    VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+"""
+
+INSERT_RELATIONSHIP_SQL = """
+    INSERT OR UPDATE INTO RAG.EntityRelationships
+    (SourceEntityID, TargetEntityID, RelationshipType, ResourceID, Confidence, ExtractedAt)
+    VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+"""
+
 
 class FHIRGraphRAGSetup:
     """
@@ -170,30 +188,42 @@ class FHIRGraphRAGSetup:
 
         print(f"[INFO] ✅ Loaded {len(documents)} DocumentReference resources")
 
-        # Process each document
-        for idx, document in enumerate(documents, 1):
-            print(f"[INFO] Processing document {idx}/{len(documents)} (ID: {document['id']})...")
+        # Process each document; per-document progress is buffered and written
+        # every PROGRESS_FLUSH_EVERY documents instead of line by line
+        progress = io.StringIO()
+        try:
+            for idx, document in enumerate(documents, 1):
+                print(f"[INFO] Processing document {idx}/{len(documents)} (ID: {document['id']})...", file=progress)
+
+                doc_start = time.time()
 
-            doc_start = time.time()
+                # Extract entities
+                entities = self.extractor.extract_entities(document['text'])
 
-            # Extract entities
-            entities = self.extractor.extract_entities(document['text'])
+                print(f"[INFO]   ✅ Extracted {len(entities)} entities", file=progress)
 
-            print(f"[INFO]   ✅ Extracted {len(entities)} entities")
+                # Store entities in database
+                entity_ids = self._store_entities(document['metadata']['resource_id'], entities)
 
-            # Store entities in database
-            entity_ids = self._store_entities(document['metadata']['resource_id'], entities)
+                # Extract relationships
+                relationships = self._extract_relationships(entities, entity_ids, document['text'])
 
-            # Extract relationships
-            relationships = self._extract_relationships(entities, entity_ids, document['text'])
+                print(f"[INFO]   ✅ Identified {len(relationships)} relationships", file=progress)
 
-            print(f"[INFO]   ✅ Identified {len(relationships)} relationships")
+                # Store relationships in database
+                self._store_relationships(document['metadata']['resource_id'], relationships)
 
-            # Store relationships in database
-            self._store_relationships(document['metadata']['resource_id'], relationships)
+                doc_time = time.time() - doc_start
+                print(f"[INFO]   Processing time: {doc_time:.2f} seconds\n", file=progress)
 
-            doc_time = time.time() - doc_start
-            print(f"[INFO]   Processing time: {doc_time:.2f} seconds\n")
+                if idx % PROGRESS_FLUSH_EVERY == 0:
+                    sys.stdout.write(progress.getvalue())
+                    sys.stdout.flush()
+                    progress = io.StringIO()
+        finally:
+            # Also reached on error, so the failing document's progress is shown
+            sys.stdout.write(progress.getvalue())
+            sys.stdout.flush()
 
         # Calculate final statistics
         self.stats['processing_time'] = time.time() - start_time
@@ -215,40 +245,36 @@ class FHIRGraphRAGSetup:
         Returns:
             Dict mapping (entity_text, entity_type) to EntityID
         """
-        entity_ids = {}
-
+        # One row per (text, type), so each entity is written and counted once
+        unique = {}
         for entity in entities:
-            try:
-                # Insert entity
-                self.cursor.execute("""
-                    INSERT INTO RAG.Entities
-                    (EntityText, EntityType, ResourceID, Confidence, ExtractedBy, ExtractedAt)
-                    VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                """, (
-                    entity['text'],
-                    entity['type'],
-                    resource_id,
-                    entity['confidence'],
-                    entity.get('method', 'hybrid')
-                ))
-
-                # Get inserted ID
-                self.cursor.execute("SELECT LAST_IDENTITY()")
-                entity_id = self.cursor.fetchone()[0]
-
-                # Map entity to ID
-                entity_ids[(entity['text'], entity['type'])] = entity_id
-
-                # Update statistics
-                self.stats['total_entities'] += 1
-                entity_type = entity['type']
-                self.stats['entities_by_type'][entity_type] = \
-                    self.stats['entities_by_type'].get(entity_type, 0) + 1
-
-            except Exception as e:
-                print(f"[WARN] Failed to store entity '{entity['text']}': {e}")
-
-        return entity_ids
+            unique.setdefault((entity['text'], entity['type']), entity)
+
+        rows = [
+            (text, entity_type, resource_id, entity['confidence'], entity.get('method', 'hybrid'))
+            for (text, entity_type), entity in unique.items()
+        ]
+        stored = {row[:2] for row in self._execute_rows(INSERT_ENTITY_SQL, rows, "entity")}
+
+        for _, entity_type in stored:
+            self.stats['total_entities'] += 1
+            self.stats['entities_by_type'][entity_type] = \
+                self.stats['entities_by_type'].get(entity_type, 0) + 1
+
+        if not stored:
+            return {}
+
+        # Resolve every stored entity's ID with one query for the resource,
+        # rather than a lookup after each insert
+        self.cursor.execute(
+            "SELECT EntityID, EntityText, EntityType FROM RAG.Entities WHERE ResourceID = ?",
+            (resource_id,)
+        )
+        return {
+            (text, entity_type): entity_id
+            for entity_id, text, entity_type in self.cursor.fetchall()
+            if (text, entity_type) in stored
+        }
 
     def _extract_relationships(self, entities: list, entity_ids: dict, text: str) -> list:
         """
@@ -265,12 +291,10 @@ class FHIRGraphRAGSetup:
         relationships = []
         text_lower = text.lower()
 
-        # Simple relationship extraction heuristics
+        # Simple relationship extraction heuristics; only pairs after the source
+        # are visited, which avoids duplicates and self-loops
         for i, source_entity in enumerate(entities):
-            for j, target_entity in enumerate(entities):
-                if i >= j:  # Avoid duplicates and self-loops
-                    continue
-
+            for target_entity in entities[i + 1:]:
                 source_key = (source_entity['text'], source_entity['type'])
                 target_key = (target_entity['text'], target_entity['type'])
 
@@ -344,28 +368,45 @@ class FHIRGraphRAGSetup:
             resource_id: FHIR resource ID
             relationships: List of relationships to store
         """
-        for rel in relationships:
-            try:
-                self.cursor.execute("""
-                    INSERT INTO RAG.EntityRelationships
-                    (SourceEntityID, TargetEntityID, RelationshipType, ResourceID, Confidence, ExtractedAt)
-                    VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                """, (
-                    rel['source_id'],
-                    rel['target_id'],
-                    rel['type'],
-                    resource_id,
-                    rel['confidence']
-                ))
-
-                # Update statistics
-                self.stats['total_relationships'] += 1
-                rel_type = rel['type']
-                self.stats['relationships_by_type'][rel_type] = \
-                    self.stats['relationships_by_type'].get(rel_type, 0) + 1
+        rows = [
+            (rel['source_id'], rel['target_id'], rel['type'], resource_id, rel['confidence'])
+            for rel in relationships
+        ]
+        for row in self._execute_rows(INSERT_RELATIONSHIP_SQL, rows, "relationship"):
+            self.stats['total_relationships'] += 1
+            rel_type = row[2]
+            self.stats['relationships_by_type'][rel_type] = \
+                self.stats['relationships_by_type'].get(rel_type, 0) + 1
+
+    def _execute_rows(self, sql: str, rows: list, label: str) -> list:
+        """
+        Run sql for every row with one executemany, falling back to row-by-row.
+
+        Args:
+            sql: Parameterized INSERT statement
+            rows: Parameter tuples
+            label: What a row is, for warnings
+
+        Returns:
+            The rows that were written
+        """
+        if not rows:
+            return []
+        try:
+            self.cursor.executemany(sql, rows)
+            return rows
+        except Exception as e:
+            # The statements are upserts, so rows the batch already wrote are harmless to repeat
+            print(f"[WARN] Batch {label} insert failed ({e}), retrying rows individually")
 
+        written = []
+        for row in rows:
+            try:
+                self.cursor.execute(sql, row)
+                written.append(row)
             except Exception as e:
-                print(f"[WARN] Failed to store relationship: {e}")
+                print(f"[WARN] Failed to store {label} {row[:3]}: {e}")
+        return written
 
     def _display_build_summary(self):
         """Display knowledge graph build summary."""
@@ -532,12 +573,9 @@ class FHIRGraphRAGSetup:
             rel_type, count, avg_conf = row
             print(f"  {rel_type:15} : {count:4} relationships (avg confidence: {avg_conf:.3f})")
 
-        # Query total counts
-        self.cursor.execute("SELECT COUNT(*) FROM RAG.Entities")
-        total_entities = self.cursor.fetchone()[0]
-
-        self.cursor.execute("SELECT COUNT(*) FROM RAG.EntityRelationships")
-        total_relationships = self.cursor.fetchone()[0]
+        # Query total counts, in one round trip
+        self.cursor.execute("SELECT (SELECT COUNT(*) FROM RAG.Entities), (SELECT COUNT(*) FROM RAG.EntityRelationships)")
+        total_entities, total_relationships = self.cursor.fetchone()
 
         print(f"\nTotal Entities: {total_entities}")
         print(f"Total Relationships: {total_relationships}")
@@ -15,20 +15,21 @@ import json
 import os
 import sys
 import random
-import string
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple, Any
-import requests
 
 # Add project root to path
 parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
-from src.db.connection import get_connection
+from src.db.connection import get_pooled_connection
 from src.setup.create_patient_mapping import (
-    lookup_patient_mapping,
-    insert_patient_mapping,
+    load_existing_mappings,
+    insert_patient_mappings,
     get_mapping_stats
 )
 from src.adapters.fhir_radiology_adapter import (
@@ -40,6 +41,7 @@ from src.adapters.fhir_radiology_adapter import (
 
 # Configuration
 FHIR_BASE_URL = os.getenv('FHIR_BASE_URL', 'http://localhost:52773/fhir/r4')
+MAPPING_BATCH_SIZE = 500  # Mappings inserted per executemany/commit
 SYNTHEA_NAMES = [
     ("James", "Wilson"), ("Sarah", "Connor"), ("Michael", "Chen"),
     ("Emily", "Johnson"), ("David", "Brown"), ("Jessica", "Martinez"),
@@ -51,6 +53,22 @@ SYNTHEA_NAMES = [
 ]
 
 
+_default_adapter: Optional[FHIRRadiologyAdapter] = None
+
+
+def get_default_adapter() -> FHIRRadiologyAdapter:
+    """
+    Module-wide FHIRRadiologyAdapter for helpers called without one.
+
+    Sharing it keeps every FHIR request in the process on one pooled,
+    keep-alive session instead of opening a new session per helper call.
+    """
+    global _default_adapter
+    if _default_adapter is None:
+        _default_adapter = FHIRRadiologyAdapter()
+    return _default_adapter
+
+
 def get_mimic_studies_for_subject(subject_id: str) -> List[Dict]:
     """
     Get all imaging studies for a MIMIC subject from the MIMICCXRImages table.
@@ -59,16 +77,17 @@ def get_mimic_studies_for_subject(subject_id: str) -> List[Dict]:
         subject_id: MIMIC subject ID (e.g., 'p10002428')
 
     Returns:
-        List of dicts with study_id, view_position, image_path
+        List of dicts with study_id, view_position, image_path, one per study
     """
-    conn = get_connection()
+    conn = get_pooled_connection()
     cursor = conn.cursor()
 
     try:
         sql = """
-            SELECT DISTINCT StudyID, ViewPosition, ImagePath
+            SELECT StudyID, MIN(ViewPosition), MIN(ImagePath)
             FROM VectorSearch.MIMICCXRImages
             WHERE SubjectID = ?
+            GROUP BY StudyID
         """
         cursor.execute(sql, (subject_id,))
         studies = []
@@ -84,6 +103,64 @@ def get_mimic_studies_for_subject(subject_id: str) -> List[Dict]:
         conn.close()
 
 
+# IN-list sizes used by get_mimic_studies_bulk; a short final chunk is padded up
+# to one of these so only a handful of distinct statements are ever prepared
+SUBJECT_IN_BUCKETS = (500, 100, 10, 1)
+
+
+@lru_cache(maxsize=len(SUBJECT_IN_BUCKETS))
+def _studies_bulk_sql(count: int) -> str:
+    """Study lookup for an IN-list of count subject IDs, built once per size."""
+    placeholders = ', '.join('?' * count)
+    return f"""
+        SELECT SubjectID, StudyID, MIN(ViewPosition), MIN(ImagePath)
+        FROM VectorSearch.MIMICCXRImages
+        WHERE SubjectID IN ({placeholders})
+        GROUP BY SubjectID, StudyID
+    """
+
+
+def get_mimic_studies_bulk(subject_ids: List[str]) -> Dict[str, List[Dict]]:
+    """
+    Get imaging studies for many MIMIC subjects over one connection.
+
+    Subject IDs go out in IN (...) chunks of SUBJECT_IN_BUCKETS[0]. The last
+    chunk is padded with a repeated ID to the smallest bucket that fits; the
+    duplicate changes nothing under GROUP BY, and every query reuses one of a
+    few statement texts (and so IRIS's cached plan for it).
+
+    Args:
+        subject_ids: MIMIC subject IDs
+
+    Returns:
+        Dict of subject ID -> list of dicts with study_id, view_position, image_path
+        (subjects without studies map to an empty list)
+    """
+    studies_by_subject = {subject_id: [] for subject_id in subject_ids}
+    if not subject_ids:
+        return studies_by_subject
+
+    chunk_size = SUBJECT_IN_BUCKETS[0]
+    conn = get_pooled_connection()
+    cursor = conn.cursor()
+
+    try:
+        for start in range(0, len(subject_ids), chunk_size):
+            chunk = subject_ids[start:start + chunk_size]
+            size = min(b for b in SUBJECT_IN_BUCKETS if b >= len(chunk))
+            cursor.execute(_studies_bulk_sql(size), chunk + [chunk[0]] * (size - len(chunk)))
+            for row in cursor.fetchall():
+                studies_by_subject[row[0]].append({
+                    'study_id': row[1],
+                    'view_position': row[2],
+                    'image_path': row[3]
+                })
+        return studies_by_subject
+    finally:
+        cursor.close()
+        conn.close()
+
+
 def get_mimic_subject_ids(limit: Optional[int] = None) -> List[str]:
     """
     Get unique MIMIC subject IDs from the MIMICCXRImages table.
@@ -94,7 +171,7 @@ def get_mimic_subject_ids(limit: Optional[int] = None) -> List[str]:
     Returns:
         List of unique subject IDs (e.g., ['p10002428', 'p10003187', ...])
     """
-    conn = get_connection()
+    conn = get_pooled_connection()
     cursor = conn.cursor()
 
     try:
@@ -111,40 +188,54 @@ def get_mimic_subject_ids(limit: Optional[int] = None) -> List[str]:
         conn.close()
 
 
-def search_fhir_patients(name: Optional[str] = None, count: int = 100) -> List[Dict]:
+def search_fhir_patients(
+    name: Optional[str] = None,
+    count: int = 100,
+    adapter: Optional[FHIRRadiologyAdapter] = None,
+    page_size: int = 200
+) -> List[Dict]:
     """
     Search FHIR Patient resources.
 
+    Only id and name are requested (_elements), and results are paged by
+    following the Bundle's next links until count patients are collected.
+
     Args:
         name: Patient name to search for
         count: Maximum results to return
+        adapter: FHIRRadiologyAdapter whose pooled session to reuse
+        page_size: Patients requested per page
 
     Returns:
-        List of FHIR Patient resources
+        List of FHIR Patient resources (id and name only)
     """
-    session = requests.Session()
-    session.headers.update({
-        'Accept': 'application/fhir+json'
-    })
+    adapter = adapter or get_default_adapter()
 
-    params = {'_count': count}
+    params = {'_count': min(page_size, count), '_elements': 'id,name'}
     if name:
         params['name'] = name
 
+    patients = []
+    url = f"{FHIR_BASE_URL}/Patient"
     try:
-        response = session.get(f"{FHIR_BASE_URL}/Patient", params=params)
-        response.raise_for_status()
-        bundle = response.json()
+        while url and len(patients) < count:
+            response = adapter.session.get(url, params=params)
+            response.raise_for_status()
+            bundle = response.json()
+
+            for entry in bundle.get('entry', []):
+                if 'resource' in entry:
+                    patients.append(entry['resource'])
 
-        patients = []
-        for entry in bundle.get('entry', []):
-            if 'resource' in entry:
-                patients.append(entry['resource'])
+            # The next link already carries the search parameters
+            url = next((link.get('url') for link in bundle.get('link', [])
+                        if link.get('relation') == 'next'), None)
+            params = None
 
-        return patients
+        return patients[:count]
     except Exception as e:
         print(f"Error searching FHIR patients: {e}", file=sys.stderr)
-        return []
+        return patients[:count]
 
 
 def get_patient_name(patient: Dict) -> str:
@@ -169,10 +260,14 @@ def get_patient_name(patient: Dict) -> str:
     return ' '.join(parts) if parts else "Unknown"
 
 
+def summarize_patients(fhir_patients: List[Dict]) -> List[Dict]:
+    """Reduce FHIR Patient resources to {'id', 'name'} with the display name resolved once."""
+    return [{'id': p.get('id', ''), 'name': get_patient_name(p)} for p in fhir_patients]
+
+
 def match_patient_for_subject(
     subject_id: str,
-    fhir_patients: List[Dict],
-    used_patient_ids: set
+    available_patients: List[Dict]
 ) -> Optional[Tuple[str, str, float, str]]:
     """
     Try to match a MIMIC subject to an existing FHIR patient.
@@ -184,47 +279,44 @@ def match_patient_for_subject(
 
     Args:
         subject_id: MIMIC subject ID (e.g., 'p10002428')
-        fhir_patients: List of available FHIR Patient resources
-        used_patient_ids: Set of already-used patient IDs
+        available_patients: Shuffled pool of unused patients as {'id', 'name'}
+                            dicts (see summarize_patients); the match is popped
+                            off it, so no patient is assigned twice
 
     Returns:
         Tuple of (patient_id, patient_name, confidence, match_type) or None
     """
-    # Filter to available patients (not already used)
-    available = [p for p in fhir_patients if p.get('id') not in used_patient_ids]
-
-    if not available:
+    if not available_patients:
         return None
 
     # For demo: randomly assign to create a diverse patient set
-    # In production, this would use more sophisticated matching
-    patient = random.choice(available)
-    patient_id = patient.get('id', '')
-    patient_name = get_patient_name(patient)
-
-    # Mark as used
-    used_patient_ids.add(patient_id)
+    # In production, this would use more sophisticated matching.
+    # The pool is shuffled once up front, so popping the end is a random pick.
+    patient = available_patients.pop()
 
-    return (patient_id, patient_name, 0.85, 'random_assignment')
+    return (patient['id'], patient['name'], 0.85, 'random_assignment')
 
 
-def create_synthea_patient(subject_id: str) -> Tuple[str, str]:
+def create_synthea_patient(
+    subject_id: str,
+    adapter: Optional[FHIRRadiologyAdapter] = None
+) -> Tuple[str, str]:
     """
     Create a new synthetic patient using Synthea-like naming.
 
     Args:
         subject_id: MIMIC subject ID for generating patient
+        adapter: FHIRRadiologyAdapter whose pooled session to reuse
 
     Returns:
         Tuple of (patient_id, patient_name)
     """
-    # Generate deterministic name based on subject_id hash
-    hash_val = hash(subject_id)
-    name_idx = abs(hash_val) % len(SYNTHEA_NAMES)
+    # Generate deterministic name based on subject_id hash; crc32 is stable
+    # across runs, unlike hash(), which is salted per interpreter
+    hash_val = zlib.crc32(subject_id.encode())
+    name_idx = hash_val % len(SYNTHEA_NAMES)
     given, family = SYNTHEA_NAMES[name_idx]
 
-    # Add random suffix for uniqueness
-    suffix = ''.join(random.choices(string.digits, k=3))
     patient_id = f"synthea-{subject_id.replace('p', '')}"
     full_name = f"{given} {family}"
 
@@ -251,11 +343,11 @@ def create_synthea_patient(subject_id: str) -> Tuple[str, str]:
             }
         ],
         "gender": "unknown",
-        "birthDate": f"{1940 + abs(hash_val) % 60}-01-01"
+        "birthDate": f"{1940 + hash_val % 60}-01-01"
     }
 
-    # POST to FHIR server
-    adapter = FHIRRadiologyAdapter()
+    # PUT to FHIR server
+    adapter = adapter or get_default_adapter()
     try:
         result = adapter.put_resource(patient_resource)
         print(f"  Created Synthea patient: {full_name} ({patient_id})")
@@ -270,7 +362,8 @@ def import_subject_mappings(
     subjects: List[str],
     fhir_patients: List[Dict],
     create_synthea: bool = True,
-    dry_run: bool = False
+    dry_run: bool = False,
+    adapter: Optional[FHIRRadiologyAdapter] = None
 ) -> Dict[str, Any]:
     """
     Import patient mappings for MIMIC subjects.
@@ -280,6 +373,7 @@ def import_subject_mappings(
         fhir_patients: List of available FHIR patients
         create_synthea: Whether to create Synthea patients for unmatched
         dry_run: If True, don't actually insert mappings
+        adapter: FHIRRadiologyAdapter shared by every FHIR call
 
     Returns:
         Statistics dict with counts of operations
@@ -293,38 +387,40 @@ def import_subject_mappings(
         'errors': 0
     }
 
-    used_patient_ids = set()
+    # One query for every existing mapping rather than a lookup per subject;
+    # patients already mapped to any subject aren't handed out again
+    existing_map = load_existing_mappings()
+    used_patient_ids = set(existing_map.values())
+    available_patients = [p for p in summarize_patients(fhir_patients) if p['id'] not in used_patient_ids]
+    random.shuffle(available_patients)
+    adapter = adapter or get_default_adapter()
+
+    # (mapping row, stats key) pairs waiting to be inserted together
+    pending = []
+
+    def flush():
+        results = insert_patient_mappings([row for row, _ in pending])
+        for (_, stat_key), ok in zip(pending, results):
+            stats[stat_key if ok else 'errors'] += 1
+        pending.clear()
 
     for i, subject_id in enumerate(subjects):
         if (i + 1) % 50 == 0:
             print(f"Processing {i + 1}/{len(subjects)}...")
 
         # Check if already mapped
-        existing = lookup_patient_mapping(subject_id)
-        if existing:
+        if subject_id in existing_map:
             stats['already_mapped'] += 1
-            used_patient_ids.add(existing['FHIRPatientID'])
             continue
 
         # Try to match to existing FHIR patient
-        match = match_patient_for_subject(subject_id, fhir_patients, used_patient_ids)
+        match = match_patient_for_subject(subject_id, available_patients)
 
         if match:
             patient_id, patient_name, confidence, match_type = match
 
             if not dry_run:
-                try:
-                    insert_patient_mapping(
-                        mimic_subject_id=subject_id,
-                        fhir_patient_id=patient_id,
-                        fhir_patient_name=patient_name,
-                        match_confidence=confidence,
-                        match_type=match_type
-                    )
-                    stats['matched_to_fhir'] += 1
-                except Exception as e:
-                    print(f"Error inserting mapping for {subject_id}: {e}", file=sys.stderr)
-                    stats['errors'] += 1
+                pending.append(((subject_id, patient_id, patient_name, confidence, match_type), 'matched_to_fhir'))
             else:
                 stats['matched_to_fhir'] += 1
 
@@ -332,15 +428,8 @@ def import_subject_mappings(
             # Create new Synthea patient
             if not dry_run:
                 try:
-                    patient_id, patient_name = create_synthea_patient(subject_id)
-                    insert_patient_mapping(
-                        mimic_subject_id=subject_id,
-                        fhir_patient_id=patient_id,
-                        fhir_patient_name=patient_name,
-                        match_confidence=1.0,
-                        match_type='synthea_generated'
-                    )
-                    stats['synthea_created'] += 1
+                    patient_id, patient_name = create_synthea_patient(subject_id, adapter)
+                    pending.append(((subject_id, patient_id, patient_name, 1.0, 'synthea_generated'), 'synthea_created'))
                 except Exception as e:
                     print(f"Error creating Synthea patient for {subject_id}: {e}", file=sys.stderr)
                     stats['errors'] += 1
@@ -349,20 +438,31 @@ def import_subject_mappings(
         else:
             stats['unlinked'] += 1
 
+        if len(pending) >= MAPPING_BATCH_SIZE:
+            flush()
+
+    if pending:
+        flush()
+
     return stats
 
 
-def generate_unlinked_report(output_path: Optional[str] = None) -> Dict[str, Any]:
+def generate_unlinked_report(output_path: Optional[str] = None, fetch_size: int = 10000) -> Dict[str, Any]:
     """
     Generate report of MIMIC subjects without patient mappings (FR-007).
 
+    With output_path the subject IDs are streamed to the file fetch_size rows
+    at a time and only the summary is returned, so the full list is never
+    held in memory.
+
     Args:
         output_path: Optional path to write JSON report
+        fetch_size: Rows fetched per round trip
 
     Returns:
-        Report dict with unlinked subjects
+        Report dict; includes the subject list only when output_path is not given
     """
-    conn = get_connection()
+    conn = get_pooled_connection()
     cursor = conn.cursor()
 
     try:
@@ -375,20 +475,34 @@ def generate_unlinked_report(output_path: Optional[str] = None) -> Dict[str, Any
             WHERE m.MIMICSubjectID IS NULL
         """
         cursor.execute(sql)
-        unlinked = [row[0] for row in cursor.fetchall()]
+        generated_at = datetime.now().isoformat()
+
+        if not output_path:
+            unlinked = [row[0] for row in cursor.fetchall()]
+            return {
+                'generated_at': generated_at,
+                'total_unlinked': len(unlinked),
+                'subjects': unlinked
+            }
 
-        report = {
-            'generated_at': datetime.now().isoformat(),
-            'total_unlinked': len(unlinked),
-            'subjects': unlinked
+        total = 0
+        with open(output_path, 'w') as f:
+            f.write(f'{{\n  "generated_at": {json.dumps(generated_at)},\n  "subjects": [')
+            while True:
+                rows = cursor.fetchmany(fetch_size)
+                if not rows:
+                    break
+                f.write((',' if total else '') + ','.join(json.dumps(row[0]) for row in rows))
+                total += len(rows)
+            # The total is only known once every row is written, so it goes last
+            f.write(f'],\n  "total_unlinked": {total}\n}}\n')
+        print(f"Unlinked report written to: {output_path}")
+
+        return {
+            'generated_at': generated_at,
+            'total_unlinked': total,
+            'output_path': output_path
         }
-
-        if output_path:
-            with open(output_path, 'w') as f:
-                json.dump(report, f, indent=2)
-            print(f"Unlinked report written to: {output_path}")
-
-        return report
     finally:
         cursor.close()
         conn.close()
@@ -399,7 +513,8 @@ def create_imaging_studies_for_subject(
     patient_id: str,
     adapter: FHIRRadiologyAdapter,
     match_encounters: bool = True,
-    dry_run: bool = False
+    dry_run: bool = False,
+    studies: Optional[List[Dict]] = None
 ) -> Dict[str, Any]:
     """
     Create FHIR ImagingStudy resources for a MIMIC subject (T021).
@@ -412,6 +527,7 @@ def create_imaging_studies_for_subject(
         adapter: FHIRRadiologyAdapter instance
         match_encounters: Whether to attempt encounter matching
         dry_run: If True, don't actually create resources
+        studies: The subject's studies if already fetched (see get_mimic_studies_bulk)
 
     Returns:
         Statistics dict with counts of operations
@@ -424,23 +540,26 @@ def create_imaging_studies_for_subject(
     }
 
     # Get studies for this subject from database
-    studies = get_mimic_studies_for_subject(subject_id)
+    if studies is None:
+        studies = get_mimic_studies_for_subject(subject_id)
     stats['studies_found'] = len(studies)
 
-    # Group by study_id (may have multiple images per study)
-    unique_studies = {}
-    for study in studies:
-        study_id = study['study_id']
-        if study_id not in unique_studies:
-            unique_studies[study_id] = study
+    # Check which ImagingStudies already exist with one search instead of one per study
+    try:
+        # Rows are already one per study (the queries GROUP BY StudyID)
+        existing = adapter.get_imaging_studies([study['study_id'] for study in studies], elements="identifier")
+    except Exception as e:
+        print(f"  Error looking up ImagingStudies for {subject_id}: {e}", file=sys.stderr)
+        stats['errors'] += len(studies)
+        return stats
 
-    for study_id, study_info in unique_studies.items():
-        try:
-            # Check if ImagingStudy already exists
-            existing = adapter.get_imaging_study(study_id)
-            if existing:
-                continue  # Skip already created
+    resources = []
+    for study_info in studies:
+        study_id = study_info['study_id']
+        if study_id in existing:
+            continue  # Skip already created
 
+        try:
             # Determine encounter via 24-hour window matching (T019)
             encounter_id = None
             if match_encounters:
@@ -467,16 +586,24 @@ def create_imaging_studies_for_subject(
                 description=f"Chest X-ray ({study_info.get('view_position', 'unknown view')})"
             )
 
-            if not dry_run:
-                resource = adapter.build_imaging_study(imaging_data)
-                adapter.put_resource(resource)
-
-            stats['imaging_studies_created'] += 1
+            resources.append(adapter.build_imaging_study(imaging_data))
 
         except Exception as e:
             print(f"  Error creating ImagingStudy for {study_id}: {e}", file=sys.stderr)
             stats['errors'] += 1
 
+    if not resources:
+        return stats
+
+    # Create all of the subject's new studies in one transaction Bundle
+    try:
+        if not dry_run:
+            adapter.put_resources_transaction(resources)
+        stats['imaging_studies_created'] += len(resources)
+    except Exception as e:
+        print(f"  Error creating ImagingStudies for {subject_id}: {e}", file=sys.stderr)
+        stats['errors'] += len(resources)
+
     return stats
 
 
@@ -513,6 +640,10 @@ def main():
         '--no-encounter-matching', action='store_true',
         help='Skip 24-hour window encounter matching during ImagingStudy creation (T019)'
     )
+    parser.add_argument(
+        '--fhir-workers', type=int, default=16,
+        help='Subjects processed concurrently during ImagingStudy creation'
+    )
 
     args = parser.parse_args()
 
@@ -538,9 +669,12 @@ def main():
     subjects = get_mimic_subject_ids(limit=args.limit)
     print(f"Found {len(subjects)} unique subjects")
 
+    # One adapter, and so one pooled HTTP session, for every FHIR call in the run
+    adapter = get_default_adapter()
+
     # Get existing FHIR patients
     print("Fetching existing FHIR patients...")
-    fhir_patients = search_fhir_patients(count=500)
+    fhir_patients = search_fhir_patients(count=500, adapter=adapter)
     print(f"Found {len(fhir_patients)} FHIR patients")
 
     # Import mappings
@@ -549,7 +683,8 @@ def main():
         subjects=subjects,
         fhir_patients=fhir_patients,
         create_synthea=not args.no_synthea,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        adapter=adapter
     )
 
     # Print summary
@@ -569,7 +704,6 @@ def main():
     # Create ImagingStudy resources if requested (T021)
     if args.create_imaging_studies:
         print("\n=== Creating FHIR ImagingStudy Resources ===")
-        adapter = FHIRRadiologyAdapter()
         imaging_stats = {
             'total_subjects': 0,
             'studies_found': 0,
@@ -579,7 +713,7 @@ def main():
         }
 
         # Get all mapped subjects
-        conn = get_connection()
+        conn = get_pooled_connection()
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -593,23 +727,31 @@ def main():
 
         print(f"Found {len(mapped_subjects)} mapped subjects")
 
-        for i, (subject_id, patient_id) in enumerate(mapped_subjects):
-            if (i + 1) % 50 == 0:
-                print(f"Processing {i + 1}/{len(mapped_subjects)}...")
+        # Fetch every subject's studies up front instead of one query per subject
+        studies_by_subject = get_mimic_studies_bulk([subject_id for subject_id, _ in mapped_subjects])
 
-            subject_stats = create_imaging_studies_for_subject(
+        # Subjects are independent and the work is network bound, so run them concurrently
+        def process_subject(mapping):
+            subject_id, patient_id = mapping
+            return create_imaging_studies_for_subject(
                 subject_id=subject_id,
                 patient_id=patient_id,
                 adapter=adapter,
                 match_encounters=not args.no_encounter_matching,
-                dry_run=args.dry_run
+                dry_run=args.dry_run,
+                studies=studies_by_subject[subject_id]
             )
 
-            imaging_stats['total_subjects'] += 1
-            imaging_stats['studies_found'] += subject_stats['studies_found']
-            imaging_stats['imaging_studies_created'] += subject_stats['imaging_studies_created']
-            imaging_stats['encounters_matched'] += subject_stats['encounters_matched']
-            imaging_stats['errors'] += subject_stats['errors']
+        with ThreadPoolExecutor(max_workers=args.fhir_workers) as executor:
+            for i, subject_stats in enumerate(executor.map(process_subject, mapped_subjects)):
+                if (i + 1) % 50 == 0:
+                    print(f"Processing {i + 1}/{len(mapped_subjects)}...")
+
+                imaging_stats['total_subjects'] += 1
+                imaging_stats['studies_found'] += subject_stats['studies_found']
+                imaging_stats['imaging_studies_created'] += subject_stats['imaging_studies_created']
+                imaging_stats['encounters_matched'] += subject_stats['encounters_matched']
+                imaging_stats['errors'] += subject_stats['errors']
 
         # Print ImagingStudy summary
         print("\n=== ImagingStudy Creation Summary ===")
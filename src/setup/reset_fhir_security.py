@@ -12,8 +12,19 @@ import sys
 import argparse
 import subprocess
 import shutil
+from functools import lru_cache
 from typing import Optional
 
+import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
+
+try:
+    import iris
+except ImportError:
+    iris = None
+
 # Ensure project root is in path
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
 if PROJECT_ROOT not in sys.path:
@@ -22,11 +33,34 @@ if PROJECT_ROOT not in sys.path:
 
 def _check_iris_native_available() -> bool:
     """Check if IRIS driver is available."""
-    try:
-        import iris
-        return True
-    except ImportError:
-        return False
+    return iris is not None
+
+
+@lru_cache(maxsize=1)
+def _devtester_path() -> Optional[str]:
+    """Location of the iris-devtester CLI, or None; the PATH scan runs once."""
+    return shutil.which('iris-devtester')
+
+
+@lru_cache(maxsize=1)
+def _http_session():
+    """Shared requests session so repeated FHIR checks reuse keep-alive sockets."""
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+    )
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def close_session() -> None:
+    """Close the shared HTTP session; the next check opens a new one."""
+    if _http_session.cache_info().currsize:
+        _http_session().close()
+        _http_session.cache_clear()
 
 
 def _reset_via_docker(container_name: str, username: str, password: str, fhir_app: str) -> bool:
@@ -36,32 +70,29 @@ def _reset_via_docker(container_name: str, username: str, password: str, fhir_ap
     print(f"Using Docker-based reset for container '{container_name}'...")
 
     # Step 1: Reset password via iris-devtester
-    devtester_path = shutil.which('iris-devtester')
+    devtester_path = _devtester_path()
     if devtester_path:
         print(f"Resetting password for user {username}...")
         result = subprocess.run(
             ['iris-devtester', 'container', 'reset-password', container_name,
              '--user', username, '--password', password],
-            capture_output=True, text=True
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
         )
         if result.returncode != 0:
             print(f"Warning: Password reset via iris-devtester failed: {result.stderr}")
         else:
             print(f"✓ Password reset successful")
     else:
-        # Fallback to direct docker exec
-        print("iris-devtester not found, using docker exec directly...")
-        cmd = f'iris session IRIS -U %SYS "do ##class(Security.Users).ChangePassword(\\"{username}\\",\\"{password}\\")"'
-        result = subprocess.run(
-            ['docker', 'exec', container_name, 'bash', '-c', cmd],
-            capture_output=True, text=True
-        )
-        if result.returncode != 0:
-            print(f"Warning: Direct password reset failed: {result.stderr}")
+        # Fallback: fold the password change into the step 2 session below
+        print("iris-devtester not found, resetting password in the same IRIS session...")
 
     # Step 2: Enable password auth for FHIR app via docker exec
     print(f"Enabling password auth for {fhir_app}...")
+    change_password = '' if devtester_path else (
+        f'do ##class(Security.Users).ChangePassword("{username}","{password}")'
+    )
     objectscript = f'''
+{change_password}
 set props=""
 do ##class(Security.Applications).Get("{fhir_app}",.props)
 set props("AutheEnabled")=32
@@ -70,7 +101,7 @@ do ##class(Security.Applications).Modify("{fhir_app}",.props)
     result = subprocess.run(
         ['docker', 'exec', container_name, 'bash', '-c',
          f'iris session IRIS -U %SYS <<EOF\n{objectscript}\nhalt\nEOF'],
-        capture_output=True, text=True
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
     )
     if result.returncode != 0:
         print(f"Warning: Auth configuration may have failed: {result.stderr}")
@@ -82,7 +113,7 @@ do ##class(Security.Applications).Modify("{fhir_app}",.props)
         print("Enabling CallIn service...")
         subprocess.run(
             ['iris-devtester', 'container', 'enable-callin', container_name],
-            capture_output=True, text=True
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
         )
 
     return True
@@ -151,9 +182,6 @@ def reset_security(
     # Verify FHIR connectivity regardless of method
     if success:
         print("Verifying FHIR connectivity...")
-        import requests
-        from requests.auth import HTTPBasicAuth
-
         fhir_url = os.getenv("FHIR_BASE_URL")
         if not fhir_url:
             port = os.getenv("IRIS_PORT_WEB", "32783")
@@ -161,10 +189,10 @@ def reset_security(
 
         try:
             print(f"Checking {fhir_url}/metadata...")
-            response = requests.get(
+            response = _http_session().get(
                 f"{fhir_url}/metadata",
                 auth=HTTPBasicAuth(username, password),
-                timeout=10
+                timeout=(1.0, 10)
             )
             if response.status_code == 200:
                 print("✅ FHIR connectivity verified!")
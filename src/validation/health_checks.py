@@ -11,12 +11,14 @@ All functions return structured results with pass/fail status
 and diagnostic messages for troubleshooting.
 """
 
+import asyncio
 import subprocess
 import json
 import os
 import urllib.request
 import urllib.error
-from typing import Dict, List, Any, Optional
+from functools import partial
+from typing import Callable, Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
 
 
@@ -716,6 +718,39 @@ def fhir_auth_check(url: Optional[str] = None, username: Optional[str] = None,
             details={"error_type": type(e).__name__}
         )
 
+def _planned_checks(iris_host: Optional[str] = None, iris_port: Optional[int] = None,
+                    nim_host: str = "localhost", nim_port: int = 8001,
+                    skip_gpu: bool = False, skip_docker: bool = False,
+                    skip_iris: bool = False, skip_nim: bool = False) -> List[Callable[[], HealthCheckResult]]:
+    """Return the selected checks, in report order, as zero-argument callables."""
+    # Load defaults from DatabaseConnection if not provided
+    db_config = DatabaseConnection.get_config()
+    if iris_host is None:
+        iris_host = db_config['hostname']
+    if iris_port is None:
+        iris_port = db_config['port']
+
+    checks = []
+
+    if not skip_gpu:
+        checks.append(gpu_check)
+        checks.append(gpu_utilization_check)
+
+    if not skip_docker:
+        checks.append(docker_gpu_check)
+
+    if not skip_iris:
+        checks.append(partial(iris_connection_check, iris_host, iris_port))
+        checks.append(partial(iris_schema_check, iris_host, iris_port))
+        checks.append(fhir_auth_check)
+
+    if not skip_nim:
+        checks.append(partial(nim_llm_health_check, nim_host, nim_port))
+        checks.append(partial(nim_llm_inference_test, nim_host, nim_port))
+
+    return checks
+
+
 def run_all_checks(iris_host: Optional[str] = None, iris_port: Optional[int] = None,
                   nim_host: str = "localhost", nim_port: int = 8001,
                   skip_gpu: bool = False, skip_docker: bool = False,
@@ -736,32 +771,26 @@ def run_all_checks(iris_host: Optional[str] = None, iris_port: Optional[int] = N
     Returns:
         List of HealthCheckResult objects
     """
-    # Load defaults from DatabaseConnection if not provided
-    db_config = DatabaseConnection.get_config()
-    if iris_host is None:
-        iris_host = db_config['hostname']
-    if iris_port is None:
-        iris_port = db_config['port']
-
-    results = []
+    checks = _planned_checks(iris_host, iris_port, nim_host, nim_port,
+                             skip_gpu, skip_docker, skip_iris, skip_nim)
+    return [check() for check in checks]
 
-    if not skip_gpu:
-        results.append(gpu_check())
-        results.append(gpu_utilization_check())
-
-    if not skip_docker:
-        results.append(docker_gpu_check())
-
-    if not skip_iris:
-        results.append(iris_connection_check(iris_host, iris_port))
-        results.append(iris_schema_check(iris_host, iris_port))
-        results.append(fhir_auth_check())
 
-    if not skip_nim:
-        results.append(nim_llm_health_check(nim_host, nim_port))
-        results.append(nim_llm_inference_test(nim_host, nim_port))
+async def run_all_checks_async(iris_host: Optional[str] = None, iris_port: Optional[int] = None,
+                               nim_host: str = "localhost", nim_port: int = 8001,
+                               skip_gpu: bool = False, skip_docker: bool = False,
+                               skip_iris: bool = False, skip_nim: bool = False) -> List[HealthCheckResult]:
+    """
+    Run all health checks concurrently, one worker thread per check.
 
-    return results
+    The checks are independent and mostly wait on subprocesses, sockets and
+    HTTP, so the total time is that of the slowest check rather than the sum.
+    Takes the same arguments as run_all_checks and returns results in the
+    same order.
+    """
+    checks = _planned_checks(iris_host, iris_port, nim_host, nim_port,
+                             skip_gpu, skip_docker, skip_iris, skip_nim)
+    return list(await asyncio.gather(*(asyncio.to_thread(check) for check in checks)))
 
 
 if __name__ == "__main__":
@@ -34,6 +34,7 @@ try:
         retry,
         stop_after_attempt,
         wait_exponential,
+        wait_random,
         retry_if_exception_type
     )
 except ImportError:
@@ -122,7 +123,7 @@ class NVIDIAEmbeddingsClient:
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
+        wait=wait_exponential(multiplier=1, min=2, max=10) + wait_random(0, 1),
         retry=retry_if_exception_type((requests.exceptions.RequestException, RateLimitError)),
         reraise=True
     )
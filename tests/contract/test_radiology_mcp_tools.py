@@ -253,38 +253,34 @@ class TestGetEncounterImagingContract:
 class TestMCPToolResponseFormat:
     """Tests for LLM-consumable response format per FR-017."""
 
-    def test_all_contracts_have_description(self):
+    @pytest.mark.parametrize("tool_name", [
+        'get_patient_imaging_studies',
+        'get_imaging_study_details',
+        'get_radiology_reports',
+        'search_patients_with_imaging',
+        'get_encounter_imaging',
+        'list_radiology_queries'
+    ])
+    def test_all_contracts_have_description(self, tool_name):
         """Verify all contracts have LLM-friendly descriptions."""
-        tool_names = [
-            'get_patient_imaging_studies',
-            'get_imaging_study_details',
-            'get_radiology_reports',
-            'search_patients_with_imaging',
-            'get_encounter_imaging',
-            'list_radiology_queries'
-        ]
-
-        for tool_name in tool_names:
-            contract = load_contract(tool_name)
-            if contract:
-                assert 'description' in contract, \
-                    f"{tool_name} should have description"
-                assert len(contract['description']) > 20, \
-                    f"{tool_name} description should be meaningful"
-
-    def test_contracts_have_examples(self):
+        contract = load_contract(tool_name)
+        if contract:
+            assert 'description' in contract, \
+                f"{tool_name} should have description"
+            assert len(contract['description']) > 20, \
+                f"{tool_name} description should be meaningful"
+
+    @pytest.mark.parametrize("tool_name", [
+        'get_patient_imaging_studies',
+        'get_imaging_study_details',
+        'get_radiology_reports'
+    ])
+    def test_contracts_have_examples(self, tool_name):
         """Verify contracts have usage examples for LLM context."""
-        tool_names = [
-            'get_patient_imaging_studies',
-            'get_imaging_study_details',
-            'get_radiology_reports'
-        ]
-
-        for tool_name in tool_names:
-            contract = load_contract(tool_name)
-            if contract:
-                assert 'example' in contract or 'examples' in contract, \
-                    f"{tool_name} should have example(s)"
+        contract = load_contract(tool_name)
+        if contract:
+            assert 'example' in contract or 'examples' in contract, \
+                f"{tool_name} should have example(s)"
 
 
 # Mark as contract tests
@@ -13,6 +13,8 @@ These tests verify end-to-end functionality of radiology tools including:
 - get_encounter_imaging
 """
 
+import asyncio
+import atexit
 import pytest
 import json
 import os
@@ -30,6 +32,18 @@ if mcp_server_dir not in sys.path:
 # Import call_tool here after path setup (direct import since mcp-server is on path)
 from fhir_graphrag_mcp_server import call_tool
 
+# One event loop for every call_tool in this module instead of a new loop per test
+_LOOP = None
+
+
+def _run(coro):
+    """Run coro to completion on the module's shared event loop."""
+    global _LOOP
+    if _LOOP is None:
+        _LOOP = asyncio.new_event_loop()
+        atexit.register(_LOOP.close)
+    return _LOOP.run_until_complete(coro)
+
 
 # Radiology tests use SQL fallback when FHIR server is unavailable
 FHIR_BASE_URL = os.getenv('FHIR_BASE_URL', 'http://localhost:52773/fhir/r4')
@@ -38,6 +52,13 @@ pytestmark = [
     pytest.mark.e2e
 ]
 
+# Radiology tools the list_radiology_queries catalog must always include
+CATALOG_TOOLS = frozenset({
+    "get_patient_imaging_studies",
+    "get_imaging_study_details",
+    "get_radiology_reports"
+})
+
 
 class TestListRadiologyQueriesE2E:
     """E2E tests for list_radiology_queries tool."""
@@ -45,9 +66,8 @@ class TestListRadiologyQueriesE2E:
     def test_list_all_queries_returns_catalog(self):
         """Verify list_radiology_queries returns query catalog."""
         # call_tool imported at module level
-        import asyncio
 
-        result = asyncio.get_event_loop().run_until_complete(
+        result = _run(
             call_tool("list_radiology_queries", {"category": "all"})
         )
 
@@ -65,9 +85,8 @@ class TestListRadiologyQueriesE2E:
     def test_list_patient_queries(self):
         """Verify patient category returns patient-related queries."""
         # call_tool imported at module level
-        import asyncio
 
-        result = asyncio.get_event_loop().run_until_complete(
+        result = _run(
             call_tool("list_radiology_queries", {"category": "patient"})
         )
 
@@ -84,9 +103,8 @@ class TestListRadiologyQueriesE2E:
     def test_list_study_queries(self):
         """Verify study category returns study-related queries."""
         # call_tool imported at module level
-        import asyncio
 
-        result = asyncio.get_event_loop().run_until_complete(
+        result = _run(
             call_tool("list_radiology_queries", {"category": "study"})
         )
 
@@ -96,9 +114,8 @@ class TestListRadiologyQueriesE2E:
     def test_list_invalid_category_returns_error(self):
         """Verify invalid category returns appropriate error."""
         # call_tool imported at module level
-        import asyncio
 
-        result = asyncio.get_event_loop().run_until_complete(
+        result = _run(
             call_tool("list_radiology_queries", {"category": "invalid_category"})
         )
 
@@ -113,10 +130,9 @@ class TestGetPatientImagingStudiesE2E:
     def test_get_studies_for_valid_patient(self):
         """Verify retrieval of imaging studies for a valid patient."""
         # call_tool imported at module level
-        import asyncio
 
         # First find a patient with imaging studies
-        search_result = asyncio.get_event_loop().run_until_complete(
+        search_result = _run(
             call_tool("search_patients_with_imaging", {"limit": 1})
         )
         search_data = json.loads(search_result[0].text)
@@ -127,7 +143,7 @@ class TestGetPatientImagingStudiesE2E:
         patient_id = search_data["patients"][0]["id"]
 
         # Now get studies for that patient
-        result = asyncio.get_event_loop().run_until_complete(
+        result = _run(
             call_tool("get_patient_imaging_studies", {"patient_id": patient_id})
         )
 
@@ -141,9 +157,8 @@ class TestGetPatientImagingStudiesE2E:
     def test_get_studies_for_invalid_patient_returns_empty(self):
         """Verify empty result for non-existent patient."""
         # call_tool imported at module level
-        import asyncio
 
-        result = asyncio.get_event_loop().run_until_complete(
+        result = _run(
             call_tool("get_patient_imaging_studies", {"patient_id": "nonexistent-patient-xyz123"})
         )
 
@@ -153,10 +168,9 @@ class TestGetPatientImagingStudiesE2E:
     def test_get_studies_with_modality_filter(self):
         """Verify modality filter works."""
         # call_tool imported at module level
-        import asyncio
 
         # First find a patient
-        search_result = asyncio.get_event_loop().run_until_complete(
+        search_result = _run(
             call_tool("search_patients_with_imaging", {"modality": "CR", "limit": 1})
         )
         search_data = json.loads(search_result[0].text)
@@ -167,7 +181,7 @@ class TestGetPatientImagingStudiesE2E:
         patient_id = search_data["patients"][0]["id"]
 
         # Get studies with modality filter
-        result = asyncio.get_event_loop().run_until_complete(
+        result = _run(
             call_tool("get_patient_imaging_studies", {
                 "patient_id": patient_id,
                 "modality": "CR"
@@ -187,10 +201,9 @@ class TestGetImagingStudyDetailsE2E:
     def test_get_study_details_by_fhir_id(self):
         """Verify retrieval of study details by FHIR resource ID."""
         # call_tool imported at module level
-        import asyncio
 
         # First find a study
-        search_result = asyncio.get_event_loop().run_until_complete(
+        search_result = _run(
             call_tool("search_patients_with_imaging", {"limit": 1})
         )
         search_data = json.loads(search_result[0].text)
@@ -201,7 +214,7 @@ class TestGetImagingStudyDetailsE2E:
         patient_id = search_data["patients"][0]["id"]
 
         # Get studies for that patient
-        studies_result = asyncio.get_event_loop().run_until_complete(
+        studies_result = _run(
             call_tool("get_patient_imaging_studies", {"patient_id": patient_id})
         )
         studies_data = json.loads(studies_result[0].text)
@@ -212,7 +225,7 @@ class TestGetImagingStudyDetailsE2E:
         study_id = studies_data["studies"][0]["id"]
 
         # Get study details
-        result = asyncio.get_event_loop().run_until_complete(
+        result = _run(
             call_tool("get_imaging_study_details", {"study_id": study_id})
         )
 
@@ -225,9 +238,8 @@ class TestGetImagingStudyDetailsE2E:
     def test_get_study_details_invalid_id_returns_error(self):
         """Verify error response for invalid study ID."""
         # call_tool imported at module level
-        import asyncio
 
-        result = asyncio.get_event_loop().run_until_complete(
+        result = _run(
             call_tool("get_imaging_study_details", {"study_id": "nonexistent-study-xyz"})
         )
 
@@ -241,10 +253,9 @@ class TestGetRadiologyReportsE2E:
     def test_get_reports_by_patient(self):
         """Verify retrieval of radiology reports by patient ID."""
         # call_tool imported at module level
-        import asyncio
 
         # First find a patient with imaging
-        search_result = asyncio.get_event_loop().run_until_complete(
+        search_result = _run(
             call_tool("search_patients_with_imaging", {"limit": 1})
         )
         search_data = json.loads(search_result[0].text)
@@ -255,7 +266,7 @@ class TestGetRadiologyReportsE2E:
         patient_id = search_data["patients"][0]["id"]
 
         # Get reports for that patient
-        result = asyncio.get_event_loop().run_until_complete(
+        result = _run(
             call_tool("get_radiology_reports", {"patient_id": patient_id})
         )
 
@@ -268,9 +279,8 @@ class TestGetRadiologyReportsE2E:
     def test_get_reports_requires_patient_or_study(self):
         """Verify error when neither patient_id nor study_id provided."""
         # call_tool imported at module level
-        import asyncio
 
-        result = asyncio.get_event_loop().run_until_complete(
+        result = _run(
             call_tool("get_radiology_reports", {})
         )
 
@@ -280,10 +290,9 @@ class TestGetRadiologyReportsE2E:
     def test_get_reports_includes_full_text_when_requested(self):
         """Verify full report text is included when include_full_text=True."""
         # call_tool imported at module level
-        import asyncio
 
         # Find a patient
-        search_result = asyncio.get_event_loop().run_until_complete(
+        search_result = _run(
             call_tool("search_patients_with_imaging", {"limit": 5})
         )
         search_data = json.loads(search_result[0].text)
@@ -294,7 +303,7 @@ class TestGetRadiologyReportsE2E:
         # Try to find a patient with reports
         for patient in search_data.get("patients", []):
             patient_id = patient["id"]
-            result = asyncio.get_event_loop().run_until_complete(
+            result = _run(
                 call_tool("get_radiology_reports", {
                     "patient_id": patient_id,
                     "include_full_text": True
@@ -318,9 +327,8 @@ class TestSearchPatientsWithImagingE2E:
     def test_search_without_filters(self):
         """Verify basic search returns patients."""
         # call_tool imported at module level
-        import asyncio
 
-        result = asyncio.get_event_loop().run_until_complete(
+        result = _run(
             call_tool("search_patients_with_imaging", {"limit": 10})
         )
 
@@ -333,9 +341,8 @@ class TestSearchPatientsWithImagingE2E:
     def test_search_with_modality_filter(self):
         """Verify modality filter returns matching patients."""
         # call_tool imported at module level
-        import asyncio
 
-        result = asyncio.get_event_loop().run_until_complete(
+        result = _run(
             call_tool("search_patients_with_imaging", {
                 "modality": "CR",
                 "limit": 5
@@ -351,9 +358,8 @@ class TestSearchPatientsWithImagingE2E:
     def test_search_with_finding_text(self):
         """Verify finding_text filter searches report conclusions."""
         # call_tool imported at module level
-        import asyncio
 
-        result = asyncio.get_event_loop().run_until_complete(
+        result = _run(
             call_tool("search_patients_with_imaging", {
                 "finding_text": "pneumonia",
                 "limit": 5
@@ -369,9 +375,8 @@ class TestSearchPatientsWithImagingE2E:
     def test_search_respects_limit(self):
         """Verify limit parameter is respected."""
         # call_tool imported at module level
-        import asyncio
 
-        result = asyncio.get_event_loop().run_until_complete(
+        result = _run(
             call_tool("search_patients_with_imaging", {"limit": 3})
         )
 
@@ -386,7 +391,6 @@ class TestGetEncounterImagingE2E:
     def test_get_imaging_for_valid_encounter(self):
         """Verify retrieval of imaging for a valid encounter."""
         # call_tool imported at module level
-        import asyncio
         import requests
 
         # First, find an encounter from FHIR server
@@ -408,7 +412,7 @@ class TestGetEncounterImagingE2E:
             pytest.skip(f"Could not fetch encounters: {e}")
 
         # Get imaging for that encounter
-        result = asyncio.get_event_loop().run_until_complete(
+        result = _run(
             call_tool("get_encounter_imaging", {"encounter_id": encounter_id})
         )
 
@@ -420,9 +424,8 @@ class TestGetEncounterImagingE2E:
     def test_get_imaging_for_invalid_encounter(self):
         """Verify handling of invalid encounter ID."""
         # call_tool imported at module level
-        import asyncio
 
-        result = asyncio.get_event_loop().run_until_complete(
+        result = _run(
             call_tool("get_encounter_imaging", {"encounter_id": "nonexistent-enc-xyz"})
         )
 
@@ -437,7 +440,6 @@ class TestGetEncounterImagingE2E:
     def test_encounter_id_with_prefix(self):
         """Verify Encounter/ prefix is handled correctly."""
         # call_tool imported at module level
-        import asyncio
         import requests
 
         # Find an encounter
@@ -459,7 +461,7 @@ class TestGetEncounterImagingE2E:
             pytest.skip(f"Could not fetch encounters: {e}")
 
         # Call with Encounter/ prefix
-        result = asyncio.get_event_loop().run_until_complete(
+        result = _run(
             call_tool("get_encounter_imaging", {"encounter_id": f"Encounter/{encounter_id}"})
         )
 
@@ -475,10 +477,9 @@ class TestRadiologyToolIntegration:
     def test_patient_to_study_to_report_flow(self):
         """Verify complete flow: search patient -> get studies -> get reports."""
         # call_tool imported at module level
-        import asyncio
 
         # Step 1: Find patients with imaging
-        search_result = asyncio.get_event_loop().run_until_complete(
+        search_result = _run(
             call_tool("search_patients_with_imaging", {"limit": 5})
         )
         search_data = json.loads(search_result[0].text)
@@ -489,7 +490,7 @@ class TestRadiologyToolIntegration:
         patient_id = search_data["patients"][0]["id"]
 
         # Step 2: Get imaging studies for patient
-        studies_result = asyncio.get_event_loop().run_until_complete(
+        studies_result = _run(
             call_tool("get_patient_imaging_studies", {"patient_id": patient_id})
         )
         studies_data = json.loads(studies_result[0].text)
@@ -497,7 +498,7 @@ class TestRadiologyToolIntegration:
         assert studies_data["patient_id"] == patient_id
 
         # Step 3: Get reports for patient
-        reports_result = asyncio.get_event_loop().run_until_complete(
+        reports_result = _run(
             call_tool("get_radiology_reports", {"patient_id": patient_id})
         )
         reports_data = json.loads(reports_result[0].text)
@@ -508,29 +509,53 @@ class TestRadiologyToolIntegration:
     def test_query_catalog_lists_all_tools(self):
         """Verify query catalog includes all radiology tools."""
         # call_tool imported at module level
-        import asyncio
 
-        result = asyncio.get_event_loop().run_until_complete(
+        result = _run(
             call_tool("list_radiology_queries", {"category": "all"})
         )
 
         data = json.loads(result[0].text)
 
         # Flatten all queries
-        all_query_names = []
-        for category_queries in data.get("queries", {}).values():
-            if isinstance(category_queries, list):
-                all_query_names.extend([q["name"] for q in category_queries])
+        all_query_names = {
+            q["name"]
+            for category_queries in data.get("queries", {}).values()
+            if isinstance(category_queries, list)
+            for q in category_queries
+        }
 
         # Should include key radiology tools
-        expected_tools = [
-            "get_patient_imaging_studies",
-            "get_imaging_study_details",
-            "get_radiology_reports"
+        missing = CATALOG_TOOLS - all_query_names
+        assert not missing, f"Missing tools: {sorted(missing)}"
+
+    def test_read_only_tools_concurrently(self):
+        """Verify independent read-only tool calls succeed when run in parallel threads."""
+        # call_tool imported at module level
+
+        cases = [
+            ("list_radiology_queries", {"category": "all"},
+             lambda data: data["total_queries"] > 0),
+            ("search_patients_with_imaging", {"limit": 3},
+             lambda data: len(data.get("patients", [])) <= 3),
+            ("search_patients_with_imaging", {"modality": "CR", "limit": 5},
+             lambda data: data["modality"] == "CR"),
+            ("get_encounter_imaging", {"encounter_id": "nonexistent-enc-xyz"},
+             lambda data: "encounter" in data or "imaging_studies" in data),
         ]
 
-        for tool in expected_tools:
-            assert tool in all_query_names, f"Missing tool: {tool}"
+        # call_tool blocks on IRIS, so gathering the coroutines on one loop would run them
+        # one after another; give each call its own thread and event loop instead
+        async def run_all():
+            return await asyncio.gather(
+                *(asyncio.to_thread(asyncio.run, call_tool(name, kwargs)) for name, kwargs, _ in cases),
+                return_exceptions=True
+            )
+
+        results = _run(run_all())
+
+        for (name, kwargs, check), result in zip(cases, results):
+            assert not isinstance(result, Exception), f"{name}({kwargs}) raised {result!r}"
+            assert check(json.loads(result[0].text)), f"{name}({kwargs}) failed its check"
 
 
 # Mark for pytest collection
@@ -28,7 +28,9 @@ from pathlib import Path
 from typing import Dict, Any
 
 # Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+src_dir = str(Path(__file__).parent.parent.parent / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
 
 from src.query.rag_pipeline import RAGPipeline
 
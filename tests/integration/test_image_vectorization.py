@@ -28,7 +28,9 @@ from typing import List, Dict, Any
 from unittest.mock import Mock, patch, MagicMock
 
 # Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+src_dir = str(Path(__file__).parent.parent.parent / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
 
 from vectorization.image_vectorizer import (
     ImageMetadata,
@@ -27,7 +27,9 @@ from typing import List, Dict, Any
 import sys
 
 # Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+src_dir = str(Path(__file__).parent.parent.parent / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
 
 from src.vectorization.embedding_client import NVIDIAEmbeddingsClient
 from src.vectorization.vector_db_client import IRISVectorDBClient
@@ -25,7 +25,7 @@ with patch('mcp.server.Server', return_value=mock_server):
 
 @pytest.mark.asyncio
 @patch('fhir_graphrag_mcp_server.FHIRSearchService')
-@patch('fhir_graphrag_mcp_server.get_connection')
+@patch('fhir_graphrag_mcp_server.get_pooled_connection')
 async def test_search_fhir_documents_wrapper(mock_conn, mock_service_class):
     """Verify search_fhir_documents tool calls the search service."""
     # Setup mocks
@@ -50,7 +50,7 @@ async def test_search_fhir_documents_wrapper(mock_conn, mock_service_class):
 
 @pytest.mark.asyncio
 @patch('fhir_graphrag_mcp_server.KGSearchService')
-@patch('fhir_graphrag_mcp_server.get_connection')
+@patch('fhir_graphrag_mcp_server.get_pooled_connection')
 async def test_search_knowledge_graph_wrapper(mock_conn, mock_service_class):
     """Verify search_knowledge_graph tool calls the KG service."""
     # Setup mocks
@@ -44,15 +44,16 @@ def test_rrf_fusion_logic(mock_search_services):
     # Verify top results
     top_docs = results["top_documents"]
     assert len(top_docs) > 0
+    docs_by_id = {d["fhir_id"]: d for d in top_docs}
     
     # Document 2 should be boosted because it's in both FHIR and KG
     # RRF score for Doc 2: 1/(60+2) [FHIR rank 2] + 1/(60+1) [KG rank 1]
-    doc2 = next(d for d in top_docs if d["fhir_id"] == "2")
+    doc2 = docs_by_id["2"]
     assert "fhir" in doc2["sources"]
     assert "kg" in doc2["sources"]
     
     # Document 1 only in FHIR
-    doc1 = next(d for d in top_docs if d["fhir_id"] == "1")
+    doc1 = docs_by_id["1"]
     assert "fhir" in doc1["sources"]
     assert "kg" not in doc1["sources"]
 
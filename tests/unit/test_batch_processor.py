@@ -21,7 +21,9 @@ from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch, call
 
 # Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+src_dir = str(Path(__file__).parent.parent.parent / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
 
 from vectorization.batch_processor import BatchProcessor
 
@@ -0,0 +1,98 @@
+"""
+Unit Tests for ConnectionPool
+
+Tests connection reuse, the size limit, and recycling of broken
+connections with mocked IRIS connections.
+
+Usage:
+    pytest tests/unit/test_connection_pool.py -v
+
+Dependencies:
+    pytest, unittest.mock
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.db.connection import ConnectionPool
+
+
+class TestConnectionPool:
+    """Test suite for ConnectionPool class."""
+
+    @pytest.fixture
+    def mock_connect(self):
+        """Hand out a fresh mock connection per connect."""
+        with patch('src.db.connection.get_connection', side_effect=lambda: MagicMock()) as mock:
+            yield mock
+
+    def test_close_returns_connection_for_reuse(self, mock_connect):
+        """A closed pooled connection is rolled back and handed out again."""
+        pool = ConnectionPool(size=2)
+
+        first = pool.get()
+        raw = first._conn
+        first.close()
+        second = pool.get()
+
+        assert second._conn is raw
+        assert mock_connect.call_count == 1
+        raw.rollback.assert_called_once()
+        raw.close.assert_not_called()
+
+    def test_close_is_idempotent(self, mock_connect):
+        """Closing twice releases the slot only once."""
+        pool = ConnectionPool(size=1)
+
+        conn = pool.get()
+        conn.close()
+        conn.close()
+
+        pool.get()
+        with pytest.raises(TimeoutError):
+            pool.get(timeout=0.01)
+
+    def test_size_limit(self, mock_connect):
+        """get() times out while every connection is borrowed."""
+        pool = ConnectionPool(size=1)
+
+        pool.get()
+
+        with pytest.raises(TimeoutError):
+            pool.get(timeout=0.01)
+
+    def test_broken_connection_discarded(self, mock_connect):
+        """A connection that can't roll back is closed rather than reused."""
+        pool = ConnectionPool(size=1)
+
+        conn = pool.get()
+        raw = conn._conn
+        raw.rollback.side_effect = Exception("connection lost")
+        conn.close()
+
+        assert pool.get()._conn is not raw
+        raw.close.assert_called_once()
+
+    def test_stale_connection_recycled(self, mock_connect):
+        """Idle connections older than recycle seconds are reopened."""
+        pool = ConnectionPool(size=1, recycle=-1)
+
+        conn = pool.get()
+        raw = conn._conn
+        conn.close()
+
+        assert pool.get()._conn is not raw
+        raw.close.assert_called_once()
+        assert mock_connect.call_count == 2
+
+    def test_proxies_connection_methods(self, mock_connect):
+        """Pooled connections pass DBAPI calls through and refuse use after close."""
+        pool = ConnectionPool(size=1)
+
+        conn = pool.get()
+        conn.cursor()
+        conn._conn.cursor.assert_called_once()
+
+        conn.close()
+        with pytest.raises(ConnectionError):
+            conn.cursor()
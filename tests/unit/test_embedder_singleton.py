@@ -0,0 +1,59 @@
+"""
+Unit Tests for the NV-CLIP embedder singleton
+
+Tests that initialization runs once under concurrent first calls and that a
+failed initialization is not retried.
+
+Usage:
+    pytest tests/unit/test_embedder_singleton.py -v
+
+Dependencies:
+    pytest, unittest.mock
+"""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import patch
+
+from src.embeddings import embedder_singleton
+
+
+class TestGetEmbedder:
+    """Test suite for get_embedder."""
+
+    @pytest.fixture(autouse=True)
+    def reset_singleton(self):
+        """Start each test without a cached embedder."""
+        embedder_singleton._embedder = None
+        yield
+        embedder_singleton._embedder = None
+
+    def test_concurrent_first_calls_initialize_once(self):
+        """Threads racing on the first call all get the same instance."""
+        sentinel = object()
+
+        def slow_init():
+            time.sleep(0.05)
+            return sentinel
+
+        with patch.object(embedder_singleton, '_init', side_effect=slow_init) as mock_init:
+            results = []
+            threads = [threading.Thread(target=lambda: results.append(embedder_singleton.get_embedder()))
+                       for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert mock_init.call_count == 1
+        assert results == [sentinel] * 8
+
+    def test_failed_initialization_not_retried(self):
+        """After a failure get_embedder returns None without re-initializing."""
+        with patch.object(embedder_singleton, '_init', return_value=embedder_singleton._FAILED) as mock_init:
+            assert embedder_singleton.get_embedder() is None
+            assert embedder_singleton.get_embedder() is None
+
+        assert mock_init.call_count == 1
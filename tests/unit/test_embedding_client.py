@@ -20,7 +20,9 @@ from unittest.mock import Mock, MagicMock, patch, call
 import os
 
 # Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+src_dir = str(Path(__file__).parent.parent.parent / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
 
 from vectorization.embedding_client import NVIDIAEmbeddingsClient, RateLimitError
 
@@ -0,0 +1,58 @@
+"""
+Unit Tests for the Tutorial app's SessionStore
+
+Tests that a session's expiry timer restarts on every access, so only idle
+sessions expire, with a fake clock instead of real waiting.
+
+Usage:
+    pytest tests/unit/test_session_store.py -v
+
+Dependencies:
+    pytest, cachetools
+"""
+
+import os
+import sys
+
+app_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../Tutorial/App'))
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+from session_store import SessionStore
+
+
+class FakeClock:
+    """Manually advanced replacement for time.monotonic."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestSessionStore:
+    """Test suite for SessionStore."""
+
+    def test_access_before_ttl_keeps_session_alive(self):
+        """Reading an entry just before the TTL restarts its timer."""
+        clock = FakeClock()
+        store = SessionStore(object, ttl=100, timer=clock)
+
+        first = store.get("sid")
+        clock.now = 99
+        assert store.get("sid") is first
+
+        # 198s after creation, but only 99s after the last access
+        clock.now = 198
+        assert store.get("sid") is first
+
+    def test_idle_session_expires(self):
+        """An entry untouched for the full TTL is replaced with a fresh one."""
+        clock = FakeClock()
+        store = SessionStore(object, ttl=100, timer=clock)
+
+        first = store.get("sid")
+        clock.now = 100
+
+        assert store.get("sid") is not first
@@ -19,7 +19,9 @@ from unittest.mock import Mock, MagicMock, patch, call
 from typing import List
 
 # Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+src_dir = str(Path(__file__).parent.parent.parent / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
 
 from src.vectorization.vector_db_client import IRISVectorDBClient
 
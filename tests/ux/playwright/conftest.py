@@ -1,10 +1,70 @@
 import os
+import subprocess
+import sys
+import time
+import urllib.request
 import pytest
 import logging
 
+from tests.ux.utils.streamlit_helper import wait_for_streamlit
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Cookies/local storage captured after the first login and loaded into every new context
+AUTH_STATE_PATH = os.path.join(os.path.dirname(__file__), ".pw-auth.json")
+
+# App server started by --start-app when no TARGET_URL is given
+MCP_SERVER_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../mcp-server"))
+LOCAL_APP_PORT = 8599
+
+def pytest_addoption(parser):
+    parser.addoption("--fresh-auth", action="store_true", default=False,
+                     help="Discard the saved login state and log in again")
+    parser.addoption("--start-app", action="store_true", default=False,
+                     help="Start one local Streamlit server for the whole run when TARGET_URL is unset")
+
+def _wait_for_http(url, timeout=60):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with urllib.request.urlopen(url, timeout=2):
+                return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.5)
+
+def pytest_configure(config):
+    # Runs in the xdist controller before workers spawn; they inherit TARGET_URL
+    # and reuse this one server instead of each booting their own
+    if hasattr(config, "workerinput"):
+        return
+    # Drop the old login once, here, so no worker can delete a file another just wrote
+    if config.getoption("--fresh-auth") and os.path.exists(AUTH_STATE_PATH):
+        os.remove(AUTH_STATE_PATH)
+    if os.getenv("TARGET_URL") or not config.getoption("--start-app"):
+        return
+    url = f"http://localhost:{LOCAL_APP_PORT}"
+    config._streamlit_proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", "streamlit_app.py",
+         "--server.port", str(LOCAL_APP_PORT), "--server.headless", "true",
+         "--server.runOnSave", "false", "--client.showErrorDetails", "false"],
+        cwd=MCP_SERVER_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        _wait_for_http(f"{url}/_stcore/health")
+    except OSError:
+        config._streamlit_proc.terminate()
+        raise
+    os.environ["TARGET_URL"] = url
+
+def pytest_unconfigure(config):
+    proc = getattr(config, "_streamlit_proc", None)
+    if proc is not None:
+        proc.terminate()
+        proc.wait(timeout=10)
+
 @pytest.fixture(scope="session", autouse=True)
 def validate_environment():
     target_url = os.getenv("TARGET_URL")
@@ -17,19 +77,99 @@ def validate_environment():
 def target_url():
     return os.getenv("TARGET_URL")
 
+@pytest.fixture(scope="session")
+def browser_type_launch_args(browser_type_launch_args):
+    # Always headless, even if --headed is passed, so CI workers never open windows.
+    # Container-friendly flags: /dev/shm is tiny in Docker, there is no GPU, and
+    # background tabs (parallel workers) shouldn't be throttled
+    return {
+        **browser_type_launch_args,
+        "headless": True,
+        "args": [
+            *browser_type_launch_args.get("args", []),
+            "--disable-dev-shm-usage",
+            "--no-sandbox",
+            "--disable-gpu",
+            "--disable-background-timer-throttling",
+            "--disable-renderer-backgrounding",
+        ],
+    }
+
+@pytest.fixture(scope="session")
+def auth_state(browser, target_url):
+    if not os.path.exists(AUTH_STATE_PATH):
+        context = browser.new_context()
+        page = context.new_page()
+        login(page, target_url)
+        wait_for_streamlit(page)
+        # Several workers may log in at once; each writes its own file and renames it
+        # into place, so nobody ever loads a half-written state file
+        tmp_path = f"{AUTH_STATE_PATH}.{os.getpid()}.tmp"
+        context.storage_state(path=tmp_path)
+        context.close()
+        os.replace(tmp_path, AUTH_STATE_PATH)
+    return AUTH_STATE_PATH
+
+@pytest.fixture(scope="session")
+def browser_context_args(browser_context_args, auth_state):
+    return {
+        **browser_context_args,
+        "viewport": {"width": 1280, "height": 1024},
+        "storage_state": auth_state,
+    }
+
 def pytest_html_report_title(report):
     report.title = "Medical GraphRAG Assistant UX Verification"
 
-@pytest.fixture(scope="function", autouse=True)
-def handle_login(page, target_url):
-    page.set_viewport_size({"width": 1280, "height": 1024})
-    
-    test_password = os.getenv("TEST_PASSWORD")
+def login(page, target_url):
     page.goto(target_url)
-    
+
+    test_password = os.getenv("TEST_PASSWORD")
     if test_password:
         password_input = page.locator('input[type="password"]')
         if password_input.is_visible(timeout=5000):
             password_input.fill(test_password)
             password_input.press("Enter")
             page.wait_for_load_state("networkidle")
+
+@pytest.fixture(scope="function", autouse=True)
+def handle_login(request, target_url):
+    # Tests on the shared app_page logged in once when the module's page was opened
+    if "page" in request.fixturenames:
+        login(request.getfixturevalue("page"), target_url)
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    # Expose each phase's report to fixtures, so app_page can tell whether its test failed
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+
+@pytest.fixture(scope="module")
+def app_session_page(browser, browser_context_args, target_url):
+    """One logged-in page per test module, so Streamlit boots once instead of per test."""
+    context = browser.new_context(**browser_context_args)
+    context.tracing.start(screenshots=True, snapshots=True)
+    page = context.new_page()
+    login(page, target_url)
+    wait_for_streamlit(page)
+    yield page
+    context.tracing.stop()
+    context.close()
+
+@pytest.fixture
+def app_page(request, app_session_page):
+    """The module's shared page with the previous test's chat cleared."""
+    tracing = app_session_page.context.tracing
+    tracing.start_chunk()
+    app_session_page.get_by_role("button", name="🗑️ Clear").click()
+    wait_for_streamlit(app_session_page)
+    yield app_session_page
+
+    # Only failing tests write their trace; passing chunks are discarded
+    report = getattr(request.node, "rep_call", None)
+    if report is not None and report.failed:
+        output_dir = request.config.getoption("--output")
+        tracing.stop_chunk(path=os.path.join(output_dir, f"{request.node.name}-trace.zip"))
+    else:
+        tracing.stop_chunk()
@@ -1,11 +1,43 @@
+from playwright.sync_api import Locator, Page
+
 class StreamlitLocators:
-    CHAT_INPUT = '[data-testid="stChatInput"] textarea'
-    CHAT_MESSAGE = '[data-testid="stChatMessage"]'
-    ASSISTANT_MESSAGE = '[data-testid="stChatMessage"]:has([data-testid="stChatMessageAvatarAssistant"])'
-    USER_MESSAGE = '[data-testid="stChatMessage"]:has([data-testid="stChatMessageAvatarUser"])'
-    SIDEBAR = '[data-testid="stSidebar"]'
-    STATUS_WIDGET = '[data-testid="stStatusWidget"]'
-    EXPANDER = '[data-testid="stExpander"]'
-    PLOTLY_CHART = '.js-plotly-plot'
-    AGRAPH = '[data-testid="agraph"]'
-    MEMORY_EDITOR = '[data-testid="stSidebar"] >> text="Memory Editor"'
+    @staticmethod
+    def chat_input(page: Page) -> Locator:
+        return page.get_by_test_id("stChatInput").locator("textarea")
+
+    @staticmethod
+    def chat_message(page: Page) -> Locator:
+        return page.get_by_test_id("stChatMessage")
+
+    @staticmethod
+    def assistant_message(page: Page) -> Locator:
+        return page.get_by_test_id("stChatMessage").filter(has=page.get_by_test_id("stChatMessageAvatarAssistant"))
+
+    @staticmethod
+    def user_message(page: Page) -> Locator:
+        return page.get_by_test_id("stChatMessage").filter(has=page.get_by_test_id("stChatMessageAvatarUser"))
+
+    @staticmethod
+    def sidebar(page: Page) -> Locator:
+        return page.get_by_test_id("stSidebar")
+
+    @staticmethod
+    def status_widget(page: Page) -> Locator:
+        return page.get_by_test_id("stStatusWidget")
+
+    @staticmethod
+    def expander(page: Page) -> Locator:
+        return page.get_by_test_id("stExpander")
+
+    @staticmethod
+    def plotly_chart(page: Page) -> Locator:
+        # Plotly charts carry no data-testid of their own
+        return page.locator('.js-plotly-plot')
+
+    @staticmethod
+    def agraph(page: Page) -> Locator:
+        return page.get_by_test_id("agraph")
+
+    @staticmethod
+    def memory_editor(page: Page) -> Locator:
+        return page.get_by_test_id("stSidebar").get_by_text("Memory Editor", exact=True)
@@ -3,35 +3,31 @@ from playwright.sync_api import expect
 from tests.ux.playwright.locators import StreamlitLocators
 from tests.ux.utils.streamlit_helper import wait_for_streamlit
 
-def test_plotly_rendering(page, target_url):
-    page.goto(target_url)
-    wait_for_streamlit(page)
-    
+pytestmark = pytest.mark.playwright
+
+def test_plotly_rendering(app_page):
     query = "Plot entity type distribution"
-    chat_input = page.locator(StreamlitLocators.CHAT_INPUT)
+    chat_input = StreamlitLocators.chat_input(app_page)
     chat_input.fill(query)
     chat_input.press("Enter")
     
-    wait_for_streamlit(page, timeout=90000)
+    wait_for_streamlit(app_page, timeout=90000)
     
-    plotly_chart = page.locator(StreamlitLocators.PLOTLY_CHART)
+    plotly_chart = StreamlitLocators.plotly_chart(app_page)
     expect(plotly_chart).to_be_visible(timeout=90000)
     
     plotly_chart.hover()
     expect(plotly_chart.locator('.hoverlayer')).to_be_visible(timeout=5000)
 
-def test_knowledge_graph_rendering(page, target_url):
-    page.goto(target_url)
-    wait_for_streamlit(page)
-    
+def test_knowledge_graph_rendering(app_page):
     query = "Visualize the knowledge graph for diabetes"
-    chat_input = page.locator(StreamlitLocators.CHAT_INPUT)
+    chat_input = StreamlitLocators.chat_input(app_page)
     chat_input.fill(query)
     chat_input.press("Enter")
     
-    wait_for_streamlit(page)
+    wait_for_streamlit(app_page)
     
-    agraph = page.locator(StreamlitLocators.AGRAPH)
+    agraph = StreamlitLocators.agraph(app_page)
     expect(agraph).to_be_visible(timeout=60000)
     
     canvas = agraph.locator('canvas')
@@ -1,8 +1,26 @@
-from playwright.sync_api import Page
+from playwright.sync_api import Locator, Page, expect
 
 def wait_for_streamlit(page: Page, timeout: int = 30000):
-    status_widget = page.locator('[data-testid="stStatusWidget"]')
+    # Before the first render there is no status widget, so "hidden" alone would
+    # pass immediately; wait for the app container to render first
+    page.get_by_test_id("stAppViewContainer").wait_for(state="visible", timeout=timeout)
+    status_widget = page.get_by_test_id("stStatusWidget")
     status_widget.wait_for(state="hidden", timeout=timeout)
 
 def get_chat_messages(page: Page):
-    return page.locator('[data-testid="stChatMessage"]')
+    return page.get_by_test_id("stChatMessage")
+
+def execution_details(page: Page) -> Locator:
+    """Locator for the Execution Details expander; build it once and reuse it."""
+    return page.get_by_test_id("stExpander").filter(has_text="Execution Details")
+
+def assert_tools_succeeded(page: Page, timeout: int = 10000) -> Locator:
+    """Open the last answer's Execution Details and check every tool call shows ✅."""
+    expander = execution_details(page)
+    expect(expander).to_be_visible(timeout=60000)
+    expander.locator("summary").first.click()
+
+    # Streamlit renders ❌ for failed tool executions in our custom UI
+    expect(expander).to_contain_text("✅", timeout=timeout)
+    expect(expander).not_to_contain_text("❌", timeout=timeout)
+    return expander